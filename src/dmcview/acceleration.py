@@ -1,36 +1,49 @@
-from decimal import ROUND_HALF_UP, Decimal
+import time
+from typing import Optional
 
 import numpy as np
 from matplotlib.backends.backend_qtagg import FigureCanvasQTAgg as FigureCanvas
 from matplotlib.figure import Figure
 from PySide6.QtCore import QTimer
 
-from dmcview.accele_signal_manger import signal_manager
+from dmcview.acceleration_view import (
+    ARROW_LENGTH_RATIO,
+    AccelerationStepper,
+    arrow_segments,
+)
+from dmcview.telemetry import TelemetryBus, default_bus
 
 
-class Accelaration3D(FigureCanvas):
+class Accelaration3D(AccelerationStepper, FigureCanvas):
     """
     This class displays a 3D window.
 
     It depends on the acceleration value provided by the user in (x, y, z), and it uses the add_subplot()
     method to represent the entire canvas for the plot.
+    The animated acceleration is published on the telemetry bus acceleration channel.
 
+    The arrow is one persistent artist whose geometry is updated in place. With blitting the static
+    axes, grid and title are rendered once per full draw (for example on resize) and cached; each
+    frame then restores that background and redraws only the arrow.
 
-    """
-    def __init__(self, figure: Figure = None) -> None:
-        super().__init__(figure)
+    Args:
+        blit (bool): redraw only the arrow on each frame, otherwise the whole figure is drawn.
 
-        self.target_x = 0.0
-        self.target_y = 0.0
-        self.target_z = 0.0
 
-        self.x = 0.0
-        self.y = 0.0
-        self.z = 0.0
+    """
+    def __init__(
+        self, figure: Figure = None, bus: Optional[TelemetryBus] = None, blit: bool = True
+    ) -> None:
+        super().__init__(figure)
+        self.bus = bus if bus is not None else default_bus()
+        self.blit_enabled = blit
+        self.background = None  # the figure without the arrow, cached on every full draw
+        self.drawn_vector: Optional[tuple[float, float, float]] = None
 
-        self.value = 0.2  # 0.1 step is very slow
+        self.reset_acceleration()
 
         self.figure = Figure()
+        self.figure.set_canvas(self)
         self.ax = self.figure.add_subplot(projection="3d")
 
         self.ax.set_xlim([-15, 15])
@@ -39,85 +52,51 @@ class Accelaration3D(FigureCanvas):
         self.ax.set_title("3D Acceleration")
 
         self.quiver = self.ax.quiver(
-            0, 0, 0, 0, 0, 0, color="red", linewidth=2, arrow_length_ratio=0.3
+            0, 0, 0, 0, 0, 0, color="red", linewidth=2, arrow_length_ratio=ARROW_LENGTH_RATIO
         ) #this is for the arrow
+        self.quiver.set_animated(blit)  # excluded from the full draws so the cache has no arrow
 
         self.ax.view_init(azim=-115, elev=20, roll=3)
+        self.mpl_connect("draw_event", self.__cache_background)
         self.start_acceleration_timer()
 
+    def __cache_background(self, _: object) -> None:
+        """ Keep the freshly drawn static figure and put the arrow back on it. """
+        if not self.blit_enabled:
+            return
+        self.background = self.copy_from_bbox(self.figure.bbox)
+        self.__draw_arrow()
+
+    def __draw_arrow(self) -> None:
+        self.quiver.do_3d_projection()
+        self.ax.draw_artist(self.quiver)
+
     def update_acceleration_vector(self) -> None:
         """
         Draws the arrow that represents the acceleration value provided by the user.
 
-        This method uses Decimal to round the floating-point number.
+        The arrow moves one step towards the requested acceleration on each call.
 
 
         """
 
-        if self.target_x < self.x:
-            self.target_x += self.value
-        elif self.target_x > self.x:
-            self.target_x -= self.value
-
-        if self.target_y < self.y:
-            self.target_y += self.value
-        elif self.target_y > self.y:
-            self.target_y -= self.value
-
-        if self.target_z < self.z:
-            self.target_z += self.value
-        elif self.target_z > self.z:
-            self.target_z -= self.value
-
-        self.target_y = float(
-            Decimal(self.target_y).quantize(Decimal("0.1"), rounding=ROUND_HALF_UP)
-        )
-        self.target_x = float(
-            Decimal(self.target_x).quantize(Decimal("0.1"), rounding=ROUND_HALF_UP)
-        )
-        self.target_z = float(
-            Decimal(self.target_z).quantize(Decimal("0.1"), rounding=ROUND_HALF_UP)
-        )
-
-        signal_manager.data_signal.emit(self.target_x, self.target_y, self.target_z)
-
-        accel = np.array([self.target_x, self.target_y, self.target_z])
-        origin = np.array([0, 0, 0])
-
-        self.quiver.remove()
-        self.quiver = self.ax.quiver(
-            *origin, *accel, color="Red", linewidth=2, arrow_length_ratio=0.3
-        )
-        self.draw()
+        vector = self.step_acceleration()
+        if vector == self.drawn_vector:
+            return  # the arrow did not move
+        self.drawn_vector = vector
+
+        start = time.perf_counter()
+        self.quiver.set_segments(arrow_segments(np.array(vector)))
+        if self.blit_enabled and self.background is not None:
+            self.restore_region(self.background)
+            self.__draw_arrow()
+            self.blit(self.figure.bbox)
+        else:
+            self.draw()
+        if self.perf is not None:
+            self.perf.record_acceleration_draw(time.perf_counter() - start)
 
     def start_acceleration_timer(self) -> None:
         self.acceleration_timer = QTimer(self)
         self.acceleration_timer.timeout.connect(self.update_acceleration_vector)
         self.acceleration_timer.start(60)
-
-    def update_acceleration(self, x: float, y: float, z: float) -> None:
-        self.y = round(y, 1)
-        self.x = round(x, 1)
-        self.z = round(z, 1)
-
-        last_x_digit = self.x * 10
-        last_x_digit = last_x_digit % 10
-
-        if last_x_digit % 2 != 0:
-            self.x -= 0.1  # since the step is 0.2 we will make odd inputs into even.
-
-        last_y_digit = self.y * 10
-        last_y_digit = last_y_digit % 10
-
-        if last_y_digit % 2 != 0:
-            self.y -= 0.1  # since the step is 0.2 we will make odd inputs into even.
-
-        last_z_digit = self.z * 10
-        last_z_digit = last_z_digit % 10
-
-        if last_z_digit % 2 != 0:
-            self.z -= 0.1  # since the step is 0.2 we will make odd inputs into even.
-
-        self.y = round(self.y, 1)
-        self.x = round(self.x, 1)
-        self.z = round(self.z, 1)
@@ -0,0 +1,213 @@
+import math
+import time
+from typing import Optional
+
+import numpy as np
+from PySide6.QtCore import QEvent, QPointF, QRectF, Qt, QTimer
+from PySide6.QtGui import (
+    QColor,
+    QFont,
+    QPainter,
+    QPen,
+    QPixmap,
+    QPolygonF,
+    QResizeEvent,
+)
+from PySide6.QtWidgets import QWidget
+
+from dmcview.acceleration_view import AccelerationStepper, arrow_segments
+from dmcview.telemetry import TelemetryBus, default_bus
+
+LIMIT = 15.0
+TICKS = (-15, -10, -5, 0, 5, 10, 15)
+
+PANE_COLOR = QColor(242, 242, 242)
+PANE_EDGE_COLOR = QColor(215, 215, 215)
+GRID_COLOR = QColor(176, 176, 176)
+
+
+def view_axes(azim: float, elev: float, roll: float) -> np.ndarray:
+    """
+    The camera axes of a view given like ``Axes3D.view_init``.
+
+    Return:
+        np.ndarray: 3x3 matrix whose rows are the screen right, screen up and towards the eye
+        directions in data coordinates.
+    """
+    azim, elev, roll = math.radians(azim), math.radians(elev), math.radians(roll)
+    eye = np.array([math.cos(elev) * math.cos(azim), math.cos(elev) * math.sin(azim), math.sin(elev)])
+    right = np.array([-math.sin(azim), math.cos(azim), 0.0])
+    up = np.cross(eye, right)
+
+    rolled_right = math.cos(roll) * right - math.sin(roll) * up
+    rolled_up = math.sin(roll) * right + math.cos(roll) * up
+    return np.array([rolled_right, rolled_up, eye])
+
+
+class PainterAcceleration3D(AccelerationStepper, QWidget):
+    """
+    Lightweight 3D acceleration view painted with QPainter, without matplotlib.
+
+    It projects the axes box and the acceleration arrow itself, orthographic by default or with
+    perspective. The box, panes, grid, ticks and title are painted once per size into a pixmap;
+    a frame blits that pixmap and draws the three lines of the arrow.
+
+    Args:
+        bus (TelemetryBus): the bus the animated acceleration is published on.
+        perspective (bool): use a perspective projection instead of an orthographic one.
+        azim, elev, roll (float): the view angles in degrees, the same as ``Axes3D.view_init``.
+
+    """
+    def __init__(
+        self,
+        bus: Optional[TelemetryBus] = None,
+        perspective: bool = False,
+        azim: float = -115.0,
+        elev: float = 20.0,
+        roll: float = 3.0,
+    ) -> None:
+        super().__init__()
+        self.bus = bus if bus is not None else default_bus()
+        self.reset_acceleration()
+
+        self.view = view_axes(azim, elev, roll)
+        self.perspective = perspective
+        self.camera_distance = 6 * LIMIT
+
+        self.scale = 1.0
+        self.origin = np.zeros(2)
+        self.background: Optional[QPixmap] = None
+        self.drawn_vector: Optional[tuple[float, float, float]] = None
+
+        self.setMinimumSize(200, 200)
+        self.start_acceleration_timer()
+
+    def project(self, points: np.ndarray) -> np.ndarray:
+        """
+        Project data points to widget coordinates.
+
+        Args:
+            points (np.ndarray): (N, 3) data coordinates.
+
+        Return:
+            np.ndarray: (N, 2) widget coordinates.
+        """
+        camera = np.asarray(points, dtype=float) @ self.view.T
+        xy = camera[:, :2]
+        if self.perspective:
+            xy = xy * (self.camera_distance / (self.camera_distance - camera[:, 2]))[:, None]
+        return xy * np.array([self.scale, -self.scale]) + self.origin
+
+    def resizeEvent(self, event: QResizeEvent) -> None:  # pylint: disable=invalid-name
+        self.__layout()
+        self.background = None
+        super().resizeEvent(event)
+
+    def __layout(self) -> None:
+        """ Fit the projected box in the widget below the title. """
+        corners = np.array(
+            [[x, y, z] for x in (-LIMIT, LIMIT) for y in (-LIMIT, LIMIT) for z in (-LIMIT, LIMIT)]
+        )
+        self.scale, self.origin = 1.0, np.zeros(2)
+        projected = self.project(corners)
+        low, high = projected.min(axis=0), projected.max(axis=0)
+
+        title_height = 30
+        margin = 30
+        width = max(1.0, self.width() - 2 * margin)
+        height = max(1.0, self.height() - 2 * margin - title_height)
+        self.scale = min(width / (high[0] - low[0]), height / (high[1] - low[1]))
+
+        center = (low + high) / 2 * self.scale
+        self.origin = np.array(
+            [self.width() / 2 - center[0], title_height + margin + height / 2 - center[1]]
+        )
+
+    def __polygon(self, points: np.ndarray) -> QPolygonF:
+        return QPolygonF([QPointF(x, y) for x, y in self.project(points)])
+
+    def __render_background(self) -> QPixmap:
+        """ Paint the static part: title, back panes with their grid, box edges and tick labels. """
+        ratio = self.devicePixelRatioF()
+        pixmap = QPixmap(self.size() * ratio)
+        pixmap.setDevicePixelRatio(ratio)
+        pixmap.fill(Qt.GlobalColor.white)
+
+        painter = QPainter(pixmap)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+
+        painter.setPen(QPen(Qt.GlobalColor.black))
+        painter.setFont(QFont("Arial", 12))
+        painter.drawText(QRectF(0, 5, self.width(), 25), Qt.AlignmentFlag.AlignCenter, "3D Acceleration")
+
+        eye = self.view[2]
+        back = [-LIMIT if eye[axis] >= 0 else LIMIT for axis in range(3)]
+        front = [-value for value in back]
+
+        for axis in range(3):
+            first, second = [other for other in range(3) if other != axis]
+            square = np.zeros((4, 3))
+            square[:, axis] = back[axis]
+            square[:, first] = [-LIMIT, LIMIT, LIMIT, -LIMIT]
+            square[:, second] = [-LIMIT, -LIMIT, LIMIT, LIMIT]
+
+            painter.setPen(QPen(PANE_EDGE_COLOR, 1))
+            painter.setBrush(PANE_COLOR)
+            painter.drawPolygon(self.__polygon(square))
+
+            painter.setPen(QPen(GRID_COLOR, 0.8))
+            for tick in TICKS:
+                for along, across in ((first, second), (second, first)):
+                    line = np.zeros((2, 3))
+                    line[:, axis] = back[axis]
+                    line[:, along] = tick
+                    line[:, across] = [-LIMIT, LIMIT]
+                    start, end = self.project(line)
+                    painter.drawLine(QPointF(*start), QPointF(*end))
+
+        painter.setFont(QFont("Arial", 8))
+        painter.setPen(QPen(Qt.GlobalColor.black))
+        box_center = self.project(np.zeros((1, 3)))[0]
+        for axis, edge in enumerate(([0, front[1], back[2]], [front[0], 0, back[2]], [front[0], back[1], 0])):
+            for tick in TICKS:
+                edge[axis] = tick
+                point = self.project(np.array([edge]))[0]
+                outward = point - box_center
+                outward = outward / (np.hypot(*outward) or 1.0) * 14
+                rect = QRectF(point[0] + outward[0] - 15, point[1] + outward[1] - 8, 30, 16)
+                painter.drawText(rect, Qt.AlignmentFlag.AlignCenter, str(tick))
+
+        painter.end()
+        return pixmap
+
+    def paintEvent(self, _: QEvent) -> None:  # pylint: disable=invalid-name
+        started = time.perf_counter()
+        if self.background is None:
+            self.__layout()
+            self.background = self.__render_background()
+
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.drawPixmap(0, 0, self.background)
+
+        vector = np.array([self.target_x, self.target_y, self.target_z])
+        if vector.any():
+            painter.setPen(QPen(Qt.GlobalColor.red, 2))
+            for start, end in self.project(arrow_segments(vector).reshape(-1, 3)).reshape(-1, 2, 2):
+                painter.drawLine(QPointF(*start), QPointF(*end))
+        painter.end()
+
+        if self.perf is not None:
+            self.perf.record_acceleration_draw(time.perf_counter() - started)
+
+    def update_acceleration_vector(self) -> None:
+        """ Move the arrow one step towards the requested acceleration and repaint if it moved. """
+        vector = self.step_acceleration()
+        if vector != self.drawn_vector:
+            self.drawn_vector = vector
+            self.update()
+
+    def start_acceleration_timer(self) -> None:
+        self.acceleration_timer = QTimer(self)
+        self.acceleration_timer.timeout.connect(self.update_acceleration_vector)
+        self.acceleration_timer.start(60)
@@ -0,0 +1,180 @@
+"""The acceleration views: the animation they share and the factory of the selected renderer"""
+
+from decimal import ROUND_HALF_UP, Decimal
+from typing import TYPE_CHECKING, Optional, Union
+
+import numpy as np
+from PySide6.QtCore import QTimer
+
+from dmcview.constants import RENDERERS
+from dmcview.perf import PerfStats
+from dmcview.telemetry import Acceleration, Channel, TelemetryBus
+
+if TYPE_CHECKING:  # the renderer modules are imported only when their view is created
+    from dmcview.acceleration import Accelaration3D
+    from dmcview.acceleration_painter import PainterAcceleration3D
+
+ARROW_LENGTH_RATIO = 0.3
+ARROW_HEAD_ANGLE = np.radians(15)
+
+
+def arrow_segments(vector: np.ndarray, ratio: float = ARROW_LENGTH_RATIO) -> np.ndarray:
+    """
+    The three line segments of a 3D arrow from the origin, the same geometry as ``Axes3D.quiver``.
+
+    The head lines are the vector turned by +/-15 degrees around an axis perpendicular to it in
+    the xy plane, scaled by the arrow length ratio and drawn back from the tip.
+
+    Args:
+        vector (np.ndarray): the x, y and z of the arrow.
+
+    Return:
+        np.ndarray: shaft, head and head segments with shape (3, 2, 3).
+    """
+    vector = np.asarray(vector, dtype=float)
+    norm = np.hypot(vector[0], vector[1])
+    axis = np.array([vector[1] / norm, -vector[0] / norm, 0.0]) if norm else np.array([0.0, 1.0, 0.0])
+
+    cos, sin = np.cos(ARROW_HEAD_ANGLE), np.sin(ARROW_HEAD_ANGLE)
+    cross = np.cross(axis, vector)
+    along = axis * np.dot(axis, vector) * (1 - cos)
+    head_pos = vector * cos + cross * sin + along  # Rodrigues rotation
+    head_neg = vector * cos - cross * sin + along
+
+    origin = np.zeros(3)
+    return np.array(
+        [
+            [vector, origin],
+            [vector, vector - ratio * head_pos],
+            [vector, vector - ratio * head_neg],
+        ]
+    )
+
+
+
+class AccelerationStepper:
+    """
+    The animation of the acceleration vector shared by the acceleration views.
+
+    ``x``, ``y`` and ``z`` are the requested acceleration; ``target_x``, ``target_y`` and
+    ``target_z`` are the displayed vector which moves towards it by ``value`` on every step.
+    The view sets ``bus`` and calls :meth:`reset_acceleration` when it is created; it records its
+    draw durations in ``perf`` when one is attached.
+
+    The view steps on the timeout of its ``acceleration_timer``. The timer stops once the displayed
+    vector reaches the requested one and starts again on the next request, and a vector is
+    published only when it differs from the last one, so an idle view wakes nothing up.
+    """
+
+    bus: TelemetryBus
+    perf: Optional[PerfStats] = None
+    acceleration_timer: Optional[QTimer] = None
+
+    def reset_acceleration(self) -> None:
+        self.target_x = 0.0
+        self.target_y = 0.0
+        self.target_z = 0.0
+
+        self.x = 0.0
+        self.y = 0.0
+        self.z = 0.0
+
+        self.value = 0.2  # 0.1 step is very slow
+        self.published: Optional[tuple[float, float, float]] = None
+
+    def step_acceleration(self) -> tuple[float, float, float]:
+        """
+        Move the displayed vector one step towards the requested acceleration and publish it if it moved.
+
+        This method uses Decimal to round the floating-point number.
+
+        Return:
+            tuple: the displayed x, y and z.
+        """
+        if self.target_x < self.x:
+            self.target_x += self.value
+        elif self.target_x > self.x:
+            self.target_x -= self.value
+
+        if self.target_y < self.y:
+            self.target_y += self.value
+        elif self.target_y > self.y:
+            self.target_y -= self.value
+
+        if self.target_z < self.z:
+            self.target_z += self.value
+        elif self.target_z > self.z:
+            self.target_z -= self.value
+
+        self.target_y = float(
+            Decimal(self.target_y).quantize(Decimal("0.1"), rounding=ROUND_HALF_UP)
+        )
+        self.target_x = float(
+            Decimal(self.target_x).quantize(Decimal("0.1"), rounding=ROUND_HALF_UP)
+        )
+        self.target_z = float(
+            Decimal(self.target_z).quantize(Decimal("0.1"), rounding=ROUND_HALF_UP)
+        )
+
+        vector = (self.target_x, self.target_y, self.target_z)
+        if vector != self.published:
+            self.published = vector
+            self.bus.publish(Channel.ACCELERATION, Acceleration(*vector))
+        if vector == (self.x, self.y, self.z) and self.acceleration_timer is not None:
+            self.acceleration_timer.stop()  # reached, until the next request
+        return vector
+
+    def update_acceleration(self, x: float, y: float, z: float) -> None:
+        self.y = round(y, 1)
+        self.x = round(x, 1)
+        self.z = round(z, 1)
+
+        last_x_digit = self.x * 10
+        last_x_digit = last_x_digit % 10
+
+        if last_x_digit % 2 != 0:
+            self.x -= 0.1  # since the step is 0.2 we will make odd inputs into even.
+
+        last_y_digit = self.y * 10
+        last_y_digit = last_y_digit % 10
+
+        if last_y_digit % 2 != 0:
+            self.y -= 0.1  # since the step is 0.2 we will make odd inputs into even.
+
+        last_z_digit = self.z * 10
+        last_z_digit = last_z_digit % 10
+
+        if last_z_digit % 2 != 0:
+            self.z -= 0.1  # since the step is 0.2 we will make odd inputs into even.
+
+        self.y = round(self.y, 1)
+        self.x = round(self.x, 1)
+        self.z = round(self.z, 1)
+
+        if self.acceleration_timer is not None and not self.acceleration_timer.isActive():
+            self.acceleration_timer.start()
+
+
+def create_acceleration_view(
+    renderer: str = "matplotlib", bus: Optional[TelemetryBus] = None
+) -> "Union[Accelaration3D, PainterAcceleration3D]":
+    """
+    Create the acceleration view drawn by the given renderer.
+
+    Args:
+        renderer (str): "matplotlib" for the mplot3d canvas or "qpainter" for the lightweight view.
+        bus (TelemetryBus): the bus the view publishes its animated acceleration on.
+
+    Raises:
+        ValueError: If the renderer is unknown.
+    """
+    # pylint: disable=import-outside-toplevel
+    if renderer == "matplotlib":
+        from dmcview.acceleration import Accelaration3D
+
+        return Accelaration3D(bus=bus)
+    if renderer == "qpainter":
+        from dmcview.acceleration_painter import PainterAcceleration3D
+
+        return PainterAcceleration3D(bus=bus)
+    raise ValueError(f"Unknown renderer '{renderer}'; available: {', '.join(RENDERERS)}")
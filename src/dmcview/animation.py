@@ -0,0 +1,104 @@
+import math
+from typing import Callable, Optional
+
+from PySide6.QtCore import QElapsedTimer, QObject, Qt, QTimer
+from PySide6.QtGui import QGuiApplication
+
+FrameCallback = Callable[[float], bool]  # receives the elapsed seconds, returns True while animating
+
+
+def approach_angle(current: float, target: float, max_step: float) -> float:
+    """
+    Move an angle towards its target along the shortest arc.
+
+    Args:
+        current (float): The current angle in degrees.
+        target (float): The target angle in degrees.
+        max_step (float): The largest allowed move in degrees.
+
+    Return:
+        float: The new angle in the range [0, 360).
+    """
+    diff = (target - current) % 360.0
+    if diff > 180.0:
+        diff -= 360.0
+    if abs(diff) <= max_step:
+        return target % 360.0
+    return (current + math.copysign(max_step, diff)) % 360.0
+
+
+def angle_distance(current: float, target: float) -> float:
+    """ The absolute shortest arc between two angles in degrees. """
+    diff = (target - current) % 360.0
+    return min(diff, 360.0 - diff)
+
+
+class AnimationClock(QObject):
+    """
+    One frame timer at the display refresh rate that drives all the subscribed animations.
+
+    Each frame the subscribers receive the wall-clock seconds elapsed since the previous frame so
+    they interpolate by time instead of by tick count. The timer stops by itself when no subscriber
+    is animating anymore and must be started again with :meth:`start` when a new target arrives.
+
+    Args:
+        frame_rate (float): Frames per second; the primary screen refresh rate if not supplied.
+    """
+    def __init__(self, parent: Optional[QObject] = None, frame_rate: Optional[float] = None) -> None:
+        super().__init__(parent)
+        self.frame_rate = frame_rate if frame_rate else display_refresh_rate()
+        self.callbacks: list[FrameCallback] = []
+
+        self.elapsed = QElapsedTimer()
+        self.timer = QTimer(self)
+        self.timer.setTimerType(Qt.TimerType.PreciseTimer)
+        self.timer.timeout.connect(self.__tick)
+
+    def subscribe(self, callback: FrameCallback, owner: Optional[QObject] = None, first: bool = False) -> None:
+        """
+        Call the callback on every frame.
+
+        Args:
+            callback: receives the elapsed seconds and returns True while it is still animating.
+            owner (QObject): the callback is unsubscribed when the owner is destroyed.
+            first (bool): call it before the callbacks already subscribed, for the stages feeding
+                the animations the values of the same frame.
+        """
+        if first:
+            self.callbacks.insert(0, callback)
+        else:
+            self.callbacks.append(callback)
+        if owner is not None:
+            owner.destroyed.connect(lambda: self.unsubscribe(callback))
+
+    def unsubscribe(self, callback: FrameCallback) -> None:
+        if callback in self.callbacks:
+            self.callbacks.remove(callback)
+
+    def start(self) -> None:
+        """ Start the frames if the clock is idle. """
+        if not self.timer.isActive():
+            self.elapsed.start()
+            self.timer.start(max(1, round(1000 / self.frame_rate)))
+
+    def stop(self) -> None:
+        self.timer.stop()
+
+    def is_active(self) -> bool:
+        return self.timer.isActive()
+
+    def __tick(self) -> None:
+        seconds = self.elapsed.restart() / 1000.0
+        animating = False
+        for callback in list(self.callbacks):
+            animating = callback(seconds) or animating  # every subscriber gets the frame
+
+        if not animating:
+            self.timer.stop()
+
+
+def display_refresh_rate() -> float:
+    """ The refresh rate of the primary screen, 60 Hz when it is unknown. """
+    screen = QGuiApplication.primaryScreen() if QGuiApplication.instance() else None
+    rate = screen.refreshRate() if screen is not None else 0.0
+    return rate if rate > 0 else 60.0
@@ -0,0 +1,132 @@
+"""
+Hard and soft iron calibration of a magnetometer.
+
+Turned through every direction, for example along a figure eight, an ideal magnetometer draws a
+sphere centred on 0. The iron of the vehicle shifts it (hard iron) and stretches it into an ellipsoid
+(soft iron). The ellipsoid ``a x² + b y² + c z² + 2d xy + 2e xz + 2f yz + 2g x + 2h y + 2i z = 1`` is
+fitted by linear least squares; its normal equations are 9 by 9 whatever the number of samples, so
+they are accumulated batch by batch and the fit is updated in constant time.
+"""
+
+import threading
+from typing import NamedTuple, Optional
+
+import numpy as np
+
+CALIBRATION_BLOCK = 1 << 14  # samples per block of design rows, 1 MiB
+MAX_CONDITION = 1e12  # normal equations worse than this do not span the directions, typically one plane
+
+
+class Calibration(NamedTuple):
+    """
+    The correction of a magnetometer, ``matrix @ (vector - offset)``.
+
+    The matrix is symmetric and keeps the volume of the ellipsoid, so the corrected field has about
+    the magnitude of the raw one.
+    """
+    offset: np.ndarray  # (3,) the hard iron offset
+    matrix: np.ndarray  # (3, 3) the soft iron correction
+    residual: float  # the RMS algebraic distance of the samples to the ellipsoid, about twice the relative error
+
+    def apply(self, magnetometer: np.ndarray) -> np.ndarray:
+        """ The corrected vectors of a batch, shape (n, 3). """
+        return (np.asarray(magnetometer, dtype=np.float64) - self.offset) @ self.matrix
+
+
+class EllipsoidFitter:
+    """
+    Running ellipsoid fit of the magnetometer vectors.
+
+    :meth:`add` can be called from any thread, for example by the parser of a serial reader, while
+    :meth:`fit` is called by the views. The vectors are moved and scaled by the first batch before
+    they are squared so the normal equations stay well conditioned with raw sensor counts.
+    """
+    def __init__(self) -> None:
+        self.lock = threading.Lock()
+        self.count = 0
+        self.normal = np.zeros((9, 9))
+        self.moments = np.zeros(9)
+        self.origin: Optional[np.ndarray] = None
+        self.scale = 1.0
+
+    def reset(self) -> None:
+        """ Forget every sample, to calibrate again. """
+        with self.lock:
+            self.count = 0
+            self.normal = np.zeros((9, 9))
+            self.moments = np.zeros(9)
+            self.origin = None
+            self.scale = 1.0
+
+    def add(self, magnetometer: np.ndarray) -> None:
+        """
+        Accumulate a batch of vectors.
+
+        Args:
+            magnetometer (np.ndarray): The magnetic field vectors, shape (n, 3).
+        """
+        vectors = np.asarray(magnetometer, dtype=np.float64).reshape(-1, 3)
+        if len(vectors) == 0:
+            return
+        with self.lock:
+            if self.origin is None:
+                self.origin = vectors.mean(axis=0)
+                self.scale = float(np.linalg.norm(vectors, axis=1).mean()) or 1.0
+            origin, scale = self.origin, self.scale
+
+        normal = np.zeros((9, 9))
+        moments = np.zeros(9)
+        for start in range(0, len(vectors), CALIBRATION_BLOCK):
+            u = (vectors[start : start + CALIBRATION_BLOCK] - origin) / scale
+            design = np.empty((len(u), 9))
+            np.multiply(u, u, out=design[:, 0:3])
+            np.multiply(u[:, [0, 0, 1]], u[:, [1, 2, 2]], out=design[:, 3:6])
+            design[:, 3:6] *= 2.0
+            np.multiply(u, 2.0, out=design[:, 6:9])
+            normal += design.T @ design
+            moments += design.sum(axis=0)
+
+        with self.lock:
+            if self.origin is origin:  # not reset meanwhile
+                self.normal += normal
+                self.moments += moments
+                self.count += len(vectors)
+
+    def fit(self) -> Optional[Calibration]:
+        """
+        Fit the ellipsoid of the vectors accumulated so far.
+
+        Return:
+            Calibration: The correction, None until the vectors span an ellipsoid.
+        """
+        with self.lock:
+            count, normal, moments = self.count, self.normal.copy(), self.moments.copy()
+            origin, scale = self.origin, self.scale
+        if origin is None or count < 9 or np.linalg.cond(normal) > MAX_CONDITION:
+            return None
+        v = np.linalg.solve(normal, moments)
+        quadric = np.array([[v[0], v[3], v[4]], [v[3], v[1], v[5]], [v[4], v[5], v[2]]])
+        try:
+            center = -np.linalg.solve(quadric, v[6:9])
+        except np.linalg.LinAlgError:
+            return None
+        # (u - center)ᵀ shape (u - center) = 1 is the ellipsoid in the scaled coordinates
+        level = 1.0 + center @ quadric @ center
+        if level <= 0:
+            return None
+        eigenvalues, axes = np.linalg.eigh(quadric / level)
+        if eigenvalues.min() <= 0:
+            return None
+
+        # the square root of the shape maps the ellipsoid on the unit sphere; divided by its
+        # geometric mean it maps it on the sphere of the same volume, in the raw units
+        matrix = (axes * np.sqrt(eigenvalues)) @ axes.T * np.prod(eigenvalues) ** (-1.0 / 6.0)
+        residual = float(np.sqrt(max(0.0, float(count - v @ moments)) / count))
+        return Calibration(origin + scale * center, matrix, residual)
+
+
+def calibrate(magnetometer: np.ndarray) -> Optional[Calibration]:
+    """ Fit the calibration of recorded magnetometer vectors, shape (n, 3); None if they span no ellipsoid. """
+    fitter = EllipsoidFitter()
+    fitter.add(magnetometer)
+    return fitter.fit()
@@ -1,13 +1,80 @@
-"""The command line interface (CLI) parser"""
+"""
+The command line interface (CLI) parser
 
-from argparse import ArgumentParser, Namespace
+Only the standard library is imported here: argument parsing, ``--version`` and argument errors
+never load PySide6, matplotlib or NumPy. The GUI modules are imported when a window is created.
+"""
 
-from PySide6.QtWidgets import QApplication, QHBoxLayout, QWidget
+from argparse import SUPPRESS, ArgumentParser, Namespace
+from collections.abc import Sequence
+from typing import Optional
 
 from dmcview import __version__
-from dmcview.acceleration import Accelaration3D
-from dmcview.compass import Compass
-from dmcview.simulator import start_simulator
+from dmcview.constants import (
+    RENDERERS,
+    REPLAY_SPEED_RANGE,
+    SIMULATOR_DECLINATION,
+    SIMULATOR_RATE_RANGE,
+)
+
+
+def start_simulator(
+    renderer: str = "matplotlib",
+    rate: float = 1.0,
+    scenario: Optional[str] = None,
+    perf_overlay: bool = False,
+    declination: float = SIMULATOR_DECLINATION,
+) -> None:
+    from dmcview import simulator  # pylint: disable=import-outside-toplevel
+
+    simulator.start_simulator(renderer, rate, scenario, perf_overlay, declination)
+
+
+def start_serial(
+    port: str,
+    manufacturer: str,
+    baudrate: Optional[int] = None,
+    renderer: str = "matplotlib",
+    record: Optional[str] = None,
+    perf_overlay: bool = False,
+) -> None:
+    from dmcview import serial_reader  # pylint: disable=import-outside-toplevel
+
+    serial_reader.start_serial(port, manufacturer, baudrate, renderer, record, perf_overlay)
+
+
+def start_replay(
+    path: str,
+    speed: float = 1.0,
+    fast: bool = False,
+    renderer: str = "matplotlib",
+    perf_overlay: bool = False,
+) -> None:
+    from dmcview import replay  # pylint: disable=import-outside-toplevel
+
+    replay.start_replay(path, speed, fast, renderer, perf_overlay)
+
+
+def start_dashboard(
+    ports: Sequence[str] = (),
+    manufacturer: str = "generic",
+    baudrate: Optional[int] = None,
+    simulate: int = 0,
+    rate: float = 1.0,
+    columns: Optional[int] = None,
+) -> None:
+    from dmcview import dashboard  # pylint: disable=import-outside-toplevel
+
+    dashboard.start_dashboard(ports, manufacturer, baudrate, simulate, rate, columns)
+
+
+def position_declination(latitude: float, longitude: float) -> float:
+    """ The declination in degrees at a position today, from the bundled World Magnetic Model. """
+    import datetime  # pylint: disable=import-outside-toplevel
+
+    from dmcview.declination import bundled_model, decimal_year  # pylint: disable=import-outside-toplevel
+
+    return round(float(bundled_model().declination(latitude, longitude, decimal_year(datetime.date.today()))), 2)
 
 
 def get_float_input(prompt: str, default: float) -> float:
@@ -94,15 +161,52 @@ def main() -> None:
 
     -ac: float float float
         X, Y and Z acceleration
+    --port : str
+        Serial port of the plugged device; the values are read from the device.
+    --device : str
+        Device manufacturer whose parser decodes the serial data.
+    --baudrate : int
+        Serial speed, the device manufacturer default if not supplied.
+    --renderer : str
+        Acceleration view renderer: matplotlib or the lightweight qpainter.
+    --record : str
+        Session file recording the samples read from the serial port.
+    --rate : float
+        Simulated samples per second, from 1 Hz to 10 kHz.
+    --scenario : str
+        Scenario file played by the simulator instead of random samples.
+    --perf-overlay
+        Show the performance counters (FPS, paint time, input backlog) in the compass; F3 toggles them.
+    --position : float float
+        Latitude from -90 to 90 and longitude from -180 to 180 degrees; the declination there today
+        replaces the entered or simulated one.
+
+    Commands
+    --------
+    replay file [--speed SPEED] [--fast]
+        Replay a recorded session at the given speed, or as fast as possible.
+    dashboard [port ...] [--simulate N] [--columns COLUMNS]
+        Show many units in one window, a compass tile per serial port and per simulated unit.
 
     Examples:
         >>> dmcview -a 45.5 -d 5.6 -b 30.35 -e 15.23 -ac 14.21 12.3 13.5
         >>> dmcview -s Y
+        >>> dmcview --port /dev/ttyUSB0 --device generic
+        >>> dmcview -s Y --renderer qpainter
+        >>> dmcview -s Y --rate 1000
+        >>> dmcview -s Y --scenario sequences.json
+        >>> dmcview --port /dev/ttyUSB0 --device generic --record session.dmc
+        >>> dmcview replay session.dmc --speed 10
+        >>> dmcview dashboard /dev/ttyUSB0 /dev/ttyUSB1 --device generic
+        >>> dmcview dashboard --simulate 48 --rate 50
     """
 
     parser = ArgumentParser(
         prog="dmcview",
-        usage="dmcview -a 45.5 -d 5.6 -b 30.35 -e 15.23 -ac 14.21 12.3 13.5  \n       dmcview -s Y",
+        usage="dmcview -a 45.5 -d 5.6 -b 30.35 -e 15.23 -ac 14.21 12.3 13.5  \n       dmcview -s Y"
+        "\n       dmcview --port /dev/ttyUSB0 --device generic"
+        "\n       dmcview replay session.dmc --speed 10"
+        "\n       dmcview dashboard /dev/ttyUSB0 /dev/ttyUSB1 --simulate 4",
         description="dmcview Command Line Interface",
     )
 
@@ -154,14 +258,155 @@ def main() -> None:
         default=None,
         metavar="[x,y,z]",
     )
+    parser.add_argument(
+        "--port",
+        help="serial port of the plugged device, for example /dev/ttyUSB0 or COM3",
+        type=str,
+        default=None,
+        metavar="port",
+    )
+    parser.add_argument(
+        "--device",
+        help="device manufacturer parser of the serial data, for example generic or dmc-binary",
+        type=str,
+        default="generic",
+        metavar="manufacturer",
+    )
+    parser.add_argument(
+        "--baudrate",
+        help="serial speed, the device manufacturer default if not supplied",
+        type=int,
+        default=None,
+        metavar="baudrate",
+    )
+    parser.add_argument(
+        "--renderer",
+        help="acceleration view renderer; qpainter starts faster and draws cheaper than matplotlib",
+        type=str,
+        default="matplotlib",
+        choices=RENDERERS,
+    )
+    parser.add_argument(
+        "--record",
+        help="record the samples read from the serial port to a session file",
+        type=str,
+        default=None,
+        metavar="file",
+    )
+    parser.add_argument(
+        "--rate",
+        help=f"simulated samples per second, from {SIMULATOR_RATE_RANGE[0]:g} to {SIMULATOR_RATE_RANGE[1]:g} Hz",
+        type=float,
+        default=1.0,
+        metavar="hertz",
+    )
+    parser.add_argument(
+        "--scenario",
+        help="scenario file with per channel schedules played by the simulator",
+        type=str,
+        default=None,
+        metavar="file",
+    )
+    parser.add_argument(
+        "--perf-overlay",
+        help="show the frame rate, paint times and input backlog in the compass; F3 toggles it",
+        action="store_true",
+    )
+    parser.add_argument(
+        "--position",
+        help="latitude from -90 to 90 and longitude from -180 to 180 degrees; the declination is computed there "
+        "by the World Magnetic Model",
+        type=float,
+        nargs=2,
+        default=None,
+        metavar=("latitude", "longitude"),
+    )
     parser.add_argument("--version", action="version", version=f"dmcview {__version__}")
 
+    commands = parser.add_subparsers(dest="command", metavar="command")
+    replay = commands.add_parser("replay", help="replay a recorded session file")
+    replay.add_argument("file", help="the session file recorded with --record")
+    replay.add_argument(
+        "--speed",
+        help=f"playback speed from {REPLAY_SPEED_RANGE[0]} to {REPLAY_SPEED_RANGE[1]}, 1 is the recorded pace",
+        type=float,
+        default=1.0,
+    )
+    replay.add_argument(
+        "--fast", help="replay as fast as possible and print the throughput", action="store_true"
+    )
+    replay.add_argument("--renderer", type=str, default=SUPPRESS, choices=RENDERERS, help=SUPPRESS)
+
+    dashboard = commands.add_parser("dashboard", help="show many units in one window, a compass tile each")
+    dashboard.add_argument("ports", help="the serial ports of the units", nargs="*", metavar="port")
+    dashboard.add_argument(
+        "--simulate", help="simulated units shown after the serial ones", type=int, default=0, metavar="units"
+    )
+    dashboard.add_argument(
+        "--columns", help="tiles per row, a grid about as wide as high by default", type=int, default=None
+    )
+    dashboard.add_argument("--device", type=str, default=SUPPRESS, metavar="manufacturer", help=SUPPRESS)
+    dashboard.add_argument("--baudrate", type=int, default=SUPPRESS, metavar="baudrate", help=SUPPRESS)
+    dashboard.add_argument("--rate", type=float, default=SUPPRESS, metavar="hertz", help=SUPPRESS)
+
     args: Namespace = parser.parse_args()
 
-    simulation: str = args.s
-    print(simulation)
-    if args.s is not None and args.s == "Y":
-        start_simulator()
+    if args.position is not None and not -90.0 <= args.position[0] <= 90.0:
+        parser.error("--position latitude must be between -90 and 90 degrees")
+    if args.position is not None and not -180.0 <= args.position[1] <= 180.0:
+        parser.error("--position longitude must be between -180 and 180 degrees")
+    if args.command == "replay":
+        if not REPLAY_SPEED_RANGE[0] <= args.speed <= REPLAY_SPEED_RANGE[1]:
+            parser.error(f"--speed must be between {REPLAY_SPEED_RANGE[0]} and {REPLAY_SPEED_RANGE[1]}")
+        from dmcview.recording import SessionReader  # pylint: disable=import-outside-toplevel
+
+        try:
+            with SessionReader(args.file):
+                pass
+        except (OSError, ValueError) as error:
+            parser.error(f"invalid session: {error}")
+        start_replay(args.file, args.speed, args.fast, args.renderer, args.perf_overlay)
+    elif args.command == "dashboard":
+        if args.simulate < 0 or (args.simulate == 0 and not args.ports):
+            parser.error("dashboard needs serial ports or a positive --simulate")
+        if args.columns is not None and args.columns <= 0:
+            parser.error("--columns must be positive")
+        if args.ports:
+            from dmcview.device_parser import available_parsers  # pylint: disable=import-outside-toplevel
+
+            if args.device.lower() not in available_parsers():
+                parser.error(
+                    f"unknown device '{args.device}' (choose from {', '.join(available_parsers())})"
+                )
+        if args.simulate and not SIMULATOR_RATE_RANGE[0] <= args.rate <= SIMULATOR_RATE_RANGE[1]:
+            parser.error(
+                f"--rate must be between {SIMULATOR_RATE_RANGE[0]:g} and {SIMULATOR_RATE_RANGE[1]:g} Hz"
+            )
+        start_dashboard(args.ports, args.device, args.baudrate, args.simulate, args.rate, args.columns)
+    elif args.port is not None:
+        from dmcview.device_parser import available_parsers  # pylint: disable=import-outside-toplevel
+
+        if args.device.lower() not in available_parsers():
+            parser.error(
+                f"unknown device '{args.device}' (choose from {', '.join(available_parsers())})"
+            )
+        start_serial(args.port, args.device, args.baudrate, args.renderer, args.record, args.perf_overlay)
+    elif args.record is not None:
+        parser.error("--record needs a device, use it with --port")
+    elif args.s is not None and args.s == "Y":
+        if not SIMULATOR_RATE_RANGE[0] <= args.rate <= SIMULATOR_RATE_RANGE[1]:
+            parser.error(
+                f"--rate must be between {SIMULATOR_RATE_RANGE[0]:g} and {SIMULATOR_RATE_RANGE[1]:g} Hz"
+            )
+        if args.scenario is not None:
+            from dmcview.scenario import load_scenario  # pylint: disable=import-outside-toplevel
+
+            try:
+                load_scenario(args.scenario)
+            except (OSError, ValueError) as error:
+                parser.error(f"invalid scenario: {error}")
+        declination = SIMULATOR_DECLINATION if args.position is None else position_declination(*args.position)
+        start_simulator(args.renderer, args.rate, args.scenario, args.perf_overlay, declination)
     else:
         start_input(args)
 
@@ -175,6 +420,8 @@ def start_input(args: Namespace) -> None:
     declination: float = (
         args.d
         if args.d is not None
+        else position_declination(*args.position)
+        if args.position is not None
         else get_float_input("Enter the declination angle in degrees; for example 30.0", 30.0)
     )  # declination
     bank: float = (
@@ -198,45 +445,11 @@ def start_input(args: Namespace) -> None:
         )
     )
 
-    app = QApplication()
-    main_widget = QWidget()
-    layout = QHBoxLayout(main_widget)
-    compass = Compass()
-
-    layout.addWidget(compass)
-
-    canvas = Accelaration3D()
-    canvas.setFixedSize(350, 350)
-    layout.addWidget(canvas)
-
-    # def on_resize(event):
-    #    screen_size = main_widget.size()
-    #    if screen_size.width()<1000 or screen_size.height()<500:
-    #        canvas.setFixedSize(250,250)
-    #    else:
-    #        canvas.setFixedSize(350,350)
-    #
-    #    print(screen_size)
-
-    # main_widget.resizeEvent = on_resize
-
-    compass.update_declination(
-        declination
-    )  # This is Declination and can be float to two decimal places for example 35.55
-    compass.update_angle(
-        azimuth
-    )  # This is Azimuth and can be float to two decimal places for example 35.55
-    compass.set_rotation(
-        bank
-    )  # This is the Inclination can be floated to two decimal places for example 35.55
-    compass.set_elevation(
-        elevation
-    )  # This is the Elevation can be floated to two decimal places for example 25.55
-
-    canvas.update_acceleration(x, y, z)
-
-    main_widget.show()
-    app.exec()
+    from dmcview.gui import start_input_window  # pylint: disable=import-outside-toplevel
+
+    start_input_window(
+        azimuth, declination, bank, elevation, (x, y, z), args.renderer, args.perf_overlay
+    )
 
 
 if __name__ == "__main__":  # this is important so that it does not run from pytest
@@ -1,20 +1,324 @@
 import math
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Mapping
+from operator import attrgetter
+from typing import Any, Optional
 
-from PySide6.QtCore import QEvent, QPointF, QRectF, Qt, QTimer
+from PySide6.QtCore import QEvent, QPoint, QPointF, QRect, QRectF, QSize, Qt, QTimer
 from PySide6.QtGui import (
     QBrush,
     QColor,
     QFont,
+    QFontMetricsF,
+    QKeyEvent,
     QPainter,
     QPen,
+    QPicture,
     QPixmap,
     QPolygonF,
     QResizeEvent,
+    QStaticText,
     QTransform,
 )
 from PySide6.QtWidgets import QWidget
 
-from dmcview.accele_signal_manger import signal_manager
+from dmcview.animation import AnimationClock, angle_distance, approach_angle
+from dmcview.perf import PerfStats
+from dmcview.telemetry import (
+    Acceleration,
+    Channel,
+    Declination,
+    Orientation,
+    TelemetryBus,
+    default_bus,
+)
+
+DARK_RED = QColor(124, 10, 2)  # the declination
+DARK_GREEN = QColor(87, 108, 67)  # the azimuth
+INFO_LINES = (0, 4, 8, 12, 16, 20, 22)  # the lines of the information panel, in line spacings
+
+
+class PaintResources:
+    """
+    The pens, brushes, fonts, shapes and laid out texts of the compass frames for one widget size.
+
+    Creating them and laying out the text every frame cost more than the drawing itself. The texts
+    are QStaticText laid out once; a value is formatted again only when it changes and its text is
+    laid out again only when the displayed string changes.
+
+    Args:
+        size (QSize): the widget size.
+        center (QPointF): the center of the compass circle.
+        radius (int): the radius of the compass circle.
+        label_font (QFont): the font of the arc labels.
+    """
+    def __init__(self, size: QSize, center: QPointF, radius: int, label_font: QFont) -> None:
+        self.size = QSize(size)
+        self.center = center
+        self.radius = radius
+
+        font_size = max(12, size.width() // 80)
+        line_spacing = font_size
+        self.info_font = QFont("Arial", font_size)
+        self.perf_font = QFont("Arial", font_size - 2)
+        self.label_font = QFont(label_font)
+        self.label_ascent = QFontMetricsF(self.label_font).ascent()
+
+        # QStaticText is placed by its top left corner and drawText by its baseline
+        text_x = center.x() + radius + 47  # reduce the number to prevent capped text
+        text_y = center.y() - radius
+        top = text_y - QFontMetricsF(self.info_font).ascent()
+        self.info_positions = [QPointF(text_x, top + line * line_spacing) for line in INFO_LINES]
+        top = text_y + 25 * line_spacing - QFontMetricsF(self.perf_font).ascent()
+        self.perf_positions = [QPointF(text_x, top + number * 1.5 * line_spacing) for number in range(8)]
+
+        self.text_pen = QPen(Qt.black)
+        self.perf_pen = QPen(QColor("DimGray"))
+        self.red_pen = QPen(Qt.red, 1, Qt.SolidLine)
+        self.red_wide_pen = QPen(Qt.red, 2)
+        self.red_brush = QBrush(Qt.red)
+        self.elevation_pen = QPen(QColor("DarkBlue"), 1, Qt.DashLine)
+        self.bank_arc_pen = QPen(Qt.black, 1, Qt.DashLine)
+        self.declination_pen = QPen(DARK_RED, 2)
+        self.declination_arc_pen = QPen(DARK_RED, 1, Qt.DashLine)
+        self.declination_brush = QBrush(DARK_RED)
+        self.azimuth_pen = QPen(DARK_GREEN, 2)
+        self.azimuth_arc_pen = QPen(DARK_GREEN, 1, Qt.DashLine)
+        self.azimuth_brush = QBrush(DARK_GREEN)
+
+        triangle_size = 20
+        self.arrow_head = QPolygonF(
+            [
+                QPointF(-triangle_size / 2, triangle_size / 2),
+                QPointF(triangle_size / 2, triangle_size / 2),
+                QPointF(0, -triangle_size / 2),
+            ]
+        )
+        marker_size = 10  # the declination and azimuth markers, pointing up from their position
+        self.marker = QPolygonF(
+            [QPointF(-marker_size / 2, 0), QPointF(marker_size / 2, 0), QPointF(0, -marker_size)]
+        )
+
+        self.texts: dict[str, tuple[str, QStaticText]] = {}
+        self.values: dict[str, tuple[tuple, QStaticText]] = {}
+        # the texts drawn since it was reset, QPicture does not bound them; None when not needed
+        self.text_bounds: Optional[QRectF] = None
+
+    def text(self, key: str, string: str, font: Optional[QFont] = None) -> QStaticText:
+        """
+        The laid out text shown under a key, laid out again only if the string changed.
+
+        The text is laid out when it is drawn, for the font and the scale of the painter.
+
+        Args:
+            key (str): what the text shows, one text per key.
+            string (str): the text.
+            font (QFont): the font it is drawn with, the information font if not supplied.
+        """
+        cached = self.texts.get(key)
+        if cached is not None and cached[0] == string:
+            return cached[1]
+
+        if cached is None:
+            static = QStaticText(string)
+            static.setTextFormat(Qt.TextFormat.PlainText)
+            static.setPerformanceHint(QStaticText.PerformanceHint.AggressiveCaching)
+            static.prepare(QTransform(), font if font is not None else self.info_font)  # for its size
+        else:
+            static = cached[1]
+            static.setText(string)
+        self.texts[key] = (string, static)
+        return static
+
+    def value_text(self, key: str, template: str, values: tuple, digits: Optional[int] = None) -> QStaticText:
+        """
+        The laid out text of values, formatted again only if the values changed.
+
+        Args:
+            key (str): what the text shows.
+            template (str): the ``str.format`` template of the values.
+            values (tuple): the values.
+            digits (int): round the values to this many digits, shown as they are if not supplied.
+        """
+        cached = self.values.get(key)
+        if cached is not None and cached[0] == values:
+            return cached[1]
+        shown = values if digits is None else tuple(round(value, digits) for value in values)
+        static = self.text(key, template.format(*shown))
+        self.values[key] = (values, static)
+        return static
+
+    def draw_text(self, painter: QPainter, position: QPointF, static: QStaticText) -> None:
+        """ Draw a laid out text by its top left corner and add its rectangle to ``text_bounds``. """
+        painter.drawStaticText(position, static)
+        if self.text_bounds is not None:
+            self.text_bounds |= QRectF(position, static.size())
+
+    def draw_label(self, painter: QPainter, label: str, x: float, y: float) -> None:
+        """ Draw a label in the label font with its baseline starting at (x, y). """
+        top = y - self.label_ascent
+        self.draw_text(painter, QPointF(x, top), self.text(label, label, self.label_font))
+
+    def draw_marker(self, painter: QPainter, x: float, y: float) -> None:
+        """ Draw the marker triangle with its base centered at (x, y). """
+        painter.translate(x, y)
+        painter.drawPolygon(self.marker)
+        painter.translate(-x, -y)
+
+
+def device_pixel_ratio(painter: QPainter) -> float:
+    """
+    The physical pixels per logical pixel of what the painter paints on, scaling included.
+
+    Unlike the ratio of the widget, it is also right when the widget is rendered in an image or
+    drawn scaled; the pixmaps drawn at this ratio are blitted one to one.
+    """
+    return painter.combinedTransform().m11()
+
+
+class PixmapCache:
+    """
+    A small least recently used cache of pixmaps keyed by logical size and device pixel ratio.
+
+    Switching between layouts, docked, undocked or full screen, or moving a window between
+    screens of different scales reuses the pixmaps already drawn.
+
+    Args:
+        capacity (int): the pixmaps kept, the least recently used is dropped first.
+
+    Raises:
+        ValueError: If the capacity is not positive.
+    """
+    def __init__(self, capacity: int = 4) -> None:
+        if capacity <= 0:
+            raise ValueError("The pixmap cache capacity must be positive")
+        self.capacity = capacity
+        self.pixmaps: OrderedDict[tuple[int, int, float], QPixmap] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def pixmap(self, size: QSize, dpr: float, draw: Callable[[QSize, float], QPixmap]) -> QPixmap:
+        """
+        The cached pixmap of a size and pixel ratio, drawn and added if missing.
+
+        Args:
+            size (QSize): the logical size.
+            dpr (float): the device pixel ratio.
+            draw (Callable): draws a missing pixmap, draw(size, dpr).
+        """
+        key = (size.width(), size.height(), dpr)
+        pixmap = self.pixmaps.get(key)
+        if pixmap is not None:
+            self.hits += 1
+            self.pixmaps.move_to_end(key)
+            return pixmap
+
+        self.misses += 1
+        pixmap = draw(size, dpr)
+        self.pixmaps[key] = pixmap
+        if len(self.pixmaps) > self.capacity:
+            self.pixmaps.popitem(last=False)
+        return pixmap
+
+    def clear(self) -> None:
+        self.pixmaps.clear()
+
+
+_default_dial_cache: Optional[PixmapCache] = None
+
+
+def default_dial_cache() -> PixmapCache:
+    """ The dial pixmaps shared by the compasses that are not given their own cache. """
+    global _default_dial_cache  # pylint: disable=global-statement
+    if _default_dial_cache is None:
+        _default_dial_cache = PixmapCache()
+    return _default_dial_cache
+
+
+LAYERS = ("elevation", "declination", "azimuth", "bank", "text")  # bottom to top, over the dial
+LAYER_INPUTS = {  # the values each layer shows, it is drawn again when they change
+    "elevation": attrgetter("elevation"),
+    "declination": attrgetter("current_declination"),
+    "azimuth": attrgetter("current_angle"),
+    "bank": attrgetter("rotation"),
+    "text": attrgetter("current_angle", "current_declination", "rotation", "elevation", "x", "y", "z"),
+}
+
+
+class LayerCache:
+    """
+    Pixmaps of layers drawn again only when their inputs change.
+
+    A layer whose inputs changed since the last frame is drawn directly, as it is likely to change
+    again in the next frame while it animates; it is drawn in a pixmap on the first frame its inputs
+    stay the same and blitted from then on. The layer is first recorded in a QPicture to find the
+    bounding rectangle of its drawing; its pixmap covers only that rectangle so the blits cost little
+    even when the layer is a small marker on a large widget.
+
+    Args:
+        draw (Callable): draws a layer, draw(painter, name, text_bounds), and returns the bounding
+            rectangle of its texts when text_bounds is True.
+    """
+    margin = 3  # pixels around the recorded bounds for the pen widths and the antialiasing
+
+    def __init__(self, draw: Callable[[QPainter, str, bool], Optional[QRectF]]) -> None:
+        self.draw = draw
+        self.bounds = QRect()  # the rectangle the layers are clipped to
+        self.layers: dict[str, tuple[Any, float, Optional[QPixmap], QPoint]] = {}  # None: drawn directly
+        self.renders = 0  # the layers drawn in a pixmap, for the tests and benchmarks
+
+    def clear(self) -> None:
+        self.layers.clear()
+
+    def set_bounds(self, bounds: QRect) -> None:
+        """ Clip the layers to the widget rectangle; they are drawn again if it changed. """
+        if bounds != self.bounds:
+            self.bounds = QRect(bounds)
+            self.clear()
+
+    def paint(self, painter: QPainter, name: str, inputs: Any, dpr: float) -> None:
+        """
+        Draw a layer, from its pixmap when its inputs did not change.
+
+        Args:
+            painter (QPainter): the painter of the frame.
+            name (str): the layer.
+            inputs: the values the layer shows, compared with those of the last frame.
+            dpr (float): the device pixel ratio of the painter, the pixmaps are drawn at it.
+        """
+        cached = self.layers.get(name)
+        if cached is None or cached[0] != inputs or cached[1] != dpr:
+            self.layers[name] = (inputs, dpr, None, QPoint())
+            self.draw(painter, name)
+            return
+        if cached[2] is None:  # the inputs stayed the same since the last frame
+            cached = (inputs, dpr, *self.__render(name, dpr))
+            self.layers[name] = cached
+        painter.drawPixmap(cached[3], cached[2])  # a null pixmap for an empty layer draws nothing
+
+    def __render(self, name: str, dpr: float) -> tuple[QPixmap, QPoint]:
+        self.renders += 1
+        picture = QPicture()
+        painter = QPainter(picture)
+        text_bounds = self.draw(painter, name, True)
+        painter.end()
+
+        margin = self.margin
+        rect = picture.boundingRect() | text_bounds.toAlignedRect()
+        rect = rect.adjusted(-margin, -margin, margin, margin) & self.bounds
+        if rect.isEmpty():
+            return QPixmap(), rect.topLeft()
+
+        pixmap = QPixmap(rect.size() * dpr)
+        pixmap.setDevicePixelRatio(dpr)
+        pixmap.fill(Qt.transparent)
+        painter = QPainter(pixmap)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.translate(-rect.topLeft())
+        self.draw(painter, name)
+        painter.end()
+        return pixmap, rect.topLeft()
 
 
 class Compass(QWidget):
@@ -24,8 +328,32 @@ class Compass(QWidget):
     Represent how to draw a circle, the 4 Directions (W, N, E, S), and how the user inputs as text,
     Draw the Elevation, Bank, and Azimuth inside the circle.
 
+    State changes only mark the changed fields as dirty; the widget is repainted at most once per
+    frame of the animation clock whatever the number of changes received in between. Each part of
+    the state is a cached layer drawn again only when the values it shows change, so a frame where
+    only the azimuth moved draws the azimuth and the text and blits the other layers.
+
+    F3 toggles an overlay of performance counters in the information panel.
+
+    Args:
+        clock (AnimationClock): The frame clock driving the animations; a private one if not supplied.
+        degrees_per_second (float): The speed of the azimuth and declination animations.
+        animation_duration (float): If supplied, every change is animated in this many seconds
+            whatever its size, instead of at a constant speed.
+        bus (TelemetryBus): The bus the compass subscribes to once; the shared one if not supplied.
+        dial_cache (PixmapCache): The cache of the static dial pixmaps; the shared one if not supplied.
+
     """
-    def __init__(self) -> None:
+    STATE_FIELDS = ("azimuth", "declination", "elevation", "bank", "x", "y", "z")
+
+    def __init__(
+        self,
+        clock: Optional[AnimationClock] = None,
+        degrees_per_second: float = 100.0,
+        animation_duration: Optional[float] = None,
+        bus: Optional[TelemetryBus] = None,
+        dial_cache: Optional[PixmapCache] = None,
+    ) -> None:
         super().__init__()
         self.setWindowTitle("Digital Magnetic Compass")
         self.setMinimumSize(600, 420)
@@ -41,11 +369,35 @@ class Compass(QWidget):
         self.y = 0.0
         self.z = 0.0
 
-        self.signal_connected = (
-            False  # So the first time the signal tries to discconnect it wont be able
-        )
+        self.dirty: set[str] = set()  # state fields changed since the last repaint
+
+        self.degrees_per_second = degrees_per_second
+        self.animation_duration = animation_duration
+        self.azimuth_speed = degrees_per_second
+        self.declination_speed = degrees_per_second
 
-        self.start_animation_timer()
+        self.clock = clock if clock is not None else AnimationClock(self)
+        self.clock.subscribe(self.__animate, owner=self)
+
+        self.perf = PerfStats()
+        self.perf_overlay = False
+        self.perf_timer = QTimer(self)  # the overlay shows the rates even when nothing animates
+        self.perf_timer.setInterval(500)
+        self.perf_timer.timeout.connect(self.update)
+        self.setFocusPolicy(Qt.FocusPolicy.StrongFocus)  # F3 toggles the overlay
+
+        self.resources: Optional[PaintResources] = None
+        self.dial_cache = dial_cache if dial_cache is not None else default_dial_cache()
+        self.static_pixmap: Optional[QPixmap] = None
+        self.layers = LayerCache(self.draw_layer)
+
+        self.bus = bus if bus is not None else default_bus()
+        rate = self.clock.frame_rate  # nothing is gained by receiving faster than repainting
+        self.subscriptions = [
+            self.bus.subscribe(Channel.ORIENTATION, self.__receive_orientation, rate, owner=self),
+            self.bus.subscribe(Channel.DECLINATION, self.__receive_declination, rate, owner=self),
+            self.bus.subscribe(Channel.ACCELERATION, self.__receive_acceleration, rate, owner=self),
+        ]
 
     def resizeEvent(self, event: QResizeEvent) -> None: # pylint: disable=invalid-name
         """
@@ -57,42 +409,77 @@ class Compass(QWidget):
         """
 
 
-        self.create_static_pixmap()
+        # the static pixmap is taken at the next paint, once for all the resize events of a drag
+        self.layers.set_bounds(QRect(QPoint(0, 0), self.layout_size()))
         super().resizeEvent(event)
 
-    def create_static_pixmap(self) -> None:
+    def layout_size(self) -> QSize:
+        """ The size the compass is laid out for; a widget of another size shows it scaled to fit. """
+        return self.size()
+
+    def layout_scale(self) -> float:
+        """ The scale the layout is drawn at, the largest that fits the widget. """
+        layout = self.layout_size()
+        return min(self.width() / layout.width(), self.height() / layout.height())
+
+    def create_static_pixmap(self, dpr: Optional[float] = None) -> None:
         """
         Create a black-outlined circle.
 
-        (offset slightly to the left of center)using the QPainter class.
+        (offset slightly to the left of center)using the QPainter class. The pixmap is taken from
+        the dial cache, it is drawn only for a size and pixel ratio not in the cache.
 
+        Args:
+            dpr (float): the device pixel ratio, the one of the widget if not supplied.
 
         Returns:
           Paints the circle on the left side of the widget.
         """
+        if dpr is None:
+            dpr = self.devicePixelRatioF()
+        self.static_pixmap = self.dial_cache.pixmap(self.layout_size(), dpr, self.render_static_pixmap)
+
+    def render_static_pixmap(self, size: QSize, dpr: float) -> QPixmap:
+        """
+        Draw the dial in a new pixmap at the physical resolution.
 
-        self.static_pixmap = QPixmap(self.size())
-        self.static_pixmap.fill(Qt.transparent)
+        Args:
+            size (QSize): the widget size in logical pixels.
+            dpr (float): the device pixel ratio; the pixmap has ``size * dpr`` pixels.
+        """
+        pixmap = QPixmap(size * dpr)
+        pixmap.setDevicePixelRatio(dpr)
+        pixmap.fill(Qt.transparent)
 
-        painter = QPainter(self.static_pixmap)
-        pen = QPen(Qt.PenStyle.SolidLine)
-        pen.setColor("black")
-        pen.setWidth(4)
-        painter.setPen(pen)
+        painter = QPainter(pixmap)
         painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        self.draw_dial(painter, size)
+        painter.end()
+        return pixmap
 
+    def dial_geometry(self, size: Optional[QSize] = None) -> tuple[QPointF, int]:
+        """ The center and the radius of the compass circle for a widget size, the layout one if not supplied. """
+        if size is None:
+            size = self.layout_size()
+        rect = QRect(QPoint(0, 0), size)
         # Offset for the circle to be to the left
         x_offset = 70
-        center = QPointF(self.rect().center().x() - x_offset, self.rect().center().y())
-        radius = min(self.width() - 2 * x_offset, self.height()) // 2 - 37
+        center = QPointF(rect.center().x() - x_offset, rect.center().y())
+        radius = min(size.width() - 2 * x_offset, size.height()) // 2 - 37
+        return center, radius
 
-        # Drawing on the pixmap
+    def draw_dial(self, painter: QPainter, size: Optional[QSize] = None) -> None:
+        """ Draw the static part: the black circle, the cardinal points and the inside lines. """
+        pen = QPen(Qt.PenStyle.SolidLine)
+        pen.setColor("black")
+        pen.setWidth(4)
+        painter.setPen(pen)
+
+        center, radius = self.dial_geometry(size)
         painter.drawEllipse(center, radius, radius)
         self.draw_cardinal_points(painter, center, radius)
         self.draw_lines(painter, center, radius)
 
-        painter.end()
-
     def paintEvent(self, _: QEvent) -> None: # pylint: disable=invalid-name
         """
         Draws as text the user values.
@@ -107,55 +494,232 @@ class Compass(QWidget):
 
 
         """
+        start = time.perf_counter()
         painter = QPainter(self)
         painter.setRenderHint(QPainter.RenderHint.Antialiasing)
 
+        layout = self.layout_size()
+        scale = self.layout_scale()
+        if layout != self.size() or scale != 1.0:  # scaled to fit and centered, on whole device pixels
+            dpr = device_pixel_ratio(painter)
+            painter.translate(
+                round((self.width() - layout.width() * scale) / 2 * dpr) / dpr,
+                round((self.height() - layout.height() * scale) / 2 * dpr) / dpr,
+            )
+            painter.scale(scale, scale)
+
+        dpr = device_pixel_ratio(painter)
+        self.create_static_pixmap(dpr)
         if self.static_pixmap:
             painter.drawPixmap(0, 0, self.static_pixmap)
 
-        x_offset = 70
-        center = QPointF(self.rect().center().x() - x_offset, self.rect().center().y())
-        radius = min(self.width() - 2 * x_offset, self.height()) // 2 - 37
-        self.draw_arrow(painter, center, radius)
+        self.draw_layers(painter, dpr)
+        if self.perf_overlay:
+            self.draw_perf_overlay(painter)
+        painter.end()
+        self.perf.record_paint(time.perf_counter() - start)
 
-        self.draw_red_line(painter, center, radius)
+    def set_perf_overlay(self, enabled: bool) -> None:
+        """
+        Show the performance counters under the values; they are refreshed twice a second.
 
-        font_size = max(12, self.width() // 80)
-        line_spacing = font_size
+        Args:
+            enabled (bool): show or hide the overlay.
+        """
+        if enabled == self.perf_overlay:
+            return
+        self.perf_overlay = enabled
+        if enabled:
+            self.clock.subscribe(self.perf.record_tick)
+            self.perf_timer.start()
+        else:
+            self.clock.unsubscribe(self.perf.record_tick)
+            self.perf_timer.stop()
+        self.update()
 
-        painter.setPen(QPen(Qt.black))
-        painter.setFont(QFont("Arial", font_size))
-        text_x = center.x() + radius + 47  # reduce the number to prevent capped text
-        text_y = center.y() - radius
+    def draw_perf_overlay(self, painter: QPainter) -> None:
+        """ Draw the performance counters below the acceleration in the information panel. """
+        resources = self.paint_resources()
+        painter.setPen(resources.perf_pen)
+        painter.setFont(resources.perf_font)
+        for number, line in enumerate(self.perf.lines()):
+            painter.drawStaticText(
+                resources.perf_positions[number],
+                resources.text(f"perf {number}", line, resources.perf_font),
+            )
+
+    def keyPressEvent(self, event: QKeyEvent) -> None:  # pylint: disable=invalid-name
+        if event.key() == Qt.Key.Key_F3:
+            self.set_perf_overlay(not self.perf_overlay)
+        else:
+            super().keyPressEvent(event)
+
+    def paint_resources(self) -> "PaintResources":
+        """ The pens, brushes, fonts and texts of the frame, created again when the size changes. """
+        size = self.layout_size()
+        if self.resources is None or self.resources.size != size:
+            center, radius = self.dial_geometry(size)
+            self.resources = PaintResources(size, center, radius, self.font())
+        return self.resources
+
+    def draw_state(self, painter: QPainter) -> None:
+        """
+        Draw the current state over the dial: the elevation arrow, the declination and azimuth
+        markers, the bank line and the values as text.
+
+        Args:
+            painter (QPainter): the painter of the widget or of an offscreen image.
+        """
+        for layer in LAYERS:
+            self.draw_layer(painter, layer)
+
+    def draw_layer(self, painter: QPainter, layer: str, text_bounds: bool = False) -> Optional[QRectF]:
+        """
+        Draw one layer of the state.
+
+        Args:
+            painter (QPainter): the painter.
+            layer (str): the layer name, one of ``LAYERS``.
+            text_bounds (bool): return the bounding rectangle of the texts drawn.
+
+        Return:
+            QRectF: the bounding rectangle of the texts drawn if requested, else None.
+        """
+        resources = self.paint_resources()
+        resources.text_bounds = QRectF() if text_bounds else None
+        center, radius = resources.center, resources.radius
+        painter.setFont(resources.label_font)
+        if layer == "elevation":
+            self.draw_elevation(painter, center, radius)
+        elif layer == "declination":
+            self.draw_rotating_magnetic_north(painter, center, radius, self.current_declination)
+        elif layer == "azimuth":
+            self.draw_azimuth(painter, center, radius, self.current_angle)
+        elif layer == "bank":
+            self.draw_red_line(painter, center, radius)
+        else:
+            self.draw_info(painter)
+        return resources.text_bounds
+
+    def draw_layers(self, painter: QPainter, dpr: float) -> None:
+        """
+        Draw the state from the layer cache, drawing again only the layers whose inputs changed.
 
-        test_pos = QPointF(text_x, text_y)
-        azimuth_pos = QPointF(text_x, text_y + 4 * line_spacing)
-        declination_pos = QPointF(text_x, text_y + 8 * line_spacing)
-        rotation_pos = QPointF(text_x, text_y + 12 * line_spacing)
-        inclination_pos = QPointF(text_x, text_y + 16 * line_spacing)
-        acceleration_pos = QPointF(text_x, text_y + 20 * line_spacing)
-        acceleration_vec_pos = QPointF(text_x, text_y + 22 * line_spacing)
-
-        if self.signal_connected:
-            signal_manager.data_signal.disconnect()  # Avoid duplicate connections
-            self.signal_connected = True
-        signal_manager.data_signal.connect(self.receive_acceleration)
-
-        painter.drawText(test_pos, "Information: ")
-        painter.drawText(azimuth_pos, f"Azimuth: {round(self.current_angle,2)} °")
-        painter.drawText(
-            declination_pos, f"Declination: {round(self.current_declination,2)} °"
+        Args:
+            painter (QPainter): the painter of the frame.
+            dpr (float): the device pixel ratio of the painter, see ``device_pixel_ratio``.
+        """
+        for layer in LAYERS:
+            self.layers.paint(painter, layer, LAYER_INPUTS[layer](self), dpr)
+
+    def draw_info(self, painter: QPainter) -> None:
+        """ Draw the values as text on the right side of the circle. """
+        resources = self.paint_resources()
+        painter.setPen(resources.text_pen)
+        painter.setFont(resources.info_font)
+        positions = resources.info_positions
+        resources.draw_text(painter, positions[0], resources.text("information", "Information: "))
+        resources.draw_text(
+            painter, positions[1], resources.value_text("azimuth", "Azimuth: {} °", (self.current_angle,), 2)
+        )
+        resources.draw_text(
+            painter,
+            positions[2],
+            resources.value_text("declination", "Declination: {} °", (self.current_declination,), 2),
+        )
+        resources.draw_text(painter, positions[3], resources.value_text("bank", "Bank: {} °", (self.rotation,), 2))
+        resources.draw_text(
+            painter, positions[4], resources.value_text("elevation", "Elevation: {} °", (self.elevation,), 2)
+        )
+        resources.draw_text(painter, positions[5], resources.text("acceleration", "Acceleration:"))
+        resources.draw_text(
+            painter,
+            positions[6],
+            resources.value_text("acceleration vector", "{}, {}, {}", (self.x, self.y, self.z)),
         )
-        painter.drawText(rotation_pos, f"Bank: {round(self.rotation,2)} °")
-        painter.drawText(inclination_pos, f"Elevation: {round(self.elevation,2)} °")
-        painter.drawText(acceleration_pos, "Acceleration:")
-        painter.drawText(acceleration_vec_pos, f"{self.x}, {self.y}, {self.z}")
 
     def receive_acceleration(self, x: float, y: float, z: float) -> None:
-        self.x = x
-        self.y = y
-        self.z = z
-        self.update()
+        self.apply_state({"x": x, "y": y, "z": z})
+
+    def __receive_acceleration(self, acceleration: Acceleration) -> None:
+        self.apply_state(acceleration._asdict())
+
+    def __receive_orientation(self, orientation: Orientation) -> None:
+        self.apply_state(orientation._asdict())
+
+    def __receive_declination(self, declination: Declination) -> None:
+        self.apply_state(declination._asdict())
+
+    def apply_state(self, changes: Optional[Mapping[str, float]] = None, **fields: float) -> None:
+        """
+        Apply several state changes at once, for example a whole sample.
+
+        The azimuth and declination become the new animation targets, the other fields are set
+        directly. Only the fields whose value changed are marked dirty, and one repaint is scheduled
+        for the next frame if any did; an identical state costs no repaint.
+
+        Args:
+            changes (Mapping): field name to value, the names are in ``STATE_FIELDS``.
+            fields: the same as keyword arguments.
+
+        Raises:
+            ValueError: If a field name is unknown.
+        """
+        values = dict(changes or {}, **fields)
+        unknown = set(values) - set(self.STATE_FIELDS)
+        if unknown:
+            raise ValueError(f"Unknown compass state fields: {', '.join(sorted(unknown))}")
+
+        changed = [field for field, value in values.items() if self.__changes(field, value)]
+        if not changed:
+            return
+        if "azimuth" in changed:
+            self.update_angle(values["azimuth"])
+        if "declination" in changed:
+            self.update_declination(values["declination"])
+        if "elevation" in changed:
+            self.elevation = values["elevation"]
+        if "bank" in changed:
+            self.rotation = values["bank"]
+        for axis in ("x", "y", "z"):
+            if axis in changed:
+                setattr(self, axis, values[axis])
+
+        self.__mark_dirty(*changed)
+
+    def __changes(self, field: str, value: float) -> bool:
+        """ Whether a value differs from the one the field was last set to, the target of the animated ones. """
+        if field == "azimuth":
+            return value % 360 != self.target_angle
+        if field == "declination":
+            return value % 360 != self.target_declination
+        if field == "bank":
+            return value != self.rotation
+        return value != getattr(self, field)
+
+    def show_state(self, changes: Optional[Mapping[str, float]] = None, **fields: float) -> None:
+        """
+        Jump to a state without animation; the azimuth and declination are set at their target.
+
+        Args:
+            changes (Mapping): field name to value, the names are in ``STATE_FIELDS``.
+            fields: the same as keyword arguments.
+
+        Raises:
+            ValueError: If a field name is unknown.
+        """
+        values = dict(changes or {}, **fields)
+        self.apply_state(values)
+        if "azimuth" in values and self.current_angle != self.target_angle:
+            self.current_angle = self.target_angle
+            self.__mark_dirty("azimuth")
+        if "declination" in values and self.current_declination != self.target_declination:
+            self.current_declination = self.target_declination
+            self.__mark_dirty("declination")
+
+    def __mark_dirty(self, *fields: str) -> None:
+        self.dirty.update(fields)
+        self.clock.start()  # the next frame repaints once for all the dirty fields
 
     def draw_cardinal_points(self, painter: QPainter, center: QPointF, radius: int) -> None:
         """
@@ -229,41 +793,33 @@ class Compass(QWidget):
 
 
         """
+        self.draw_elevation(painter, center, radius)
 
-        painter.setBrush(QBrush(Qt.red))
-        painter.setPen(QPen(Qt.red, 2))
+        self.draw_rotating_magnetic_north(
+            painter, center, radius, self.current_declination
+        )
+
+        self.draw_azimuth(painter, center, radius, self.current_angle)
+
+    def draw_elevation(self, painter: QPainter, center: QPointF, radius: int) -> None:
+        """ Draw the elevation arrow, its arc and its label. """
+        resources = self.paint_resources()
+        painter.setBrush(resources.red_brush)
+        painter.setPen(resources.red_pen)
 
-        triangle_size = 20
         arrow_distance = radius * 0.8
         angle_rad = -math.radians(self.elevation)
 
         triangle_x = center.x() + arrow_distance * math.cos(angle_rad)
         triangle_y = center.y() + arrow_distance * math.sin(angle_rad)
 
-        pen = QPen(Qt.red, 1, Qt.SolidLine)
-        pen2 = QPen(QColor("DarkBlue"), 1, Qt.DashLine)
-
-        painter.setPen(pen)
-
-        painter.drawLine(center.x(), center.y(), triangle_x, triangle_y)
-
-        floating_triangle = QPolygonF(
-            [
-                QPointF(-triangle_size / 2, triangle_size / 2),
-                QPointF(triangle_size / 2, triangle_size / 2),
-                QPointF(0, -triangle_size / 2),
-            ]
-        )
-
-        transform = QTransform()
-        transform.translate(triangle_x, triangle_y)
-        transform.rotate(90 - self.elevation)
+        painter.drawLine(QPointF(center.x(), center.y()), QPointF(triangle_x, triangle_y))
 
-        rotated_triangle = transform.map(floating_triangle)
-        painter.drawPolygon(rotated_triangle)
-
-        pen = QPen(Qt.black, 1, Qt.DashLine)
-        painter.setPen(pen)
+        painter.save()
+        painter.translate(triangle_x, triangle_y)
+        painter.rotate(90 - self.elevation)
+        painter.drawPolygon(resources.arrow_head)
+        painter.restore()
 
         arc2_radius = radius - 120
         rect2 = QRectF(
@@ -281,8 +837,6 @@ class Compass(QWidget):
         else:
             span_angle_incli = (self.elevation) * 16  # float datatype (implicit)
 
-        painter.resetTransform()
-
         mid_point_angel_incli = start_angle_incli + span_angle_incli / 2  # Inclination
         mid_angel_rad_incli = math.radians(mid_point_angel_incli / 16)
 
@@ -291,20 +845,12 @@ class Compass(QWidget):
         )  # Inclination
         midpoint_incli_y = center.y() - arc2_radius * math.sin(mid_angel_rad_incli)
 
-        label2 = "Elevation"
-
-        painter.setPen(pen2)
+        painter.setPen(resources.elevation_pen)
         painter.drawArc(rect2, int(start_angle_incli), int(span_angle_incli))
-        painter.drawText(
-            QPointF(midpoint_incli_x + 11, midpoint_incli_y - 10), label2
+        resources.draw_label(
+            painter, "Elevation", midpoint_incli_x + 11, midpoint_incli_y - 10
         )  # Inclination
 
-        self.draw_rotating_magnetic_north(
-            painter, center, radius, self.current_declination
-        )
-
-        self.draw_azimuth(painter, center, radius, self.current_angle)
-
     def draw_rotating_magnetic_north(
         self,
         painter: QPainter,
@@ -318,11 +864,9 @@ class Compass(QWidget):
         args:
             declination (float): The magnetic declination in degrees.
         """
-
-        dark_red = QColor(124, 10, 2)
-
-        painter.setBrush(dark_red)
-        painter.setPen(QPen(dark_red, 2))
+        resources = self.paint_resources()
+        painter.setBrush(resources.declination_brush)
+        painter.setPen(resources.declination_pen)
 
         final_angle = declination % 360
         rad_angle = math.radians(final_angle - 90)  # -90 to align correctly
@@ -330,21 +874,9 @@ class Compass(QWidget):
         marker_x = center.x() + (radius + 25) * math.cos(rad_angle)
         marker_y = center.y() + (radius + 25) * math.sin(rad_angle)
 
-        marker_size = 10
-        magnetic_marker = QPolygonF(
-            [
-                QPointF(marker_x - marker_size / 2, marker_y),
-                QPointF(marker_x + marker_size / 2, marker_y),
-                QPointF(marker_x, marker_y - marker_size),
-            ]
-        )
-
-        painter.drawPolygon(magnetic_marker)
+        resources.draw_marker(painter, marker_x, marker_y)
 
-        painter.resetTransform()
-
-        pen = QPen(dark_red, 1, Qt.DashLine)
-        painter.setPen(pen)
+        painter.setPen(resources.declination_arc_pen)
 
         arc_radius = radius + 25
 
@@ -367,15 +899,13 @@ class Compass(QWidget):
         mid_point_x = center.x() + arc_radius * math.cos(angel_rad)
         mid_point_y = center.y() - arc_radius * math.sin(angel_rad)
 
-        label = "Declination"
-
         if self.current_declination < 180:  # each side has different alignment
-            painter.drawText(
-                QPointF(mid_point_x + 50, mid_point_y + 1), label
+            resources.draw_label(
+                painter, "Declination", mid_point_x + 50, mid_point_y + 1
             )  # +7 so it is not touching with the arc
         else:
-            painter.drawText(
-                QPointF(mid_point_x - 100, mid_point_y), label
+            resources.draw_label(
+                painter, "Declination", mid_point_x - 100, mid_point_y
             )  # -90 so it is not touching the circle
 
     def draw_azimuth(
@@ -394,11 +924,9 @@ class Compass(QWidget):
             radius: Radius of the compass circle.
             compass_angle: Current compass angle in degrees.
         """
-
-        dark_green = QColor(87, 108, 67)
-
-        painter.setBrush(dark_green)
-        painter.setPen(QPen(dark_green, 2))
+        resources = self.paint_resources()
+        painter.setBrush(resources.azimuth_brush)
+        painter.setPen(resources.azimuth_pen)
 
         final_angle = compass_angle % 360
         rad_angle = math.radians(final_angle - 90)  # -90 to align correctly
@@ -406,21 +934,9 @@ class Compass(QWidget):
         marker_x = center.x() + (radius - 20) * math.cos(rad_angle)
         marker_y = center.y() + (radius - 20) * math.sin(rad_angle)
 
-        marker_size = 10
-        magnetic_marker = QPolygonF(
-            [
-                QPointF(marker_x - marker_size / 2, marker_y),
-                QPointF(marker_x + marker_size / 2, marker_y),
-                QPointF(marker_x, marker_y - marker_size),
-            ]
-        )
-
-        painter.drawPolygon(magnetic_marker)
+        resources.draw_marker(painter, marker_x, marker_y)
 
-        painter.resetTransform()
-
-        pen = QPen(dark_green, 1, Qt.DashLine)
-        painter.setPen(pen)
+        painter.setPen(resources.azimuth_arc_pen)
 
         arc_radius = radius - 20
 
@@ -443,71 +959,86 @@ class Compass(QWidget):
         mid_point_x = center.x() + arc_radius * math.cos(angel_rad)
         mid_point_y = center.y() - arc_radius * math.sin(angel_rad)
 
-        label = "Azimuth"
-
         if self.current_angle == 0:  # each side has different alignment
-            painter.drawText(QPointF(mid_point_x + 12, mid_point_y + 22), label)
+            resources.draw_label(painter, "Azimuth", mid_point_x + 12, mid_point_y + 22)
         elif self.current_angle < 180:  # each side has different alignment
-            painter.drawText(QPointF(mid_point_x - 25, mid_point_y + 25), label)
+            resources.draw_label(painter, "Azimuth", mid_point_x - 25, mid_point_y + 25)
         else:
-            painter.drawText(QPointF(mid_point_x - 10, mid_point_y + 25), label)
-
-    def start_animation_timer(self) -> None:
-        """ This method initializes and starts the timer.
-        based animations for smoothly updating the azimuth (compass heading) and declination (magnetic deviation) angles
+            resources.draw_label(painter, "Azimuth", mid_point_x - 10, mid_point_y + 25)
+
+    def set_animation_speed(self, degrees_per_second: float) -> None:
+        """ Animate the azimuth and declination at a constant speed in degrees per second. """
+        self.degrees_per_second = degrees_per_second
+        self.animation_duration = None
+        self.azimuth_speed = degrees_per_second
+        self.declination_speed = degrees_per_second
+
+    def set_animation_duration(self, seconds: Optional[float]) -> None:
+        """ Animate every azimuth and declination change in the given seconds, None for constant speed. """
+        self.animation_duration = seconds
+        if seconds is None:
+            self.set_animation_speed(self.degrees_per_second)
+
+    def __channel_speed(self, current: float, target: float) -> float:
+        if self.animation_duration is None:
+            return self.degrees_per_second
+        if self.animation_duration <= 0:
+            return math.inf
+        return angle_distance(current, target) / self.animation_duration
+
+    def __animate(self, seconds: float) -> bool:
         """
+        Advance the azimuth and declination animations by the elapsed time of one frame and
+        repaint once if anything changed since the last frame.
 
-        self.azimuth_timer = QTimer(self)
-        self.azimuth_timer.timeout.connect(self.__rotate_angle)
-        self.azimuth_timer.start(1)  # Adjust the speed of azimuth animation
-
-        self.declination_timer = QTimer(self)
-        self.declination_timer.timeout.connect(self.__animate_declination)
-        self.declination_timer.start(2)  #  Adjust the speed of declination animation
-
-    def __rotate_angle(self) -> None:
-        if self.current_angle != self.target_angle:
-            diff = round(self.target_angle - self.current_angle, 2)  # Here is for the azimuth
-            step = 0.1 if diff > 0 else -0.1
-
-            if abs(diff) > 180:
-                step *= -1
-
-            if abs(diff) < 0.2:
-                self.current_angle = self.target_angle
-            else:
-                self.current_angle = (self.current_angle + step) % 360
+        Return:
+            bool: True while one of them has not reached its target.
+        """
+        if self.__rotate_angle(seconds):
+            self.dirty.add("azimuth")
+        if self.__animate_declination(seconds):
+            self.dirty.add("declination")
+        if self.dirty:
             self.update()
+            self.dirty.clear()
+        return (
+            self.current_angle != self.target_angle
+            or self.current_declination != self.target_declination
+        )
+
+    def __rotate_angle(self, seconds: float) -> bool:
+        if self.current_angle == self.target_angle:
+            return False
+        self.current_angle = approach_angle(
+            self.current_angle, self.target_angle, self.azimuth_speed * seconds
+        )
+        return True
 
     def update_angle(self, target_angle: float) -> None:
         self.target_angle = target_angle % 360
+        self.azimuth_speed = self.__channel_speed(self.current_angle, self.target_angle)
+        self.clock.start()
 
     def update_declination(self, target_declination: float) -> None:
         self.target_declination = target_declination % 360
+        self.declination_speed = self.__channel_speed(
+            self.current_declination, self.target_declination
+        )
+        self.clock.start()
 
-    def __animate_declination(self) -> None:
-        if self.current_declination != self.target_declination:
-            diff = round(
-                self.target_declination - self.current_declination, 2
-            )  # Iso : float here stick to to decimal place as a diff result
-            step = 0.1 if diff > 0 else -0.1
-
-            if abs(diff) > 180:
-                step *= -1
-
-            if abs(diff) < 0.2:
-                self.current_declination = self.target_declination
-            else:
-                self.current_declination = (self.current_declination + step) % 360
-            self.update()
+    def __animate_declination(self, seconds: float) -> bool:
+        if self.current_declination == self.target_declination:
+            return False
+        self.current_declination = approach_angle(
+            self.current_declination, self.target_declination, self.declination_speed * seconds
+        )
+        return True
 
     def set_elevation(self, elevation: float) -> None:
-        self.elevation = elevation
-        self.update()
+        self.apply_state(elevation=elevation)
 
     def set_rotation(self, rotation: float) -> None:
-        self.rotation = rotation
-        self.update()
+        self.apply_state(bank=rotation)
 
     def draw_red_line(self, painter: QPainter, center: QPointF, radius: int) -> None:
         """
@@ -522,21 +1053,18 @@ class Compass(QWidget):
             radius (int): The radius of the compass circle, determines the size and position of the drawn elements.
 
         """
-        painter.setPen(QPen(Qt.red, 2))
-
-        line_length = radius * 2
-        transform = QTransform()
-        transform.translate(center.x(), center.y())
-        transform.rotate(-self.rotation)
-
-        line_start = QPointF(-line_length / 2, 0)
-        line_end = QPointF(line_length / 2, 0)
-        transformed_line = transform.map(QPolygonF([line_start, line_end]))
+        resources = self.paint_resources()
+        painter.setPen(resources.red_wide_pen)
 
-        painter.drawLine(transformed_line[0], transformed_line[1])
+        # the line across the circle rotated by the bank, counterclockwise on the screen
+        half_x = radius * math.cos(math.radians(self.rotation))
+        half_y = -radius * math.sin(math.radians(self.rotation))
+        painter.drawLine(
+            QPointF(center.x() - half_x, center.y() - half_y),
+            QPointF(center.x() + half_x, center.y() + half_y),
+        )
 
-        pen = QPen(Qt.black, 1, Qt.DashLine)
-        painter.setPen(pen)
+        painter.setPen(resources.bank_arc_pen)
 
         arc_radius = radius - 40  # -40 so it is not touching the circle
 
@@ -559,7 +1087,6 @@ class Compass(QWidget):
         )  # offset to the right 10 so it is not touching the arc
         midpoint_y = center.y() - arc_radius * math.sin(mid_angel_rad)
 
-        label = "Bank"
-        painter.drawText(
-            QPointF(midpoint_x, midpoint_y - 2), label
+        resources.draw_label(
+            painter, "Bank", midpoint_x, midpoint_y - 2
         )  # -2 so it is not touching line at 0 angle
@@ -0,0 +1,6 @@
+"""Application constants shared by the command line and the views; importing them loads no Qt"""
+
+RENDERERS = ("matplotlib", "qpainter")  # the acceleration view renderers
+REPLAY_SPEED_RANGE = (0.1, 100.0)  # the slowest and fastest replay speeds
+SIMULATOR_RATE_RANGE = (1.0, 10000.0)  # the slowest and fastest simulated sample rates in Hz
+SIMULATOR_DECLINATION = 10.5  # the declination of the simulated samples in degrees, when no position is given
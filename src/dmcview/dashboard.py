@@ -0,0 +1,258 @@
+"""Fleet dashboard: one window with a compact compass tile per unit"""
+
+import math
+from collections.abc import Sequence
+from typing import Optional, Union
+
+import numpy as np
+from PySide6.QtCore import QEvent, QSize, Qt, QThreadPool, SignalInstance
+from PySide6.QtGui import QResizeEvent
+from PySide6.QtWidgets import QApplication, QGridLayout, QLabel, QVBoxLayout, QWidget
+
+from dmcview.animation import AnimationClock
+from dmcview.compass import Compass, PixmapCache
+from dmcview.decimation import FrameDecimator, FrameSummary
+from dmcview.device_parser import get_parser
+from dmcview.serial_reader import SerialReaderRunner
+from dmcview.simulator import FleetSimulatorRunner
+from dmcview.telemetry import TelemetryBus
+
+TILE_LAYOUT_SIZE = QSize(600, 420)  # the tiles are the compass laid out at its minimum size, scaled
+TILE_MINIMUM_SIZE = QSize(150, 105)  # a quarter of the layout
+TILE_SIZE_HINT = QSize(300, 210)  # half of the layout
+
+
+class TileScale:
+    """
+    The one scale the compass tiles of a grid are drawn at.
+
+    The cells of a grid layout differ by a pixel, enough to give each tile one of up to four scales
+    and the dial cache as many pixmaps. Drawn at the smallest scale of the grid, the tiles all blit
+    one dial pixmap per device pixel ratio.
+    """
+    def __init__(self) -> None:
+        self.tiles: list[CompassTile] = []
+        self.scale: Optional[float] = None
+
+    def invalidate(self) -> None:
+        """ Compute the scale again at the next paint, a tile was resized. """
+        self.scale = None
+
+    def value(self) -> float:
+        if self.scale is None:
+            width = min(tile.width() for tile in self.tiles)
+            height = min(tile.height() for tile in self.tiles)
+            self.scale = min(width / TILE_LAYOUT_SIZE.width(), height / TILE_LAYOUT_SIZE.height())
+        return self.scale
+
+
+class CompassTile(Compass):
+    """
+    A compass laid out at the size of the single unit view and drawn scaled to fit its tile.
+
+    The layout, the fonts and the static pixmap key do not depend on the tile size, and the tiles
+    of a grid are drawn at the scale they share, so they share their dial pixmaps.
+
+    Args:
+        clock (AnimationClock): The frame clock shared by the tiles.
+        dial_cache (PixmapCache): The dial pixmaps shared by the tiles.
+        scale (TileScale): The scale shared by the tiles; the tile fits its own size if not supplied.
+    """
+    def __init__(self, clock: AnimationClock, dial_cache: PixmapCache, scale: Optional[TileScale] = None) -> None:
+        super().__init__(clock=clock, bus=TelemetryBus(), dial_cache=dial_cache)
+        self.setMinimumSize(TILE_MINIMUM_SIZE)
+        self.shared_scale = scale
+        if scale is not None:
+            scale.tiles.append(self)
+
+    def resizeEvent(self, event: QResizeEvent) -> None:  # pylint: disable=invalid-name
+        if self.shared_scale is not None:
+            self.shared_scale.invalidate()
+        super().resizeEvent(event)
+
+    def layout_size(self) -> QSize:
+        return TILE_LAYOUT_SIZE
+
+    def layout_scale(self) -> float:
+        return self.shared_scale.value() if self.shared_scale is not None else super().layout_scale()
+
+    def sizeHint(self) -> QSize:  # pylint: disable=invalid-name
+        return TILE_SIZE_HINT
+
+
+class UnitTile(QWidget):
+    """
+    The name and the compass of one unit; its samples are decimated to one summary per frame.
+
+    Args:
+        name (str): The unit name, for example its serial port.
+        clock (AnimationClock): The frame clock shared by the tiles.
+        dial_cache (PixmapCache): The dial pixmaps shared by the tiles.
+        scale (TileScale): The scale shared by the tiles.
+    """
+    def __init__(
+        self, name: str, clock: AnimationClock, dial_cache: PixmapCache, scale: Optional[TileScale] = None
+    ) -> None:
+        super().__init__()
+        self.name = name
+        self.title = QLabel(name)
+        self.compass = CompassTile(clock, dial_cache, scale)
+        self.decimator = FrameDecimator(clock, self)
+        self.decimator.frame.connect(self.show_frame)
+
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(2, 2, 2, 2)
+        layout.setSpacing(0)
+        layout.addWidget(self.title)
+        layout.addWidget(self.compass, 1)
+
+    def show_samples(self, samples: np.ndarray) -> None:
+        """
+        Show the newest sample of the batch; the compass repaints at the next frame of the clock.
+
+        Args:
+            samples (np.ndarray): decoded samples of ``SAMPLE_DTYPE`` in arrival order.
+        """
+        if len(samples) == 0:
+            return
+        self.show_sample(samples[-1])
+
+    def show_frame(self, summary: FrameSummary) -> None:
+        """ Show the newest sample of the samples received during a frame. """
+        self.show_sample(summary.last)
+
+    def show_sample(self, sample: np.void) -> None:
+        """ Apply one ``SAMPLE_DTYPE`` record to the compass; a tile whose state is unchanged is not repainted. """
+        self.compass.apply_state(
+            azimuth=float(sample["azimuth"]),
+            declination=float(sample["declination"]),
+            elevation=float(sample["elevation"]),
+            bank=float(sample["bank"]),
+            x=round(float(sample["x"]), 1),
+            y=round(float(sample["y"]), 1),
+            z=round(float(sample["z"]), 1),
+        )
+
+    def show_error(self, message: str) -> None:
+        self.title.setText(f"{self.name}: {message}")
+
+
+class Dashboard(QWidget):
+    """
+    A grid of compact compass tiles, one per unit, in one window.
+
+    All the tiles are animated by one shared frame clock and draw their dial at one shared scale
+    from one shared pixmap cache. A tile is repainted only in the frames where its state changed, and the window
+    paints the changed tiles together.
+
+    Args:
+        names (Sequence[str]): The unit names, one tile each.
+        columns (int): The tiles per row; a grid about as wide as high if not supplied.
+        frame_rate (float): Frames per second of the shared clock; the display refresh rate if not supplied.
+
+    Raises:
+        ValueError: If there is no unit or columns is not positive.
+    """
+    def __init__(
+        self, names: Sequence[str], columns: Optional[int] = None, frame_rate: Optional[float] = None
+    ) -> None:
+        super().__init__()
+        if not names:
+            raise ValueError("The dashboard needs at least one unit")
+        if columns is None:
+            columns = math.ceil(math.sqrt(len(names)))
+        if columns <= 0:
+            raise ValueError("The dashboard columns must be positive")
+
+        self.clock = AnimationClock(self, frame_rate)
+        self.tile_scale = TileScale()
+        self.dial_cache = PixmapCache(capacity=2)  # one scale; two pixel ratios while moved between screens
+        self.tiles = [UnitTile(name, self.clock, self.dial_cache, self.tile_scale) for name in names]
+
+        grid = QGridLayout(self)
+        grid.setSpacing(4)
+        for number, tile in enumerate(self.tiles):
+            grid.addWidget(tile, number // columns, number % columns)
+
+        self.setWindowTitle(f"DMC View - {len(names)} units")
+
+    def connect_source(self, unit: int, samples: SignalInstance, error: Optional[SignalInstance] = None) -> None:
+        """
+        Show the batches of a source running on another thread in the tile of a unit.
+
+        The batches are queued under the lock of the decimator on the thread of the source; the clock
+        tick on the GUI thread takes the queue and summarizes it, the tile receives one summary per
+        frame.
+
+        Args:
+            unit (int): The tile number.
+            samples (SignalInstance): the signal of the source emitting ``SAMPLE_DTYPE`` batches.
+            error (SignalInstance): the signal of the source emitting error messages.
+        """
+        tile = self.tiles[unit]
+        samples.connect(tile.decimator.add, Qt.ConnectionType.DirectConnection)
+        if error is not None:
+            error.connect(tile.show_error, Qt.ConnectionType.QueuedConnection)
+
+
+class FleetViewer(Dashboard):
+    """
+    This class represents the main GUI when many units are monitored at once.
+
+    Each serial unit is read by its own worker thread; the simulated units share one thread.
+
+    Args:
+        ports (Sequence[str]): The serial ports of the units.
+        manufacturer (str): The registered device manufacturer parser name, the same for all.
+        baudrate (int): The serial speed; the parser default is used when not supplied.
+        simulate (int): The simulated units, after the serial ones.
+        rate (float): Samples per second of each simulated unit.
+        columns (int): The tiles per row.
+    """
+    def __init__(
+        self,
+        ports: Sequence[str] = (),
+        manufacturer: str = "generic",
+        baudrate: Optional[int] = None,
+        simulate: int = 0,
+        rate: float = 50.0,
+        columns: Optional[int] = None,
+    ) -> None:
+        names = list(ports) + [f"Simulator {number + 1}" for number in range(simulate)]
+        super().__init__(names, columns)
+
+        self.runners: list[Union[SerialReaderRunner, FleetSimulatorRunner]] = []
+        for number, port in enumerate(ports):
+            reader = SerialReaderRunner(port, get_parser(manufacturer), baudrate)
+            self.connect_source(number, reader.signal.samples, reader.signal.error)
+            self.runners.append(reader)
+        if simulate > 0:
+            simulator = FleetSimulatorRunner(simulate, rate)
+            for number, unit in enumerate(simulator.units):
+                self.connect_source(len(ports) + number, unit.signal.batch)
+            self.runners.append(simulator)
+
+        self.thread_pool = QThreadPool()
+        self.thread_pool.setMaxThreadCount(len(self.runners))  # every reader blocks its own thread
+        for runner in self.runners:
+            self.thread_pool.start(runner)
+
+    def closeEvent(self, event: QEvent) -> None:  # pylint: disable=invalid-name
+        for runner in self.runners:
+            runner.stop()
+        self.thread_pool.waitForDone()
+        event.accept()
+
+
+def start_dashboard(
+    ports: Sequence[str] = (),
+    manufacturer: str = "generic",
+    baudrate: Optional[int] = None,
+    simulate: int = 0,
+    rate: float = 50.0,
+    columns: Optional[int] = None,
+) -> None:
+    app = QApplication()
+    viewer = FleetViewer(ports, manufacturer, baudrate, simulate, rate, columns)
+    viewer.show()
+    app.exec()
@@ -0,0 +1,133 @@
+"""Per frame decimation of the sample streams between the data sources and the views"""
+
+import threading
+from typing import NamedTuple, Optional
+
+import numpy as np
+from PySide6.QtCore import QObject, Qt, Signal
+
+from dmcview.animation import AnimationClock
+from dmcview.device_parser import SAMPLE_DTYPE, SAMPLE_FIELDS
+from dmcview.history import SampleHistory
+
+CIRCULAR_FIELDS = ("azimuth", "bank", "declination")  # angles averaged on the circle
+CIRCULAR_COLUMNS = np.array([SAMPLE_FIELDS.index(field) for field in CIRCULAR_FIELDS])
+
+
+class FrameSummary(NamedTuple):
+    """
+    The samples received during one display frame.
+
+    Each summary value is a ``SAMPLE_DTYPE`` record. The angles of ``CIRCULAR_FIELDS`` are averaged
+    on the circle and their envelope is measured from that mean, so it is continuous across 0 and
+    ``low <= mean <= high`` may leave the [0, 360) range, for example 358 to 362 degrees.
+    """
+    samples: int
+    last: np.void
+    mean: np.void
+    low: np.void
+    high: np.void
+
+
+def wrap_degrees(degrees: np.ndarray) -> np.ndarray:
+    """ Angles wrapped to [-180, 180). """
+    return (degrees + 180.0) % 360.0 - 180.0
+
+
+def summarize(samples: np.ndarray) -> FrameSummary:
+    """
+    Summarize a block of samples by its newest sample, its mean and its min/max envelope.
+
+    Args:
+        samples (np.ndarray): samples of ``SAMPLE_DTYPE`` in arrival order, at least one.
+
+    Return:
+        FrameSummary: the summary of the block.
+
+    Raises:
+        ValueError: If there is no sample.
+    """
+    if len(samples) == 0:
+        raise ValueError("Can not summarize an empty block of samples")
+    # every field is a float64, the records are viewed as the rows of a matrix without a copy
+    values = np.ascontiguousarray(samples, dtype=SAMPLE_DTYPE).view(np.float64).reshape(len(samples), -1)
+    records = np.empty(4, dtype=SAMPLE_DTYPE)
+    rows = records.view(np.float64).reshape(4, -1)
+    rows[0] = values[-1]
+    if len(values) == 1:
+        rows[1:] = values[-1]
+    else:
+        rows[1] = values.sum(axis=0) / len(values)
+        rows[2] = values.min(axis=0)
+        rows[3] = values.max(axis=0)
+
+        angles = values[:, CIRCULAR_COLUMNS]
+        mean = np.angle(np.exp(1j * np.radians(angles)).sum(axis=0), deg=True)  # of the unit vectors
+        last = rows[0, CIRCULAR_COLUMNS]
+        mean = last + wrap_degrees(mean - last)  # on the same turn as the newest sample
+        deviations = wrap_degrees(angles - mean)
+        rows[1, CIRCULAR_COLUMNS] = mean
+        rows[2, CIRCULAR_COLUMNS] = mean + deviations.min(axis=0)
+        rows[3, CIRCULAR_COLUMNS] = mean + deviations.max(axis=0)
+
+    return FrameSummary(len(values), records[0], records[1], records[2], records[3])
+
+
+class FrameDecimator(QObject):
+    """
+    Collect the samples of a source and pass one summary per frame of the animation clock.
+
+    :meth:`add` can be called from any thread, typically connected directly to the samples signal
+    of a reader, so the event loop of the views receives one event per frame whatever the input
+    rate. The clock is woken up when samples arrive and stops once a frame receives none.
+
+    Every sample of a frame is appended to the history, if any, on the thread of the decimator so
+    the views can read its windows without a lock.
+
+    Args:
+        clock (AnimationClock): The frame clock of the views.
+        history (SampleHistory): The history receiving every sample.
+    """
+    frame = Signal(object)  # FrameSummary of the samples received since the previous frame
+    _wake = Signal()
+
+    def __init__(
+        self, clock: AnimationClock, parent: Optional[QObject] = None, history: Optional[SampleHistory] = None
+    ) -> None:
+        super().__init__(parent)
+        self.clock = clock
+        self.history = history
+        self.lock = threading.Lock()
+        self.pending: list[np.ndarray] = []
+        self.scheduled = False
+        self._wake.connect(self.clock.start, Qt.ConnectionType.QueuedConnection)
+        self.clock.subscribe(self.__tick, owner=self, first=True)  # the views show it in the same frame
+
+    def add(self, samples: np.ndarray) -> None:
+        """ Queue a batch of ``SAMPLE_DTYPE`` samples for the next frame. """
+        if len(samples) == 0:
+            return
+        with self.lock:
+            self.pending.append(samples)
+            wake = not self.scheduled
+            self.scheduled = True
+        if wake:
+            self._wake.emit()
+
+    def flush(self) -> Optional[FrameSummary]:
+        """ Emit the summary of the queued samples now; None if there is none. """
+        with self.lock:
+            batches = self.pending
+            self.pending = []
+            self.scheduled = False
+        if not batches:
+            return None
+        samples = batches[0] if len(batches) == 1 else np.concatenate(batches)
+        if self.history is not None:
+            self.history.append(samples)
+        summary = summarize(samples)
+        self.frame.emit(summary)
+        return summary
+
+    def __tick(self, _: float) -> bool:
+        return self.flush() is not None
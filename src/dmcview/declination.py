@@ -0,0 +1,252 @@
+"""
+Magnetic declination from the World Magnetic Model.
+
+The model coefficients of the NOAA/BGS World Magnetic Model are bundled as ``WMM.COF``, so the
+declination is known anywhere without a network. The exact evaluation sums the spherical harmonics
+of the model, about a hundred terms per point; a :class:`DeclinationGrid` evaluates them once over
+the globe and then answers each lookup by a bilinear interpolation, in constant time.
+"""
+
+import datetime
+import functools
+import importlib.resources
+from pathlib import Path
+from typing import NamedTuple, Optional, Union
+
+import numpy as np
+
+WGS84_A = 6378.137  # km, the semi-major axis of the WGS 84 ellipsoid
+WGS84_E2 = 1 / 298.257223563 * (2 - 1 / 298.257223563)  # the squared eccentricity
+WMM_RADIUS = 6371.2  # km, the reference radius of the model
+VALIDITY_YEARS = 5.0  # a model is published for five years from its epoch
+CAUTION_FIELD = 6000.0  # nT, below this horizontal field the compass is unreliable and the grid is not used
+
+Number = Union[float, np.ndarray]
+
+
+def decimal_year(when: Union[datetime.date, datetime.datetime]) -> float:
+    """ The date as a year with a fraction, for example 2025.5 in the middle of 2025. """
+    start = datetime.date(when.year, 1, 1)
+    days = (datetime.date(when.year + 1, 1, 1) - start).days
+    elapsed = (when.toordinal() - start.toordinal()) * 86400.0
+    if isinstance(when, datetime.datetime):
+        elapsed += when.hour * 3600.0 + when.minute * 60.0 + when.second
+    return when.year + elapsed / (days * 86400.0)
+
+
+class FieldComponents(NamedTuple):
+    """ The magnetic field in nT: north, east and down components, arrays of the point shape. """
+    north: np.ndarray
+    east: np.ndarray
+    down: np.ndarray
+
+
+class MagneticModel:
+    """
+    A spherical harmonic model of the main field of the earth and of its secular variation.
+
+    Args:
+        epoch (float): The decimal year of the coefficients.
+        name (str): The model name, for example WMM-2025.
+        coefficients (np.ndarray): Rows of ``n, m, g, h, g rate, h rate`` in nT and nT per year.
+    """
+    def __init__(self, epoch: float, name: str, coefficients: np.ndarray) -> None:
+        self.epoch = epoch
+        self.name = name
+        self.degree = int(coefficients[:, 0].max())
+        size = self.degree + 1
+        self.g, self.h, self.g_rate, self.h_rate = (np.zeros((size, size)) for _ in range(4))
+        n, m = coefficients[:, 0].astype(int), coefficients[:, 1].astype(int)
+        self.g[n, m], self.h[n, m], self.g_rate[n, m], self.h_rate[n, m] = coefficients[:, 2:6].T
+
+    @property
+    def valid_until(self) -> float:
+        return self.epoch + VALIDITY_YEARS
+
+    def field(self, latitude: Number, longitude: Number, year: Number, altitude: Number = 0.0) -> FieldComponents:
+        """
+        Evaluate the model exactly.
+
+        Args:
+            latitude (float | np.ndarray): The geodetic latitude in degrees.
+            longitude (float | np.ndarray): The longitude in degrees.
+            year (float | np.ndarray): The decimal year, see :func:`decimal_year`.
+            altitude (float | np.ndarray): The height above the WGS 84 ellipsoid in km.
+
+        Return:
+            FieldComponents: The field in the geodetic frame, of the broadcast shape of the arguments.
+        """
+        latitude, longitude, year, altitude = np.broadcast_arrays(
+            *(np.asarray(value, dtype=np.float64) for value in (latitude, longitude, year, altitude))
+        )
+        phi, lam = np.radians(latitude), np.radians(longitude)
+
+        # geodetic to geocentric spherical coordinates
+        sin_phi = np.sin(phi)
+        curvature = WGS84_A / np.sqrt(1.0 - WGS84_E2 * sin_phi**2)
+        p = (curvature + altitude) * np.cos(phi)
+        z = (curvature * (1.0 - WGS84_E2) + altitude) * sin_phi
+        r = np.hypot(p, z)
+        x = z / r  # the sine of the geocentric latitude, the cosine of the colatitude
+        s = np.maximum(p / r, 1e-12)  # its cosine, kept positive so the terms / s have their limit at the poles
+
+        dt = year - self.epoch
+        ratio = WMM_RADIUS / r
+        cos_m = [np.ones_like(lam)] + [np.cos(m * lam) for m in range(1, self.degree + 1)]
+        sin_m = [np.zeros_like(lam)] + [np.sin(m * lam) for m in range(1, self.degree + 1)]
+
+        # Schmidt semi-normalized associated Legendre functions of the colatitude and their derivatives
+        legendre = {(0, 0): np.ones_like(x)}
+        derivative = {(0, 0): np.zeros_like(x)}
+        north = np.zeros_like(x)
+        east = np.zeros_like(x)
+        down = np.zeros_like(x)
+        power = ratio**2
+        for n in range(1, self.degree + 1):
+            power = power * ratio  # (a / r) ** (n + 2)
+            for m in range(n + 1):
+                if n == m:
+                    factor = np.sqrt((2 * n - 1) / (2 * n)) if n > 1 else 1.0
+                    legendre[n, m] = factor * s * legendre[n - 1, m - 1]
+                    derivative[n, m] = factor * (x * legendre[n - 1, m - 1] + s * derivative[n - 1, m - 1])
+                else:
+                    back = np.sqrt((n - 1) ** 2 - m**2)
+                    norm = np.sqrt(n**2 - m**2)
+                    previous = legendre.get((n - 2, m), 0.0)
+                    previous_derivative = derivative.get((n - 2, m), 0.0)
+                    legendre[n, m] = ((2 * n - 1) * x * legendre[n - 1, m] - back * previous) / norm
+                    derivative[n, m] = (
+                        (2 * n - 1) * (x * derivative[n - 1, m] - s * legendre[n - 1, m]) - back * previous_derivative
+                    ) / norm
+
+                g = self.g[n, m] + dt * self.g_rate[n, m]
+                h = self.h[n, m] + dt * self.h_rate[n, m]
+                cosine = g * cos_m[m] + h * sin_m[m]
+                north += power * cosine * derivative[n, m]
+                east += power * m * (g * sin_m[m] - h * cos_m[m]) * legendre[n, m]
+                down -= power * (n + 1) * cosine * legendre[n, m]
+        east /= s
+
+        # back from the geocentric to the geodetic frame
+        tilt = np.arcsin(x) - phi
+        return FieldComponents(
+            north * np.cos(tilt) - down * np.sin(tilt), east, north * np.sin(tilt) + down * np.cos(tilt)
+        )
+
+    def declination(self, latitude: Number, longitude: Number, year: Number, altitude: Number = 0.0) -> np.ndarray:
+        """ The declination in degrees, east positive, evaluated exactly; see :meth:`field`. """
+        north, east, _ = self.field(latitude, longitude, year, altitude)
+        return np.degrees(np.arctan2(east, north))
+
+
+def read_model(path: Union[str, Path]) -> MagneticModel:
+    """
+    Read a model coefficient file in the ``.COF`` format of the WMM.
+
+    Raises:
+        ValueError: If the file is not a coefficient file.
+    """
+    with open(path, encoding="ascii") as file:
+        header = file.readline().split()
+        lines = [line.split() for line in file]
+    try:
+        epoch = float(header[0])
+        rows = [[float(value) for value in line] for line in lines if line and not line[0].startswith("9999")]
+        coefficients = np.array(rows, dtype=np.float64).reshape(-1, 6)
+    except (ValueError, IndexError):
+        raise ValueError(f"{path} is not a magnetic model coefficient file")
+    if len(coefficients) == 0:
+        raise ValueError(f"{path} holds no coefficient")
+    return MagneticModel(epoch, header[1] if len(header) > 1 else "", coefficients)
+
+
+@functools.cache
+def bundled_model() -> MagneticModel:
+    """ The World Magnetic Model shipped with dmcview, read once. """
+    with importlib.resources.as_file(importlib.resources.files("dmcview") / "WMM.COF") as path:
+        return read_model(path)
+
+
+class DeclinationGrid:
+    """
+    Constant time declination lookups from a global grid of the model.
+
+    The north and east field components and their yearly change are evaluated at every node, so a
+    lookup at any date interpolates four values per component and takes ``atan2``: the angles never
+    wrap between the nodes. The secular variation of the model is linear, the date costs no accuracy.
+
+    Near the magnetic poles the horizontal field is weak and the declination turns quickly; the
+    cells with a corner under ``CAUTION_FIELD`` during the model validity are evaluated exactly.
+
+    Args:
+        model (MagneticModel): The model, the bundled one if not supplied.
+        resolution (float): The node spacing in degrees; 1 degree is 2 MB.
+        altitude (float): The height of the grid above the WGS 84 ellipsoid in km.
+
+    Raises:
+        ValueError: If the resolution does not divide 180 degrees.
+    """
+    def __init__(self, model: Optional[MagneticModel] = None, resolution: float = 1.0, altitude: float = 0.0) -> None:
+        rows = 180.0 / resolution if resolution > 0 else 0.5
+        if abs(rows - round(rows)) > 1e-9 or rows < 1:
+            raise ValueError(f"The grid resolution must divide 180 degrees, got {resolution}")
+        self.model = model if model is not None else bundled_model()
+        self.resolution = resolution
+        self.altitude = altitude
+
+        latitude = np.linspace(-90.0, 90.0, round(rows) + 1)
+        longitude = np.linspace(-180.0, 180.0, 2 * round(rows) + 1)
+        latitude, longitude = np.meshgrid(latitude, longitude, indexing="ij")
+        start = self.model.field(latitude, longitude, self.model.epoch, altitude)
+        end = self.model.field(latitude, longitude, self.model.valid_until, altitude)
+        # north, east, north per year, east per year; the values of a node are the last axis
+        self.table = np.stack(
+            (
+                start.north,
+                start.east,
+                (end.north - start.north) / VALIDITY_YEARS,
+                (end.east - start.east) / VALIDITY_YEARS,
+            ),
+            axis=-1,
+        )
+        weak = np.minimum(np.hypot(start.north, start.east), np.hypot(end.north, end.east)) < CAUTION_FIELD
+        self.exact = weak[:-1, :-1] | weak[1:, :-1] | weak[:-1, 1:] | weak[1:, 1:]  # per cell
+
+    def declination(self, latitude: Number, longitude: Number, year: Number) -> np.ndarray:
+        """
+        The declination in degrees, east positive.
+
+        Args:
+            latitude (float | np.ndarray): The geodetic latitude in degrees.
+            longitude (float | np.ndarray): The longitude in degrees, any turn.
+            year (float | np.ndarray): The decimal year, see :func:`decimal_year`.
+
+        Return:
+            np.ndarray: The declinations, of the broadcast shape of the arguments.
+        """
+        latitude, longitude, year = np.broadcast_arrays(
+            *(np.asarray(value, dtype=np.float64) for value in (latitude, longitude, year))
+        )
+        longitude = (longitude + 180.0) % 360.0 - 180.0
+        rows, columns = self.exact.shape
+        row = np.clip((latitude + 90.0) / self.resolution, 0.0, rows)
+        column = (longitude + 180.0) / self.resolution
+        i = np.minimum(row.astype(np.intp), rows - 1)
+        j = np.minimum(column.astype(np.intp), columns - 1)
+        u = (row - i)[..., np.newaxis]
+        v = (column - j)[..., np.newaxis]
+
+        table = self.table
+        values = (table[i, j] * (1.0 - v) + table[i, j + 1] * v) * (1.0 - u) + (
+            table[i + 1, j] * (1.0 - v) + table[i + 1, j + 1] * v
+        ) * u
+        dt = (year - self.model.epoch)[..., np.newaxis]
+        north, east = np.moveaxis(values[..., 0:2] + dt * values[..., 2:4], -1, 0)
+        declination = np.asarray(np.degrees(np.arctan2(east, north)))
+
+        exact = self.exact[i, j]
+        if exact.any():
+            declination[exact] = self.model.declination(
+                latitude[exact], longitude[exact], year[exact], self.altitude
+            )
+        return declination
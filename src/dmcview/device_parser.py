@@ -0,0 +1,135 @@
+"""Common interface for the device manufacturers serial data parsers"""
+
+import time
+from abc import ABC, abstractmethod
+
+import numpy as np
+
+SAMPLE_FIELDS = ("azimuth", "elevation", "bank", "declination", "x", "y", "z", "timestamp")
+SAMPLE_DTYPE = np.dtype(
+    [(field, "f8") for field in SAMPLE_FIELDS]
+)  # one decoded sample; parsers return arrays of this type so a batch is never a list of objects
+
+
+class DeviceParser(ABC):
+    """
+    Base class of a device manufacturer parser.
+
+    Each device manufacturer has its own frame layout on the serial port. A parser receives the raw
+    receive buffer, decodes every complete frame, removes the consumed bytes from the buffer and
+    leaves any partial frame in place for the next read.
+
+    Subclasses set ``manufacturer`` (the name used on the command line) and ``baudrate`` (the
+    default serial speed of the device), implement :meth:`parse` and are registered with
+    :func:`register_parser`; a parser without :meth:`parse` can not be instantiated.
+    """
+
+    manufacturer: str = ""
+    baudrate: int = 115200
+
+    @abstractmethod
+    def parse(self, buffer: bytearray) -> np.ndarray:
+        """
+        Decode all complete frames in the buffer.
+
+        Args:
+            buffer (bytearray): The receive buffer; consumed bytes are deleted from it.
+
+        Return:
+            np.ndarray: The decoded samples as a structured array of ``SAMPLE_DTYPE``.
+        """
+
+
+_PARSERS: dict[str, type[DeviceParser]] = {}
+
+
+def register_parser(parser_class: type[DeviceParser]) -> type[DeviceParser]:
+    """
+    Register a parser class under its manufacturer name; usable as a class decorator.
+
+    Raises:
+        ValueError: If the manufacturer name is empty or already registered.
+    """
+    name = parser_class.manufacturer.lower()
+    if not name:
+        raise ValueError(f"{parser_class.__name__} does not define a manufacturer name")
+    if name in _PARSERS:
+        raise ValueError(f"A parser is already registered for manufacturer '{name}'")
+    _PARSERS[name] = parser_class
+    return parser_class
+
+
+def _load_builtin_parsers() -> None:
+    """ Import the modules of the parsers shipped with dmcview so they register themselves. """
+    import dmcview.frame_decoder  # noqa: F401  pylint: disable=import-outside-toplevel,unused-import
+    import dmcview.fusion  # noqa: F401  pylint: disable=import-outside-toplevel,unused-import
+
+
+def available_parsers() -> list[str]:
+    """ Return the sorted manufacturer names of all registered parsers. """
+    _load_builtin_parsers()
+    return sorted(_PARSERS)
+
+
+def get_parser(manufacturer: str) -> DeviceParser:
+    """
+    Create the parser registered for the given manufacturer.
+
+    Raises:
+        ValueError: If no parser is registered for the manufacturer.
+    """
+    _load_builtin_parsers()
+    try:
+        return _PARSERS[manufacturer.lower()]()
+    except KeyError:
+        raise ValueError(
+            f"Unknown device manufacturer '{manufacturer}'; available: {', '.join(available_parsers())}"
+        )
+
+
+@register_parser
+class AsciiLineParser(DeviceParser):
+    """
+    Parser for devices sending one comma separated line per sample.
+
+    Line layout: ``azimuth,elevation,bank,declination,x,y,z[,timestamp]`` terminated by a new line.
+    Lines that can not be parsed are dropped; samples without a timestamp are stamped on arrival.
+
+    Subclasses for other line layouts set ``line_dtype``, whose last field is the timestamp, and
+    turn its rows into samples in :meth:`convert`.
+    """
+
+    manufacturer = "generic"
+    baudrate = 9600
+    max_line_length = 256  # a buffer without a new line after this many bytes is garbage
+    line_dtype = SAMPLE_DTYPE
+
+    def convert(self, rows: np.ndarray) -> np.ndarray:
+        """ Turn the decoded rows of ``line_dtype`` into samples of ``SAMPLE_DTYPE``. """
+        return rows
+
+    def parse(self, buffer: bytearray) -> np.ndarray:
+        end = buffer.rfind(b"\n")
+        if end < 0:
+            if len(buffer) > self.max_line_length:
+                buffer.clear()
+            return self.convert(np.empty(0, dtype=self.line_dtype))
+
+        chunk = bytes(buffer[: end + 1])
+        del buffer[: end + 1]
+
+        width = len(self.line_dtype)
+        rows = []
+        for line in chunk.splitlines():
+            fields = line.split(b",")
+            if len(fields) not in (width - 1, width):
+                continue
+            try:
+                values = [float(field) for field in fields]
+            except ValueError:
+                continue
+            if len(values) == width - 1:
+                values.append(time.monotonic())
+            rows.append(tuple(values))
+
+        return self.convert(np.array(rows, dtype=self.line_dtype))
@@ -0,0 +1,128 @@
+"""Bulk decoder of the binary DMC frames into NumPy sample arrays"""
+
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+from dmcview.device_parser import (
+    SAMPLE_DTYPE,
+    SAMPLE_FIELDS,
+    DeviceParser,
+    register_parser,
+)
+
+SYNC = b"\xaa\x55"
+
+PAYLOAD_DTYPE = np.dtype(
+    [(field, "<f8" if field == "timestamp" else "<f4") for field in SAMPLE_FIELDS]
+)  # the sample fields, little endian, packed
+
+PAYLOAD_SIZE = PAYLOAD_DTYPE.itemsize
+FRAME_SIZE = len(SYNC) + PAYLOAD_SIZE + 1  # sync, payload and one checksum byte
+
+
+def encode_frames(samples: np.ndarray) -> bytes:
+    """
+    Encode samples into binary frames, the inverse of :func:`decode_frames`.
+
+    Args:
+        samples (np.ndarray): samples of ``SAMPLE_DTYPE``.
+
+    Return:
+        bytes: the frames back to back.
+    """
+    payload = np.empty(len(samples), dtype=PAYLOAD_DTYPE)
+    for name in SAMPLE_FIELDS:
+        payload[name] = samples[name]
+
+    frames = np.empty((len(samples), FRAME_SIZE), dtype=np.uint8)
+    frames[:, 0] = SYNC[0]
+    frames[:, 1] = SYNC[1]
+    frames[:, 2:-1] = payload.view(np.uint8).reshape(len(samples), PAYLOAD_SIZE)
+    frames[:, -1] = frames[:, 2:-1].sum(axis=1) & 0xFF
+    return frames.tobytes()
+
+
+def _select_frames(starts: np.ndarray) -> np.ndarray:
+    """
+    Drop the valid frame starts that overlap an earlier accepted frame.
+
+    A clean stream has its frames back to back so all starts are kept without a loop; the
+    loop only runs on corrupted streams where a sync pattern inside a payload passed the checksum.
+    """
+    if len(starts) < 2 or np.all(np.diff(starts) >= FRAME_SIZE):
+        return starts
+
+    selected = []
+    end = -1
+    for start in starts.tolist():
+        if start >= end:
+            selected.append(start)
+            end = start + FRAME_SIZE
+    return np.array(selected, dtype=np.intp)
+
+
+def decode_frames(buffer: "bytearray | memoryview | bytes") -> tuple[np.ndarray, int]:
+    """
+    Decode every complete and valid frame of the buffer at once.
+
+    The buffer is viewed as an array of bytes without copying it; the sync patterns are searched,
+    the checksums validated and the payloads converted for all the frames with array operations.
+
+    Args:
+        buffer: the receive buffer.
+
+    Return:
+        tuple: the samples as a ``SAMPLE_DTYPE`` array and the number of bytes that can be
+        discarded from the front of the buffer. The bytes after it are the start of a frame
+        that has not been completely received yet.
+    """
+    data = np.frombuffer(buffer, dtype=np.uint8)
+    size = len(data)
+
+    candidates = np.flatnonzero((data[:-1] == SYNC[0]) & (data[1:] == SYNC[1]))
+    complete = candidates[candidates <= size - FRAME_SIZE]
+
+    if len(complete):
+        windows = sliding_window_view(data, FRAME_SIZE)[complete]  # copies the candidate frames only
+        valid = (windows[:, 2:-1].sum(axis=1) & 0xFF) == windows[:, -1]
+        rows = windows[valid]
+        starts = _select_frames(complete[valid])
+        if len(starts) != len(rows):
+            rows = rows[np.isin(complete[valid], starts)]
+    else:
+        rows = np.empty((0, FRAME_SIZE), dtype=np.uint8)
+        starts = complete
+
+    payload = np.ascontiguousarray(rows[:, 2:-1]).view(PAYLOAD_DTYPE).reshape(-1)
+    samples = np.empty(len(payload), dtype=SAMPLE_DTYPE)
+    for name in SAMPLE_FIELDS:
+        samples[name] = payload[name]
+
+    end = int(starts[-1]) + FRAME_SIZE if len(starts) else 0
+    partial = candidates[(candidates >= end) & (candidates > size - FRAME_SIZE)]
+    if len(partial):
+        consumed = int(partial[0])
+    elif size > end and data[-1] == SYNC[0]:
+        consumed = size - 1  # the second sync byte may come with the next read
+    else:
+        consumed = size
+    return samples, consumed
+
+
+@register_parser
+class BinaryFrameParser(DeviceParser):
+    """
+    Parser of the binary DMC frame.
+
+    Frame layout (little endian): sync ``0xAA 0x55``, azimuth, elevation, bank, declination,
+    x, y, z as float32, timestamp as float64 in seconds and a checksum byte which is the sum of
+    the payload bytes modulo 256. Frames with a wrong checksum are skipped.
+    """
+
+    manufacturer = "dmc-binary"
+    baudrate = 921600
+
+    def parse(self, buffer: bytearray) -> np.ndarray:
+        samples, consumed = decode_frames(buffer)
+        del buffer[:consumed]  # the views on the buffer are released by decode_frames
+        return samples
@@ -0,0 +1,120 @@
+"""
+Orientation of a unit from its raw accelerometer and magnetometer vectors.
+
+The sensor axes follow the aircraft convention: x forward, y right and z down, the accelerometer
+reading +1 g on z when the unit is level. The bank (roll) and elevation (pitch) come from the
+direction of gravity; the magnetic field is then projected on the horizontal plane, which makes the
+heading independent of the tilt.
+
+Every function works on whole arrays of samples: a live batch of a serial read as well as hours of
+recorded raw data, processed in blocks that stay in the cache.
+"""
+
+from typing import Optional, Union
+
+import numpy as np
+
+from dmcview.calibration import Calibration, EllipsoidFitter
+from dmcview.device_parser import SAMPLE_DTYPE, AsciiLineParser, register_parser
+
+RAW_DTYPE = np.dtype(
+    [
+        ("ax", "f8"),
+        ("ay", "f8"),
+        ("az", "f8"),
+        ("mx", "f8"),
+        ("my", "f8"),
+        ("mz", "f8"),
+        ("timestamp", "f8"),
+    ]
+)  # one raw sample, the acceleration in m/s² and the magnetic field in any unit
+FUSION_BLOCK = 1 << 16  # samples per block; the temporaries of a block stay in the cache
+
+
+def tilt_compensated(
+    accelerometer: np.ndarray, magnetometer: np.ndarray
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Compute the magnetic heading, elevation and bank of every sample.
+
+    The heading is ``atan2`` of the horizontal components of the magnetic field, both scaled by the
+    same positive factor so neither a trigonometric function nor a division is needed before it.
+    When the unit points straight up or down the heading and the bank are undefined and are 0.
+
+    Args:
+        accelerometer (np.ndarray): The acceleration vectors, shape (n, 3).
+        magnetometer (np.ndarray): The magnetic field vectors, shape (n, 3).
+
+    Return:
+        tuple[np.ndarray, np.ndarray, np.ndarray]: The heading in [0, 360) from magnetic north, the
+        elevation in [-90, 90] and the bank in [-180, 180] degrees, nose up and right side down
+        positive.
+    """
+    gx, gy, gz = (accelerometer[..., axis] for axis in range(3))
+    bx, by, bz = (magnetometer[..., axis] for axis in range(3))
+
+    level = np.hypot(gy, gz)  # gravity in the plane of the bank
+    bank = np.degrees(np.arctan2(gy, gz))
+    elevation = np.degrees(np.arctan2(-gx, level))
+
+    # north and east components of the field times |g| * level
+    east = (bz * gy - by * gz) * np.hypot(gx, level)
+    north = bx * level**2 - gx * (by * gy + bz * gz)
+    heading = np.degrees(np.arctan2(east, north)) % 360.0
+    return heading, elevation, bank
+
+
+def fuse(
+    raw: np.ndarray, declination: Union[float, np.ndarray] = 0.0, calibration: Optional[Calibration] = None
+) -> np.ndarray:
+    """
+    Turn raw samples into the samples shown by the compass.
+
+    Args:
+        raw (np.ndarray): samples of ``RAW_DTYPE``, for example a memory mapped recording.
+        declination (float | np.ndarray): The declination in degrees, for every sample or for all.
+        calibration (Calibration): The correction of the magnetometer, applied before the heading.
+
+    Return:
+        np.ndarray: The samples of ``SAMPLE_DTYPE``; the azimuth is from true north, the magnetic
+        heading plus the declination, and x, y, z are the acceleration.
+    """
+    samples = np.empty(len(raw), dtype=SAMPLE_DTYPE)
+    samples["declination"] = declination
+    for start in range(0, len(raw), FUSION_BLOCK):
+        block = slice(start, start + FUSION_BLOCK)
+        # every field is a float64, the records are viewed as the rows of a matrix without a copy
+        values = np.ascontiguousarray(raw[block], dtype=RAW_DTYPE).view(np.float64).reshape(-1, len(RAW_DTYPE))
+        out = samples[block]
+        magnetometer = values[:, 3:6] if calibration is None else calibration.apply(values[:, 3:6])
+        heading, out["elevation"], out["bank"] = tilt_compensated(values[:, 0:3], magnetometer)
+        out["azimuth"] = (heading + out["declination"]) % 360.0
+        out["x"], out["y"], out["z"], out["timestamp"] = values[:, 0], values[:, 1], values[:, 2], values[:, 6]
+    return samples
+
+
+@register_parser
+class RawVectorParser(AsciiLineParser):
+    """
+    Parser for devices sending their raw accelerometer and magnetometer vectors, one line per sample.
+
+    Line layout: ``ax,ay,az,mx,my,mz[,timestamp]`` terminated by a new line. The orientation is
+    computed by :func:`fuse` for each read; the declination is 0 so the azimuth is magnetic.
+
+    To calibrate the unit, set ``fitter`` during the manoeuvre: it receives the magnetometer vectors
+    of every read. Its fit set as ``calibration`` corrects the following reads.
+    """
+
+    manufacturer = "generic-raw"
+    line_dtype = RAW_DTYPE
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.calibration: Optional[Calibration] = None
+        self.fitter: Optional[EllipsoidFitter] = None
+
+    def convert(self, rows: np.ndarray) -> np.ndarray:
+        fitter = self.fitter
+        if fitter is not None and len(rows):
+            fitter.add(np.column_stack((rows["mx"], rows["my"], rows["mz"])))
+        return fuse(rows, calibration=self.calibration)
@@ -0,0 +1,99 @@
+"""The input mode window; imported by the CLI only once a window is actually created"""
+
+from PySide6.QtWidgets import QApplication, QHBoxLayout, QWidget
+
+from dmcview.acceleration_view import create_acceleration_view
+from dmcview.compass import Compass
+
+
+class InputWindow(QWidget):
+    """
+    The compass and the acceleration view side by side; the acceleration draw times are counted by the compass.
+
+    Args:
+        renderer (str): the acceleration view renderer, "matplotlib" or "qpainter".
+    """
+    def __init__(self, renderer: str = "matplotlib") -> None:
+        super().__init__()
+        layout = QHBoxLayout(self)
+        self.compass = Compass()
+        layout.addWidget(self.compass)
+
+        self.canvas = create_acceleration_view(renderer)
+        self.canvas.setFixedSize(350, 350)
+        self.canvas.perf = self.compass.perf
+        layout.addWidget(self.canvas)
+
+
+def create_input_window(
+    azimuth: float,
+    declination: float,
+    bank: float,
+    elevation: float,
+    acceleration: tuple[float, float, float],
+    renderer: str = "matplotlib",
+    perf_overlay: bool = False,
+) -> InputWindow:
+    """
+    Create the compass and acceleration window showing fixed values.
+
+    Args:
+        azimuth (float): azimuth angle in degrees.
+        declination (float): declination angle in degrees.
+        bank (float): bank angle in degrees.
+        elevation (float): elevation angle in degrees.
+        acceleration (tuple): the x, y and z acceleration.
+        renderer (str): the acceleration view renderer, "matplotlib" or "qpainter".
+        perf_overlay (bool): show the performance counters at start; F3 toggles them.
+
+    Return:
+        InputWindow: the window, not shown yet; ``compass`` and ``canvas`` are its two views.
+    """
+    main_widget = InputWindow(renderer)
+    compass = main_widget.compass
+    canvas = main_widget.canvas
+
+    # def on_resize(event):
+    #    screen_size = main_widget.size()
+    #    if screen_size.width()<1000 or screen_size.height()<500:
+    #        canvas.setFixedSize(250,250)
+    #    else:
+    #        canvas.setFixedSize(350,350)
+    #
+    #    print(screen_size)
+
+    # main_widget.resizeEvent = on_resize
+
+    compass.update_declination(
+        declination
+    )  # This is Declination and can be float to two decimal places for example 35.55
+    compass.update_angle(
+        azimuth
+    )  # This is Azimuth and can be float to two decimal places for example 35.55
+    compass.set_rotation(
+        bank
+    )  # This is the Inclination can be floated to two decimal places for example 35.55
+    compass.set_elevation(
+        elevation
+    )  # This is the Elevation can be floated to two decimal places for example 25.55
+
+    canvas.update_acceleration(*acceleration)
+    compass.set_perf_overlay(perf_overlay)
+    return main_widget
+
+
+def start_input_window(
+    azimuth: float,
+    declination: float,
+    bank: float,
+    elevation: float,
+    acceleration: tuple[float, float, float],
+    renderer: str = "matplotlib",
+    perf_overlay: bool = False,
+) -> None:
+    app = QApplication()
+    main_widget = create_input_window(
+        azimuth, declination, bank, elevation, acceleration, renderer, perf_overlay
+    )
+    main_widget.show()
+    app.exec()
@@ -0,0 +1,107 @@
+"""
+Fixed memory history of the telemetry samples.
+
+The samples are kept in a preallocated NumPy ring of ``SAMPLE_DTYPE`` records. Every record is
+written twice, at its ring position and one capacity further, so the newest records are always a
+contiguous slice of the buffer: a window of the history is a view, never a copy, and each channel
+of a window is a field of that view.
+"""
+
+from typing import Optional
+
+import numpy as np
+
+from dmcview.device_parser import SAMPLE_DTYPE
+
+HISTORY_BUDGET = 64 << 20  # bytes, 8 minutes at 1 kHz; the pages are only used once written
+
+
+class SampleHistory:
+    """
+    The newest samples of a stream within a fixed memory budget.
+
+    Appending is O(1) per sample and the oldest samples are overwritten once the history is full.
+    The windows are views on the ring: they stay valid until ``capacity`` minus their length more
+    samples are appended, copy them to keep them longer. The timestamps are expected to grow; a
+    sample older than the newest one starts a new history, for example after a replay seek.
+
+    Args:
+        budget (int): The bytes of the ring, twice the record size per sample of capacity.
+
+    Raises:
+        ValueError: If the budget does not hold one sample.
+    """
+    def __init__(self, budget: int = HISTORY_BUDGET) -> None:
+        self.capacity = budget // (2 * SAMPLE_DTYPE.itemsize)
+        if self.capacity <= 0:
+            raise ValueError(f"The history budget must hold one sample, {2 * SAMPLE_DTYPE.itemsize} bytes")
+        self.buffer = np.empty(2 * self.capacity, dtype=SAMPLE_DTYPE)
+        self.count = 0
+        self.appended = 0  # the samples appended since the start, the ring position is its remainder
+
+    def __len__(self) -> int:
+        return self.count
+
+    def clear(self) -> None:
+        self.count = 0
+
+    def append(self, samples: np.ndarray) -> None:
+        """
+        Append a batch of samples.
+
+        Args:
+            samples (np.ndarray): samples of ``SAMPLE_DTYPE`` in arrival order.
+        """
+        if len(samples) == 0:
+            return
+        timestamps = samples["timestamp"]
+        back = np.flatnonzero(timestamps[1:] < timestamps[:-1])
+        if len(back):
+            samples = samples[back[-1] + 1 :]
+            self.clear()
+        elif self.count and timestamps[0] < self.buffer["timestamp"][self.__stop() - 1]:
+            self.clear()
+
+        capacity = self.capacity
+        samples = samples[-capacity:]
+        count = len(samples)
+        start = self.appended % capacity
+        self.buffer[start : start + count] = samples  # may run into the mirror half
+        low = capacity - start  # the records before the end of the first half
+        self.buffer[start + capacity : start + capacity + min(count, low)] = samples[:low]
+        self.buffer[: max(0, count - low)] = samples[low:]
+
+        self.appended += count
+        self.count = min(self.count + count, capacity)
+
+    def __stop(self) -> int:
+        """ The end of the newest records in the buffer; they are the ``count`` before it. """
+        return (self.appended - 1) % self.capacity + 1 + self.capacity
+
+    def last(self, count: Optional[int] = None) -> np.ndarray:
+        """
+        The newest samples, oldest first.
+
+        Args:
+            count (int): The number of samples, the whole history if not supplied.
+
+        Return:
+            np.ndarray: A view of at most ``count`` samples.
+        """
+        count = self.count if count is None else min(max(count, 0), self.count)
+        stop = self.__stop()
+        return self.buffer[stop - count : stop]
+
+    def window(self, seconds: float) -> np.ndarray:
+        """ The view of the samples of the last seconds before the newest sample, included. """
+        samples = self.last()
+        if len(samples) == 0:
+            return samples
+        timestamps = samples["timestamp"]
+        return samples[int(np.searchsorted(timestamps, timestamps[-1] - seconds, side="left")) :]
+
+    def between(self, start: float, stop: float) -> np.ndarray:
+        """ The view of the samples with a timestamp in [start, stop). """
+        samples = self.last()
+        timestamps = samples["timestamp"]
+        return samples[int(np.searchsorted(timestamps, start)) : int(np.searchsorted(timestamps, stop))]
@@ -0,0 +1,95 @@
+"""Live performance counters shown by the compass overlay"""
+
+import threading
+import time
+from collections import deque
+
+
+class PerfStats:
+    """
+    Counters telling whether a lag comes from the rendering, the ingestion or the event loop.
+
+    The widgets record their own timings; the samples are counted when a source emits them (on its
+    thread) and when the viewer shows them, the difference is the backlog waiting in the event loop.
+
+    Args:
+        window (float): The seconds over which the rates are counted.
+        smoothing (float): The weight of the newest duration in the moving averages.
+    """
+    def __init__(self, window: float = 1.0, smoothing: float = 0.1) -> None:
+        self.window = window
+        self.smoothing = smoothing
+        self.lock = threading.Lock()
+
+        self.frames: deque[float] = deque()
+        self.ticks: deque[float] = deque()
+        self.paint_last = 0.0
+        self.paint_average = 0.0
+        self.acceleration_last = 0.0
+        self.acceleration_average = 0.0
+        self.received = 0
+        self.shown = 0
+
+    def __average(self, average: float, seconds: float) -> float:
+        return seconds if average == 0.0 else average + self.smoothing * (seconds - average)
+
+    def __trim(self, times: deque, now: float) -> None:
+        limit = now - self.window
+        while times and times[0] < limit:
+            times.popleft()
+
+    def __record(self, times: deque) -> None:
+        """ Append the time of an event, dropping the ones out of the window so the counters stay small. """
+        now = time.monotonic()
+        times.append(now)
+        self.__trim(times, now)
+
+    def __rate(self, times: deque) -> float:
+        self.__trim(times, time.monotonic())
+        return len(times) / self.window
+
+    def record_paint(self, seconds: float) -> None:
+        """ One compass frame painted in the given seconds. """
+        self.__record(self.frames)
+        self.paint_last = seconds
+        self.paint_average = self.__average(self.paint_average, seconds)
+
+    def record_tick(self, _: float) -> bool:
+        """ An animation clock frame callback; it never keeps the clock running by itself. """
+        self.__record(self.ticks)
+        return False
+
+    def record_acceleration_draw(self, seconds: float) -> None:
+        self.acceleration_last = seconds
+        self.acceleration_average = self.__average(self.acceleration_average, seconds)
+
+    def samples_received(self, count: int) -> None:
+        """ Samples emitted by a source, called on the thread of the source. """
+        with self.lock:
+            self.received += count
+
+    def samples_shown(self, count: int) -> None:
+        with self.lock:
+            self.shown += count
+
+    @property
+    def backlog(self) -> int:
+        """ The samples emitted but not handled by the viewer yet. """
+        with self.lock:
+            return self.received - self.shown
+
+    def frames_per_second(self) -> float:
+        return self.__rate(self.frames)
+
+    def ticks_per_second(self) -> float:
+        return self.__rate(self.ticks)
+
+    def lines(self) -> list[str]:
+        """ The overlay text, one counter per line; the durations are the last and the average. """
+        return [
+            f"FPS: {self.frames_per_second():.0f}",
+            f"Paint ms: {self.paint_last * 1000:.2f}/{self.paint_average * 1000:.2f}",
+            f"Ticks/s: {self.ticks_per_second():.0f}",
+            f"3D ms: {self.acceleration_last * 1000:.2f}/{self.acceleration_average * 1000:.2f}",
+            f"Input backlog: {self.backlog}",
+        ]
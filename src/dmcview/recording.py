@@ -0,0 +1,303 @@
+"""
+Append-only binary recording of telemetry sessions.
+
+A session file is a small header followed by fixed size records:
+
+* ``MAGIC`` (8 bytes), then the header length as a little endian uint32 and the JSON header with
+  the record schema and the device information; the header is padded so the records start on a
+  multiple of ``HEADER_ALIGNMENT``.
+* One ``RECORD_DTYPE`` record per sample, packed, with non decreasing timestamps.
+
+A sparse timestamp index sits next to it in ``<session>.idx``: one ``INDEX_DTYPE`` entry every
+``index_stride`` records. Readers map the file and view the records as a NumPy array without
+parsing; a partial record at the end of an interrupted recording is ignored.
+"""
+
+import json
+import os
+import queue
+import struct
+import time
+from collections.abc import Mapping
+from typing import Any, Literal, Optional
+
+import numpy as np
+from PySide6.QtCore import QObject, QRunnable, Signal, Slot
+
+from dmcview.device_parser import SAMPLE_DTYPE
+
+MAGIC = b"DMCREC\x00\x01"
+FORMAT_VERSION = 1
+HEADER_ALIGNMENT = 64
+
+RECORD_DTYPE = SAMPLE_DTYPE.newbyteorder("<")  # the files are little endian on every platform
+INDEX_DTYPE = np.dtype([("timestamp", "<f8"), ("record", "<i8")])
+
+
+def index_path(path: str) -> str:
+    """ The sparse timestamp index file of a session file. """
+    return f"{path}.idx"
+
+
+class SessionWriter:
+    """
+    Append samples to a new session file.
+
+    The records are buffered and written in large blocks; call :meth:`close` (or use the writer as
+    a context manager) to write the rest.
+
+    Args:
+        path (str): The session file, overwritten if it exists.
+        device (Mapping): The device information stored in the header, for example manufacturer,
+            port and baudrate.
+        buffer_records (int): The records buffered before they are written.
+        index_stride (int): The records between two entries of the timestamp index.
+
+    Raises:
+        ValueError: If buffer_records or index_stride is not positive.
+    """
+    def __init__(
+        self,
+        path: str,
+        device: Optional[Mapping[str, Any]] = None,
+        buffer_records: int = 4096,
+        index_stride: int = 1024,
+    ) -> None:
+        if buffer_records <= 0 or index_stride <= 0:
+            raise ValueError("buffer_records and index_stride must be positive")
+
+        self.path = path
+        self.buffer_records = buffer_records
+        self.index_stride = index_stride
+        self.header = {
+            "version": FORMAT_VERSION,
+            "dtype": RECORD_DTYPE.descr,
+            "device": dict(device or {}),
+            "created": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+            "index_stride": index_stride,
+        }
+
+        self.buffer: list[np.ndarray] = []
+        self.buffered = 0
+        self.record_count = 0
+        self.last_timestamp = -np.inf
+
+        self.file = open(path, "wb")  # pylint: disable=consider-using-with
+        self.index_file = open(index_path(path), "wb")  # pylint: disable=consider-using-with
+        self.file.write(encode_header(self.header))
+
+    def append(self, samples: np.ndarray) -> None:
+        """
+        Append a batch of samples.
+
+        Args:
+            samples (np.ndarray): Structured array of ``SAMPLE_DTYPE``.
+
+        Raises:
+            ValueError: If the timestamps go backwards, within the batch or against the
+                previous samples; nothing of the batch is written then.
+        """
+        if len(samples) == 0:
+            return
+        timestamps = samples["timestamp"]
+        if timestamps[0] < self.last_timestamp or np.any(np.diff(timestamps) < 0):
+            raise ValueError("Sample timestamps must not decrease")
+
+        records = samples.astype(RECORD_DTYPE, copy=True)
+        self.buffer.append(records)
+        self.buffered += len(records)
+        self.last_timestamp = float(timestamps[-1])
+        if self.buffered >= self.buffer_records:
+            self.flush()
+
+    def flush(self) -> None:
+        """ Write the buffered records and their index entries. """
+        if not self.buffer:
+            return
+        records = np.concatenate(self.buffer)
+        self.buffer.clear()
+        self.buffered = 0
+
+        first = self.record_count
+        numbers = np.arange(-first % self.index_stride, len(records), self.index_stride)
+        index = np.empty(len(numbers), dtype=INDEX_DTYPE)
+        index["timestamp"] = records["timestamp"][numbers]
+        index["record"] = first + numbers
+
+        self.file.write(records.tobytes())
+        self.index_file.write(index.tobytes())
+        self.file.flush()
+        self.index_file.flush()
+        self.record_count += len(records)
+
+    def close(self) -> None:
+        if self.file.closed:
+            return
+        self.flush()
+        self.file.close()
+        self.index_file.close()
+
+    def __enter__(self) -> "SessionWriter":
+        return self
+
+    def __exit__(self, *_: Any) -> None:
+        self.close()
+
+
+def encode_header(header: Mapping[str, Any]) -> bytes:
+    """ The magic, the header length and the JSON header padded to ``HEADER_ALIGNMENT``. """
+    payload = json.dumps(header).encode("utf-8")
+    size = len(MAGIC) + 4 + len(payload)
+    payload += b" " * (-size % HEADER_ALIGNMENT)
+    return MAGIC + struct.pack("<I", len(payload)) + payload
+
+
+class SessionReader:
+    """
+    Memory mapped view of a session file.
+
+    Args:
+        path (str): The session file.
+
+    Raises:
+        ValueError: If the file is not a session file or has an unknown version.
+    """
+    def __init__(self, path: str) -> None:
+        self.path = path
+        with open(path, "rb") as file:
+            magic = file.read(len(MAGIC))
+            if magic != MAGIC:
+                raise ValueError(f"{path} is not a dmcview session file")
+            try:
+                (length,) = struct.unpack("<I", file.read(4))
+                self.header: dict[str, Any] = json.loads(file.read(length))
+            except struct.error:
+                raise ValueError(f"{path} has a truncated header")
+
+        if self.header.get("version") != FORMAT_VERSION:
+            raise ValueError(f"Unsupported session file version {self.header.get('version')}")
+
+        try:
+            self.dtype = np.dtype([tuple(field) for field in self.header["dtype"]])
+        except (KeyError, TypeError):
+            raise ValueError(f"{path} has no valid record type in its header")
+        self.data_offset = len(MAGIC) + 4 + length
+        count = (os.path.getsize(path) - self.data_offset) // self.dtype.itemsize
+        self.samples: np.ndarray
+        if count > 0:
+            self.samples = np.memmap(path, dtype=self.dtype, mode="r", offset=self.data_offset, shape=(count,))
+        else:
+            self.samples = np.empty(0, dtype=self.dtype)
+
+        self.index = self.__load_index(count)
+
+    @property
+    def device(self) -> dict[str, Any]:
+        return dict(self.header["device"])
+
+    def __len__(self) -> int:
+        return len(self.samples)
+
+    def __load_index(self, count: int) -> np.ndarray:
+        """ The sparse index, rebuilt from the records when the index file is missing. """
+        stride = self.header["index_stride"]
+        try:
+            index = np.fromfile(index_path(self.path), dtype=INDEX_DTYPE)
+        except FileNotFoundError:
+            index = np.empty(0, dtype=INDEX_DTYPE)
+
+        expected = -(-count // stride)
+        if len(index) < expected:
+            numbers = np.arange(0, count, stride)
+            index = np.empty(len(numbers), dtype=INDEX_DTYPE)
+            index["timestamp"] = self.samples["timestamp"][numbers]
+            index["record"] = numbers
+        return index[:expected]
+
+    def index_of(self, timestamp: float, side: Literal["left", "right"] = "left") -> int:
+        """
+        The first record at or after the timestamp; only one index block of the file is read.
+
+        Args:
+            timestamp (float): The timestamp to look for.
+            side (str): "left" for the first record at or after the timestamp, "right" for the
+                first record after it, the same as ``np.searchsorted``.
+
+        Return:
+            int: The record number, ``len(self)`` if every record is older.
+        """
+        block = int(np.searchsorted(self.index["timestamp"], timestamp, side=side)) - 1
+        start = int(self.index["record"][block]) if block >= 0 else 0
+        stop = int(self.index["record"][block + 1]) if block + 1 < len(self.index) else len(self)
+        return start + int(np.searchsorted(self.samples["timestamp"][start:stop], timestamp, side=side))
+
+    def between(self, start: float, stop: float) -> np.ndarray:
+        """ The records with a timestamp in [start, stop), as a view on the file. """
+        return self.samples[self.index_of(start) : self.index_of(stop)]
+
+    def close(self) -> None:
+        """ Release the mapping; it is unmapped once the views taken from it are released too. """
+        self.samples = np.empty(0, dtype=self.dtype)
+
+    def __enter__(self) -> "SessionReader":
+        return self
+
+    def __exit__(self, *_: Any) -> None:
+        self.close()
+
+
+class RecorderSignal(QObject):
+    """ Define the signals available from a running recorder thread"""
+
+    error = Signal(str)
+
+
+class RecorderRunner(QRunnable):
+    """
+    class extends QRunnable to write a session file in a separate thread.
+
+    :meth:`record` can be called from any thread, typically connected directly to the samples
+    signal of a reader; the batches are queued and written by the recorder thread so the disk
+    never slows down the reader nor the GUI. Samples older than the last recorded one are dropped.
+
+    Args:
+        path (str): The session file.
+        device (Mapping): The device information stored in the header.
+    """
+    def __init__(self, path: str, device: Optional[Mapping[str, Any]] = None) -> None:
+        super().__init__()
+        self.setAutoDelete(False)
+        self.signal = RecorderSignal()
+        self.path = path
+        self.device = device
+        self.batches: queue.Queue[np.ndarray] = queue.Queue()
+        self.running = True
+
+    def record(self, samples: np.ndarray) -> None:
+        if self.running:
+            self.batches.put(samples)
+
+    @Slot()
+    def run(self) -> None:
+        try:
+            writer = SessionWriter(self.path, self.device)
+        except OSError as error:
+            self.signal.error.emit(f"Can not record to {self.path}: {error}")
+            return
+
+        with writer:
+            while self.running or not self.batches.empty():
+                try:
+                    samples = self.batches.get(timeout=0.1)
+                except queue.Empty:
+                    continue
+                timestamps = samples["timestamp"]
+                newest = np.maximum.accumulate(np.concatenate(([writer.last_timestamp], timestamps)))
+                in_order = timestamps >= newest[:-1]
+                if not in_order.all():
+                    self.signal.error.emit(f"Dropped {np.count_nonzero(~in_order)} samples going back in time")
+                writer.append(samples[in_order])
+
+    def stop(self) -> None:
+        """ Stop once the queued batches are written. """
+        self.running = False
@@ -0,0 +1,115 @@
+"""Render compass frames to images without a window, for reports and benchmarks"""
+
+import os
+from typing import NamedTuple, Optional
+
+from PySide6.QtCore import QSize, Qt
+from PySide6.QtGui import QColor, QImage, QPainter
+from PySide6.QtWidgets import QApplication
+
+from dmcview.compass import Compass
+from dmcview.telemetry import TelemetryBus
+
+
+class CompassState(NamedTuple):
+    """ Everything the compass shows; the angles are in degrees. """
+    azimuth: float = 0.0
+    declination: float = 0.0
+    bank: float = 0.0
+    elevation: float = 0.0
+    x: float = 0.0
+    y: float = 0.0
+    z: float = 0.0
+
+
+def ensure_application() -> QApplication:
+    """
+    The running QApplication, or a new one on the ``offscreen`` platform.
+
+    The offscreen platform needs no display server so images can be rendered on headless servers.
+    An explicit ``QT_QPA_PLATFORM`` is respected.
+    """
+    app = QApplication.instance()
+    if isinstance(app, QApplication):
+        return app
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    return QApplication([])
+
+
+class CompassRenderer:
+    """
+    Render compass states to images with the drawing code of the Compass widget.
+
+    The state is shown at once, without animation and without timers, so the same state always
+    gives the same image. The dial is drawn once per size and pixel ratio and reused for the
+    following frames.
+
+    Args:
+        background (QColor): the image background, transparent is allowed; white if not supplied.
+    """
+    def __init__(self, background: Optional[QColor] = None) -> None:
+        self.app = ensure_application()
+        self.background = QColor(Qt.GlobalColor.white) if background is None else QColor(background)
+        self.compass = Compass(bus=TelemetryBus())
+        self.compass.setMinimumSize(1, 1)  # the widget is never shown, any image size is allowed
+        self.dial: Optional[QImage] = None
+        self.dial_key: Optional[tuple[QSize, float]] = None
+
+    def render(self, state: CompassState, size: QSize = QSize(600, 420), dpr: float = 1.0) -> QImage:
+        """
+        Render one compass frame.
+
+        Args:
+            state (CompassState): the state to show.
+            size (QSize): the image size in logical pixels.
+            dpr (float): the device pixel ratio; the image has ``size * dpr`` physical pixels.
+
+        Return:
+            QImage: the rendered frame.
+        """
+        if self.compass.size() != size:
+            self.compass.resize(size)
+        self.compass.show_state(state._asdict())
+        self.compass.clock.stop()  # nothing to animate, the state is shown at its target
+
+        image = self.__new_image(size, dpr)
+        image.fill(self.background)
+        painter = QPainter(image)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.drawImage(0, 0, self.__dial(size, dpr))
+        self.compass.draw_state(painter)
+        painter.end()
+        return image
+
+    def __dial(self, size: QSize, dpr: float) -> QImage:
+        if self.dial is None or self.dial_key != (size, dpr):
+            self.dial = self.__new_image(size, dpr)
+            self.dial.fill(Qt.GlobalColor.transparent)
+            painter = QPainter(self.dial)
+            painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+            self.compass.draw_dial(painter)
+            painter.end()
+            self.dial_key = (size, dpr)
+        return self.dial
+
+    @staticmethod
+    def __new_image(size: QSize, dpr: float) -> QImage:
+        image = QImage(size * dpr, QImage.Format.Format_ARGB32_Premultiplied)
+        image.setDevicePixelRatio(dpr)
+        return image
+
+
+_default_renderer: Optional[CompassRenderer] = None
+
+
+def render_compass(state: CompassState, size: QSize = QSize(600, 420), dpr: float = 1.0) -> QImage:
+    """
+    Render one compass frame with a shared renderer; see :meth:`CompassRenderer.render`.
+
+    Example:
+        render_compass(CompassState(azimuth=45.5, declination=10.5)).save("compass.png")
+    """
+    global _default_renderer  # pylint: disable=global-statement
+    if _default_renderer is None:
+        _default_renderer = CompassRenderer()
+    return _default_renderer.render(state, size, dpr)
@@ -0,0 +1,232 @@
+"""Replay of recorded sessions in place of a device"""
+
+import time
+from typing import Optional
+
+import numpy as np
+from PySide6.QtCore import QElapsedTimer, QEvent, QObject, Qt, QTimer, Signal
+from PySide6.QtGui import QKeyEvent
+from PySide6.QtWidgets import QApplication
+
+from dmcview.animation import display_refresh_rate
+from dmcview.constants import REPLAY_SPEED_RANGE
+from dmcview.recording import SessionReader
+from dmcview.viewer import SampleViewer
+
+MIN_SPEED, MAX_SPEED = REPLAY_SPEED_RANGE
+
+
+class ReplayEngine(QObject):
+    """
+    Play the records of a session at their recorded pace, scaled by the speed.
+
+    Once per frame the engine advances the session position by the elapsed wall-clock time times
+    the speed and emits every record up to the new position as one batch, so no record is skipped
+    whatever the frame rate. A seek finds the record through the sparse index of the session.
+
+    In the as fast as possible mode the recorded pace is ignored: every turn of the event loop
+    emits the next ``fast_batch`` records, which measures how fast the views can follow.
+
+    Args:
+        session (SessionReader): The memory mapped session.
+        speed (float): The playback speed, 1.0 is the recorded pace.
+        frame_rate (float): Batches per second; the primary screen refresh rate if not supplied.
+
+    Raises:
+        ValueError: If the speed is out of ``REPLAY_SPEED_RANGE``.
+    """
+    samples = Signal(object)  # numpy structured array of the session records
+    position_changed = Signal(float)  # the session timestamp
+    finished = Signal()
+
+    def __init__(
+        self,
+        session: SessionReader,
+        speed: float = 1.0,
+        parent: Optional[QObject] = None,
+        frame_rate: Optional[float] = None,
+    ) -> None:
+        super().__init__(parent)
+        self.session = session
+        self.timestamps = session.samples["timestamp"]
+        self.start_time = float(self.timestamps[0]) if len(session) else 0.0
+        self.end_time = float(self.timestamps[-1]) if len(session) else 0.0
+
+        self.position = self.start_time  # every record up to this timestamp has been emitted
+        self.next_record = 0
+        self.speed = 1.0
+        self.set_speed(speed)
+        self.fast = False
+        self.fast_batch = 1
+
+        self.interval = max(1, round(1000 / (frame_rate if frame_rate else display_refresh_rate())))
+        self.elapsed = QElapsedTimer()
+        self.timer = QTimer(self)
+        self.timer.setTimerType(Qt.TimerType.PreciseTimer)
+        self.timer.timeout.connect(self.__tick)
+
+    def set_speed(self, speed: float) -> None:
+        """
+        Raises:
+            ValueError: If the speed is out of ``REPLAY_SPEED_RANGE``.
+        """
+        if not MIN_SPEED <= speed <= MAX_SPEED:
+            raise ValueError(f"The replay speed must be between {MIN_SPEED} and {MAX_SPEED}, got {speed}")
+        self.speed = speed
+
+    def set_fast(self, fast: bool, batch: int = 1) -> None:
+        """ Switch the as fast as possible mode, emitting ``batch`` records per event loop turn. """
+        self.fast = fast
+        self.fast_batch = max(1, batch)
+        if self.is_playing():
+            self.timer.start(0 if fast else self.interval)
+
+    def play(self) -> None:
+        if self.at_end() or self.is_playing():
+            return
+        self.elapsed.start()
+        self.timer.start(0 if self.fast else self.interval)
+
+    def pause(self) -> None:
+        self.timer.stop()
+
+    def is_playing(self) -> bool:
+        return self.timer.isActive()
+
+    def at_end(self) -> bool:
+        return self.next_record >= len(self.session)
+
+    def seek(self, timestamp: float) -> None:
+        """
+        Move to a session timestamp and show the last record at or before it.
+
+        Args:
+            timestamp (float): The session timestamp, clamped to the session.
+        """
+        self.position = min(max(timestamp, self.start_time), self.end_time)
+        self.next_record = self.session.index_of(self.position, "right")
+        self.elapsed.restart()
+        if self.next_record > 0:
+            self.samples.emit(self.session.samples[self.next_record - 1 : self.next_record])
+        self.position_changed.emit(self.position)
+
+    def step(self, count: int = 1) -> None:
+        """ Pause and emit the next ``count`` records. """
+        self.pause()
+        self.__emit_until(min(self.next_record + count, len(self.session)))
+        self.position_changed.emit(self.position)
+
+    def __tick(self) -> None:
+        if self.fast:
+            self.__emit_until(min(self.next_record + self.fast_batch, len(self.session)))
+        else:
+            position = self.position + self.elapsed.restart() / 1000.0 * self.speed
+            self.__emit_until(self.session.index_of(position, "right"))
+            self.position = min(position, self.end_time)
+            self.position_changed.emit(self.position)
+
+        if self.at_end():
+            self.pause()
+            self.finished.emit()
+
+    def __emit_until(self, stop: int) -> None:
+        if stop <= self.next_record:
+            return
+        batch = self.session.samples[self.next_record : stop]
+        self.next_record = stop
+        self.position = float(self.timestamps[stop - 1])
+        self.samples.emit(batch)
+
+
+class ReplayViewer(SampleViewer):
+    """
+    This class represents the main GUI when a recorded session is replayed.
+
+    Keys: space plays or pauses, period steps one record, left and right seek 5 seconds, plus and
+    minus double or halve the speed and home goes back to the start.
+
+    Args:
+        path (str): The session file.
+        speed (float): The playback speed, 1.0 is the recorded pace.
+        fast (bool): Replay as fast as possible and print the throughput at the end.
+        renderer (str): the acceleration view renderer, "matplotlib" or "qpainter".
+        perf_overlay (bool): show the performance counters at start.
+    """
+    seek_seconds = 5.0
+
+    def __init__(
+        self,
+        path: str,
+        speed: float = 1.0,
+        fast: bool = False,
+        renderer: str = "matplotlib",
+        perf_overlay: bool = False,
+    ) -> None:
+        super().__init__(renderer, perf_overlay)
+        self.path = path
+        self.session = SessionReader(path)
+        self.engine = ReplayEngine(self.session, speed, self)
+        self.engine.set_fast(fast)
+
+        self.connect_source(self.engine.samples)
+        self.engine.position_changed.connect(self.__show_position)
+        self.engine.finished.connect(self.__finished)
+
+        self.setFocusPolicy(Qt.FocusPolicy.StrongFocus)
+        self.started = time.perf_counter()
+        self.__show_position(self.engine.position)
+        self.engine.play()
+
+    def __show_position(self, position: float) -> None:
+        state = "playing" if self.engine.is_playing() else "paused"
+        elapsed = position - self.engine.start_time
+        self.setWindowTitle(f"DMC View - {self.path} {elapsed:.2f} s ({self.engine.speed:g}x, {state})")
+
+    def __finished(self) -> None:
+        if self.engine.fast:
+            seconds = time.perf_counter() - self.started
+            print(f"Replayed {len(self.session)} samples in {seconds:.3f} s ({len(self.session) / seconds:.0f} samples/s)")
+        self.__show_position(self.engine.position)
+
+    def keyPressEvent(self, event: QKeyEvent) -> None:  # pylint: disable=invalid-name
+        key = event.key()
+        engine = self.engine
+        if key == Qt.Key.Key_Space:
+            if engine.is_playing():
+                engine.pause()
+            else:
+                engine.play()
+        elif key == Qt.Key.Key_Period:
+            engine.step()
+        elif key == Qt.Key.Key_Right:
+            engine.seek(engine.position + self.seek_seconds)
+        elif key == Qt.Key.Key_Left:
+            engine.seek(engine.position - self.seek_seconds)
+        elif key == Qt.Key.Key_Home:
+            engine.seek(engine.start_time)
+        elif key in (Qt.Key.Key_Plus, Qt.Key.Key_Equal):
+            engine.set_speed(float(np.clip(engine.speed * 2, MIN_SPEED, MAX_SPEED)))
+        elif key == Qt.Key.Key_Minus:
+            engine.set_speed(float(np.clip(engine.speed / 2, MIN_SPEED, MAX_SPEED)))
+        else:
+            super().keyPressEvent(event)
+            return
+        self.__show_position(engine.position)
+
+    def closeEvent(self, event: QEvent) -> None:  # pylint: disable=invalid-name
+        self.engine.pause()
+        self.session.close()
+        event.accept()
+
+
+def start_replay(
+    path: str,
+    speed: float = 1.0,
+    fast: bool = False,
+    renderer: str = "matplotlib",
+    perf_overlay: bool = False,
+) -> None:
+    app = QApplication()
+    viewer = ReplayViewer(path, speed, fast, renderer, perf_overlay)
+    viewer.show()
+    app.exec()
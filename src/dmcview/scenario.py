@@ -0,0 +1,275 @@
+"""
+Scripted and seeded simulator scenarios.
+
+A scenario is a JSON file giving each channel its own schedule::
+
+    {
+        "name": "sequences",
+        "seed": 42,
+        "duration": 60.0,
+        "repeat": false,
+        "channels": {
+            "azimuth": {"values": [45.5, 46.5, 47.0, 47.5, 48.0, 48.5], "interval": 0.1},
+            "elevation": {"values": [60, 60.5, 61.0, 61.5, 62.0], "interval": 0.2},
+            "bank": {"values": [30.0, 30.5, 31.0, 31.5, 32.0, 32.5], "interval": 0.15},
+            "declination": {"constant": 10.5},
+            "x": {"waveform": "sine", "amplitude": 5, "offset": 10, "period": 4, "rate": 20},
+            "y": {"waveform": "random", "low": 5, "high": 15, "interval": 0.5}
+        }
+    }
+
+A channel is a cycled list of ``values``, a ``waveform`` (sine, triangle, square, sawtooth or
+random) or a ``constant``; it is updated every ``interval`` seconds or ``rate`` times per second.
+The channels left out are constant 0. The timelines of the channels are merged into one stream of
+samples: a sample at every update time of any channel, the other channels holding their last
+value. The random values depend only on the seed, the channel and the update number, so a
+scenario always produces the same stream however it is cut into blocks.
+"""
+
+import json
+import math
+from collections.abc import Mapping
+from typing import Any
+
+import numpy as np
+
+from dmcview.device_parser import SAMPLE_DTYPE
+
+CHANNELS = ("azimuth", "elevation", "bank", "declination", "x", "y", "z")
+WAVEFORMS = ("sine", "triangle", "square", "sawtooth", "random")
+
+NANOSECONDS = 1_000_000_000  # the schedules are computed in integer nanoseconds so they never drift
+MAX_SECONDS = 100 * 365 * 86400.0  # about a century, the nanoseconds stay far from the int64 limit
+RANDOM_CHUNK = 4096  # the random values are drawn in chunks seeded by their position
+
+
+def to_number(value: Any, what: str) -> float:
+    """
+    A number of the scenario file as a float.
+
+    Raises:
+        ValueError: If the value is not a finite number.
+    """
+    try:
+        number = float(value)
+    except (TypeError, ValueError):
+        raise ValueError(f"{what} must be a number, got {value!r}")
+    if not math.isfinite(number):
+        raise ValueError(f"{what} must be finite, got {value!r}")
+    return number
+
+
+def to_nanoseconds(seconds: float) -> int:
+    """
+    Raises:
+        ValueError: If the seconds are not finite or longer than ``MAX_SECONDS``.
+    """
+    if not abs(seconds) <= MAX_SECONDS:
+        raise ValueError(f"{seconds} seconds is out of the scenario range of {MAX_SECONDS:.0f} seconds")
+    return round(seconds * NANOSECONDS)
+
+
+class ChannelSchedule:
+    """
+    The update times and values of one channel.
+
+    Args:
+        channel (str): The channel name, one of ``CHANNELS``.
+        spec (Mapping): The channel description of the scenario file.
+        seed (int): The scenario seed.
+
+    Raises:
+        ValueError: If the description is invalid.
+    """
+    def __init__(self, channel: str, spec: Mapping[str, Any], seed: int = 0) -> None:
+        if channel not in CHANNELS:
+            raise ValueError(f"Unknown scenario channel '{channel}'; available: {', '.join(CHANNELS)}")
+        if not isinstance(spec, Mapping):
+            raise ValueError(f"Channel '{channel}' must be described by an object, got {spec!r}")
+        self.channel = channel
+        self.seed = seed
+
+        kinds = [kind for kind in ("values", "waveform", "constant") if kind in spec]
+        if len(kinds) != 1:
+            raise ValueError(f"Channel '{channel}' needs exactly one of values, waveform or constant")
+        self.kind = kinds[0]
+
+        if self.kind == "constant":
+            self.interval = 0  # a single update at the start
+            self.constant = to_number(spec["constant"], f"Channel '{channel}' constant")
+            return
+
+        if "interval" in spec:
+            interval = to_number(spec["interval"], f"Channel '{channel}' interval")
+        elif "rate" in spec:
+            rate = to_number(spec["rate"], f"Channel '{channel}' rate")
+            interval = 1.0 / rate if rate > 0 else 0.0
+        else:
+            raise ValueError(f"Channel '{channel}' needs an interval or a rate")
+        self.interval = to_nanoseconds(interval)
+        if self.interval <= 0:
+            raise ValueError(f"Channel '{channel}' interval must be positive")
+
+        if self.kind == "values":
+            try:
+                self.values = np.asarray(spec["values"], dtype=float)
+            except (TypeError, ValueError):
+                self.values = np.empty(0)
+            if self.values.ndim != 1 or len(self.values) == 0 or not np.isfinite(self.values).all():
+                raise ValueError(f"Channel '{channel}' values must be a non empty list of numbers")
+            return
+
+        if not isinstance(spec["waveform"], str) or spec["waveform"] not in WAVEFORMS:
+            raise ValueError(
+                f"Unknown waveform '{spec['waveform']}' for channel '{channel}'; available: {', '.join(WAVEFORMS)}"
+            )
+        self.waveform = spec["waveform"]
+        # the parameters are checked now, the values are computed on the thread of the simulator
+        self.period, self.phase, self.offset, self.amplitude, self.low, self.high = (
+            to_number(spec.get(key, default), f"Channel '{channel}' {key}")
+            for key, default in (
+                ("period", 1.0), ("phase", 0.0), ("offset", 0.0), ("amplitude", 1.0), ("low", 0.0), ("high", 1.0)
+            )
+        )
+        if self.period <= 0:
+            raise ValueError(f"Channel '{channel}' period must be positive")
+
+    def update_times(self, start: int, stop: int) -> np.ndarray:
+        """ The update times in [start, stop) nanoseconds. """
+        if self.interval == 0:
+            return np.zeros(1 if start <= 0 < stop else 0, dtype=np.int64)
+        first = -(-start // self.interval)
+        last = -(-stop // self.interval)
+        return np.arange(first, last, dtype=np.int64) * self.interval
+
+    def values_at(self, times: np.ndarray) -> np.ndarray:
+        """ The value of the channel at the given nanoseconds, the last update holding until the next. """
+        if self.interval == 0:
+            return np.full(len(times), self.constant)
+
+        updates = times // self.interval
+        if self.kind == "values":
+            return self.values[updates % len(self.values)]
+
+        if self.waveform == "random":
+            return self.__random(updates)
+
+        cycle = (updates * self.interval / NANOSECONDS / self.period + self.phase / 360.0) % 1.0
+        if self.waveform == "sine":
+            shape = np.sin(2 * np.pi * cycle)
+        elif self.waveform == "triangle":
+            shape = 1.0 - 4.0 * np.abs(cycle - 0.5)
+        elif self.waveform == "square":
+            shape = np.where(cycle < 0.5, 1.0, -1.0)
+        else:  # sawtooth
+            shape = 2.0 * cycle - 1.0
+        return self.offset + self.amplitude * shape
+
+    def __random(self, updates: np.ndarray) -> np.ndarray:
+        low, high = self.low, self.high
+        values = np.empty(len(updates))
+        chunks = updates // RANDOM_CHUNK
+        for chunk in np.unique(chunks):
+            rng = np.random.default_rng([self.seed, CHANNELS.index(self.channel), int(chunk)])
+            drawn = rng.uniform(low, high, RANDOM_CHUNK)
+            selected = chunks == chunk
+            values[selected] = drawn[updates[selected] % RANDOM_CHUNK]
+        return values
+
+
+class Scenario:
+    """
+    A seeded scenario with one schedule per channel.
+
+    Args:
+        channels (Mapping): channel name to its description, see the module documentation.
+        duration (float): The scenario length in seconds.
+        seed (int): The seed of the random waveforms.
+        name (str): A name for reports.
+        repeat (bool): Start again at the end instead of stopping.
+
+    Raises:
+        ValueError: If the duration is not positive and finite or a channel is invalid.
+    """
+    def __init__(
+        self,
+        channels: Mapping[str, Mapping[str, Any]],
+        duration: float,
+        seed: int = 0,
+        name: str = "",
+        repeat: bool = False,
+    ) -> None:
+        self.duration = to_nanoseconds(to_number(duration, "The scenario duration"))
+        if self.duration <= 0:
+            raise ValueError("The scenario duration must be positive")
+        if not isinstance(channels, Mapping):
+            raise ValueError(f"The scenario channels must be an object, got {channels!r}")
+        unknown = set(channels) - set(CHANNELS)
+        if unknown:
+            raise ValueError(f"Unknown scenario channels: {', '.join(sorted(unknown))}")
+        self.seed = seed
+        self.name = name
+        self.repeat = repeat
+        self.schedules = [
+            ChannelSchedule(channel, channels.get(channel, {"constant": 0.0}), seed) for channel in CHANNELS
+        ]
+
+    @classmethod
+    def from_dict(cls, description: Mapping[str, Any]) -> "Scenario":
+        """
+        Raises:
+            ValueError: If the description is invalid.
+        """
+        if not isinstance(description, Mapping):
+            raise ValueError(f"A scenario must be an object, got {description!r}")
+        if "duration" not in description or "channels" not in description:
+            raise ValueError("A scenario needs a duration and channels")
+        seed = description.get("seed", 0)
+        if not isinstance(seed, int) or isinstance(seed, bool) or seed < 0:
+            raise ValueError(f"The scenario seed must be a non negative integer, got {seed!r}")
+        return cls(
+            description["channels"],
+            description["duration"],
+            seed,
+            str(description.get("name", "")),
+            bool(description.get("repeat", False)),
+        )
+
+    def samples(self, start: float, stop: float, start_time: float = 0.0) -> np.ndarray:
+        """
+        The merged samples of all channels with an update time in [start, stop) seconds.
+
+        Args:
+            start (float): The first scenario second, included.
+            stop (float): The last scenario second, excluded; clamped to the duration.
+            start_time (float): The timestamp of the scenario second 0.
+
+        Return:
+            np.ndarray: The samples as a structured array of ``SAMPLE_DTYPE``.
+        """
+        first, last = to_nanoseconds(start), min(to_nanoseconds(stop), self.duration)
+        times = np.unique(np.concatenate([schedule.update_times(first, last) for schedule in self.schedules]))
+
+        samples = np.empty(len(times), dtype=SAMPLE_DTYPE)
+        for schedule in self.schedules:
+            samples[schedule.channel] = schedule.values_at(times)
+        samples["timestamp"] = start_time + times / NANOSECONDS
+        return samples
+
+
+def load_scenario(path: str) -> Scenario:
+    """
+    Load a scenario file.
+
+    Raises:
+        ValueError: If the file is not a valid scenario.
+    """
+    with open(path, encoding="utf-8") as file:
+        try:
+            description = json.load(file)
+        except json.JSONDecodeError as error:
+            raise ValueError(f"{path} is not a JSON scenario: {error}")
+    try:
+        return Scenario.from_dict(description)
+    except ValueError as error:
+        raise ValueError(f"{path} is not a valid scenario: {error}")
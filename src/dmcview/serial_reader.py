@@ -0,0 +1,147 @@
+from typing import Optional
+
+from PySide6.QtCore import QEvent, QObject, QRunnable, Qt, QThreadPool, Signal, Slot
+from PySide6.QtWidgets import QApplication
+
+from dmcview.device_parser import DeviceParser, get_parser
+from dmcview.recording import RecorderRunner
+from dmcview.viewer import SampleViewer
+
+
+class SerialReaderSignal(QObject):
+    """ Define the signals available from a running serial reader thread"""
+
+    samples = Signal(object)  # numpy structured array of SAMPLE_DTYPE
+    error = Signal(str)
+
+
+class SerialReaderRunner(QRunnable):
+    """
+    class extends QRunnable to read a serial device in a separate thread.
+
+    The raw bytes are handed to the device manufacturer parser on the same thread, so the GUI
+    thread only receives decoded batches of samples through a queued signal.
+
+    Args:
+        port (str): The serial port device (for example /dev/ttyUSB0) or a pyserial URL.
+        parser (DeviceParser): The parser of the device manufacturer.
+        baudrate (int): The serial speed; the parser default is used when not supplied.
+    """
+    max_buffer_size = 1 << 20  # drop the oldest bytes when a parser never consumes the input
+
+    def __init__(
+        self, port: str, parser: DeviceParser, baudrate: Optional[int] = None, read_timeout: float = 0.05
+    ) -> None:
+        super().__init__()
+        self.signal = SerialReaderSignal()
+        self.port = port
+        self.parser = parser
+        self.baudrate = baudrate if baudrate is not None else parser.baudrate
+        self.read_timeout = read_timeout
+        self.running = True
+
+    @Slot()
+    def run(self) -> None:
+        try:
+            import serial  # pylint: disable=import-outside-toplevel
+        except ImportError:
+            self.signal.error.emit("pyserial is required to read a device: pip install dmc-view[serial]")
+            return
+
+        try:
+            connection = serial.serial_for_url(
+                self.port, baudrate=self.baudrate, timeout=self.read_timeout
+            )
+        except (serial.SerialException, ValueError) as error:
+            self.signal.error.emit(f"Can not open {self.port}: {error}")
+            return
+
+        buffer = bytearray()
+        with connection:
+            while self.running:
+                try:
+                    chunk = connection.read(max(1, connection.in_waiting))
+                except serial.SerialException as error:
+                    self.signal.error.emit(f"Reading {self.port} failed: {error}")
+                    return
+                if not chunk:
+                    continue
+
+                buffer.extend(chunk)
+                samples = self.parser.parse(buffer)
+                if len(samples):
+                    self.signal.samples.emit(samples)
+
+                if len(buffer) > self.max_buffer_size:
+                    del buffer[: len(buffer) - self.max_buffer_size]
+
+    def stop(self) -> None:
+        self.running = False
+
+
+class SerialViewer(SampleViewer):
+    """
+    This class represents the main GUI when a device is plugged on a serial port.
+
+    Args:
+        port (str): The serial port device.
+        manufacturer (str): The registered device manufacturer parser name.
+        baudrate (int): The serial speed; the parser default is used when not supplied.
+        renderer (str): the acceleration view renderer, "matplotlib" or "qpainter".
+        record (str): a session file recording every decoded sample, nothing recorded if not supplied.
+        perf_overlay (bool): show the performance counters at start.
+    """
+    def __init__(
+        self,
+        port: str,
+        manufacturer: str,
+        baudrate: Optional[int] = None,
+        renderer: str = "matplotlib",
+        record: Optional[str] = None,
+        perf_overlay: bool = False,
+    ) -> None:
+        super().__init__(renderer, perf_overlay)
+        self.thread_pool = QThreadPool()
+        self.runner = SerialReaderRunner(port, get_parser(manufacturer), baudrate)
+
+        self.connect_source(self.runner.signal.samples)
+        self.runner.signal.error.connect(self.__report_error, Qt.ConnectionType.QueuedConnection)
+
+        self.recorder: Optional[RecorderRunner] = None
+        if record is not None:
+            device = {"manufacturer": manufacturer, "port": port, "baudrate": self.runner.baudrate}
+            self.recorder = RecorderRunner(record, device)
+            # direct: the reader thread queues the batches to the recorder thread, not via the GUI
+            self.runner.signal.samples.connect(self.recorder.record, Qt.ConnectionType.DirectConnection)
+            self.recorder.signal.error.connect(self.__report_error, Qt.ConnectionType.QueuedConnection)
+            self.thread_pool.start(self.recorder)
+
+        self.thread_pool.start(self.runner)
+
+        self.setWindowTitle(f"DMC View - {port}")
+
+    def __report_error(self, message: str) -> None:
+        print(message)
+        self.setWindowTitle(f"DMC View - {message}")
+
+    def closeEvent(self, event: QEvent) -> None:  # pylint: disable=invalid-name
+        print("Closing serial port ...")
+        self.runner.stop()
+        if self.recorder is not None:
+            self.recorder.stop()
+        self.thread_pool.waitForDone()
+        event.accept()
+
+
+def start_serial(
+    port: str,
+    manufacturer: str,
+    baudrate: Optional[int] = None,
+    renderer: str = "matplotlib",
+    record: Optional[str] = None,
+    perf_overlay: bool = False,
+) -> None:
+    app = QApplication()
+    viewer = SerialViewer(port, manufacturer, baudrate, renderer, record, perf_overlay)
+    viewer.show()
+    app.exec()
@@ -1,113 +1,237 @@
-from random import uniform
+import math
+import threading
+import time
+from typing import Optional, Union
 
-from PySide6.QtCore import (
-    QEvent,
-    QObject,
-    QRunnable,
-    QThread,
-    QThreadPool,
-    Signal,
-    Slot,
-)
-from PySide6.QtWidgets import QApplication, QHBoxLayout, QWidget
+import numpy as np
+from PySide6.QtCore import QEvent, QObject, QRunnable, QThreadPool, Signal, Slot
+from PySide6.QtWidgets import QApplication
 
-from dmcview.acceleration import Accelaration3D
-from dmcview.compass import Compass
+from dmcview.constants import SIMULATOR_DECLINATION, SIMULATOR_RATE_RANGE
+from dmcview.device_parser import SAMPLE_DTYPE
+from dmcview.scenario import NANOSECONDS, Scenario, load_scenario
+from dmcview.viewer import SampleViewer
 
 
 class SimulatorSignal(QObject):
     """ Define the signals available from a running worker thread"""
 
-    result = Signal(
-        str, str, str, str, str, str
-    )  # azimuth, elevation, bank and acceleration (x,y,z)
+    batch = Signal(object)  # numpy structured array of SAMPLE_DTYPE
 
 
 class SimulatorRunner(QRunnable):
     """
     class extends QRunnable to run in a separate thread.
 
-    It generates random values for azimuth, elevation (inclination), bank, and acceleration.
+    It generates random values for azimuth, elevation (inclination), bank, and acceleration at a
+    steady rate. The samples are generated with NumPy in blocks and emitted as typed batches; at
+    high rates one block holds the samples of one display frame.
 
+    Args:
+        rate (float): Samples per second, in ``SIMULATOR_RATE_RANGE``.
+        seed (int): The seed of the random generator, for reproducible streams.
+        declination (float): The declination of the samples in degrees.
+
+    Raises:
+        ValueError: If the rate is out of ``SIMULATOR_RATE_RANGE``.
     """
-    def __init__(self) -> None:
+    max_batches_per_second = 60  # the viewer shows one sample per frame, more batches are wasted
+
+    def __init__(
+        self, rate: float = 1.0, seed: Optional[int] = None, declination: float = SIMULATOR_DECLINATION
+    ) -> None:
         super().__init__()
+        if not SIMULATOR_RATE_RANGE[0] <= rate <= SIMULATOR_RATE_RANGE[1]:
+            raise ValueError(
+                f"The simulator rate must be between {SIMULATOR_RATE_RANGE[0]} and "
+                f"{SIMULATOR_RATE_RANGE[1]} Hz, got {rate}"
+            )
         self.signal = SimulatorSignal()
+        self.rate = rate
+        self.declination = declination
+        self.block_size = max(1, math.ceil(rate / self.max_batches_per_second))
+        self.rng = np.random.default_rng(seed)
         self.running = True
+        self.wakeup = threading.Event()
+
+    def generate(self, first: int, count: int, start_time: float = 0.0) -> np.ndarray:
+        """
+        Generate a block of samples.
+
+        Args:
+            first (int): The number of the first sample since the start of the stream.
+            count (int): The number of samples.
+            start_time (float): The timestamp of the sample number 0.
+
+        Return:
+            np.ndarray: The samples as a structured array of ``SAMPLE_DTYPE``.
+        """
+        samples = np.empty(count, dtype=SAMPLE_DTYPE)
+        samples["azimuth"] = np.round(self.rng.uniform(20.0, 40.0, count), 2)
+        samples["elevation"] = np.round(self.rng.uniform(20.0, 35.0, count), 2)
+        samples["bank"] = np.round(self.rng.uniform(30.0, 45.0, count), 2)
+        samples["declination"] = self.declination
+        samples["x"] = np.round(self.rng.uniform(5.0, 15.0, count), 1)
+        samples["y"] = samples["x"]
+        samples["z"] = 0.0
+        samples["timestamp"] = start_time + np.arange(first, first + count) / self.rate
+        return samples
 
     @Slot()
     def run(self) -> None:
+        start_time = time.monotonic()
+        produced = 0
         while self.running:
-            azimuth = round(uniform(20.0, 40.0), 2)
-            inclination = round(uniform(20.0, 35.0), 2)
-            bank = round(uniform(30.0, 45.0), 2)
-            x = round(uniform(5.0, 15.0), 1)
-            y = x
-            z = 0.0
-
-            print(
-                f"Azimuth:{azimuth}; Inclination(Elevation):{inclination}; Bank(Rotation):{bank}; \
-                acceleration:{ [x, y, z]}"
-            )
-            self.signal.result.emit(
-                str(azimuth), str(inclination), str(bank), str(x), str(y), str(z)
-            )
-            QThread.sleep(2)  # two seconds
+            samples = self.generate(produced, self.block_size, start_time)
+            produced += self.block_size
+
+            delay = samples["timestamp"][-1] - time.monotonic()  # emit when the last one is due
+            if delay > 0 and self.wakeup.wait(delay):
+                break
+            self.signal.batch.emit(samples)
 
     def stop(self) -> None:
         self.running = False
+        self.wakeup.set()
 
 
-class Simulator(QWidget):
+class FleetSimulatorRunner(QRunnable):
     """
-    This class represents the main GUI.
+    class extends QRunnable to simulate many units in one thread.
 
-    The simulator class Load, initiates and keeps track of all models being simulated, keeps track of time,
-    Initialize the plots.
+    Each unit is a SimulatorRunner used as a generator only, with its own seed and signal, so the
+    units connect to the views like separate simulators; one thread wakes up for all of them.
 
+    Args:
+        units (int): The number of simulated units.
+        rate (float): Samples per second of each unit, in ``SIMULATOR_RATE_RANGE``.
+        seed (int): The seed of the first unit, the next units use the following seeds.
+
+    Raises:
+        ValueError: If the rate is out of ``SIMULATOR_RATE_RANGE``.
     """
-    def __init__(self) -> None:
+    def __init__(self, units: int, rate: float = 1.0, seed: int = 0) -> None:
         super().__init__()
-        self.thread_pool = QThreadPool()
-        self.runner = SimulatorRunner()
+        self.units = [SimulatorRunner(rate, seed + number) for number in range(units)]
+        self.rate = rate
+        self.block_size = max(1, math.ceil(rate / SimulatorRunner.max_batches_per_second))
+        self.running = True
+        self.wakeup = threading.Event()
 
-        layout = QHBoxLayout(self)
-        self.compass = Compass()
-        layout.addWidget(self.compass)
+    @Slot()
+    def run(self) -> None:
+        start_time = time.monotonic()
+        produced = 0
+        while self.running:
+            delay = start_time + (produced + self.block_size - 1) / self.rate - time.monotonic()
+            if delay > 0 and self.wakeup.wait(delay):
+                break
+            for unit in self.units:
+                unit.signal.batch.emit(unit.generate(produced, self.block_size, start_time))
+            produced += self.block_size
+
+    def stop(self) -> None:
+        self.running = False
+        self.wakeup.set()
 
-        self.canvas = Accelaration3D()
-        self.canvas.setFixedSize(350, 350)
-        layout.addWidget(self.canvas)
 
-        self.runner.signal.result.connect(self.__update)
-        self.thread_pool.start(self.runner)
+class ScenarioRunner(QRunnable):
+    """
+    class extends QRunnable to play a scenario in a separate thread.
 
-        self.compass.update_declination(10.5)
-        self.setWindowTitle("Simulator")
+    All the channels are merged by one thread; a batch holds the samples of one display frame and
+    is emitted when its last sample is due.
 
-    def __update(
-        self, azimuth: str, elevation: str, bank: str, x: str, y: str, z: str
+    Args:
+        scenario (Scenario): The scenario to play.
+    """
+    max_batches_per_second = 60
+
+    def __init__(self, scenario: Scenario) -> None:
+        super().__init__()
+        self.signal = SimulatorSignal()
+        self.scenario = scenario
+        self.running = True
+        self.wakeup = threading.Event()
+
+    @Slot()
+    def run(self) -> None:
+        window = NANOSECONDS // self.max_batches_per_second
+        start_time = time.monotonic()
+        while self.running:
+            for start in range(0, self.scenario.duration, window):
+                samples = self.scenario.samples(start / NANOSECONDS, (start + window) / NANOSECONDS, start_time)
+                if len(samples) == 0:
+                    continue
+                delay = samples["timestamp"][-1] - time.monotonic()
+                if (delay > 0 and self.wakeup.wait(delay)) or not self.running:
+                    return
+                self.signal.batch.emit(samples)
+
+            if not self.scenario.repeat:
+                return
+            start_time += self.scenario.duration / NANOSECONDS
+
+    def stop(self) -> None:
+        self.running = False
+        self.wakeup.set()
+
+
+class Simulator(SampleViewer):
+    """
+    This class represents the main GUI.
+
+    The simulator class Load, initiates and keeps track of all models being simulated, keeps track of time,
+    Initialize the plots.
+
+    Args:
+        renderer (str): the acceleration view renderer, "matplotlib" or "qpainter".
+        rate (float): the simulated samples per second, from 1 Hz to 10 kHz.
+        scenario (Scenario): a scripted scenario played instead of the random samples.
+        perf_overlay (bool): show the performance counters at start.
+        declination (float): the declination of the random samples in degrees.
+
+    """
+    def __init__(
+        self,
+        renderer: str = "matplotlib",
+        rate: float = 1.0,
+        scenario: Optional[Scenario] = None,
+        perf_overlay: bool = False,
+        declination: float = SIMULATOR_DECLINATION,
     ) -> None:
-        """
-        This method updates the compass's new values from the SimulatorRunner class.
-        """
-        self.compass.update_angle(float(azimuth))
-        self.compass.set_elevation(float(elevation))
-        self.compass.set_rotation(float(bank))
-        self.canvas.update_acceleration(
-            round(float(x), 1), round(float(y), 1), round(float(z), 1)
-        )
+        super().__init__(renderer, perf_overlay)
+        self.thread_pool = QThreadPool()
+        self.runner: Union[ScenarioRunner, SimulatorRunner]
+        if scenario is not None:
+            self.runner = ScenarioRunner(scenario)
+            self.setWindowTitle(f"Simulator - {scenario.name or 'scenario'}")
+        else:
+            self.runner = SimulatorRunner(rate, declination=declination)
+            self.setWindowTitle(f"Simulator - {rate:g} Hz")
+
+        self.connect_source(self.runner.signal.batch)
+        self.thread_pool.start(self.runner)
 
     def closeEvent(self, event: QEvent) -> None:
         # Stop any running threads/timers/simulations here
         print("Shutting down simulator ...")
         self.runner.stop()
+        self.thread_pool.waitForDone()
         event.accept()
 
 
-def start_simulator() -> None:
+def start_simulator(
+    renderer: str = "matplotlib",
+    rate: float = 1.0,
+    scenario: Optional[str] = None,
+    perf_overlay: bool = False,
+    declination: float = SIMULATOR_DECLINATION,
+) -> None:
     app = QApplication()
-    sim = Simulator()
+    sim = Simulator(
+        renderer, rate, load_scenario(scenario) if scenario is not None else None, perf_overlay, declination
+    )
     sim.show()
     app.exec()
 
@@ -0,0 +1,207 @@
+"""Scrolling strip chart of the telemetry history"""
+
+import math
+from collections.abc import Sequence
+from typing import NamedTuple, Optional
+
+import numpy as np
+from PySide6.QtCore import QEvent, QLineF, QPointF, QRectF, QSize, Qt
+from PySide6.QtGui import QColor, QFont, QPainter, QPen, QPixmap, QStaticText
+from PySide6.QtWidgets import QWidget
+
+from dmcview.compass import device_pixel_ratio
+from dmcview.history import SampleHistory
+
+
+class ChartLane(NamedTuple):
+    """ A horizontal band of the chart with the traces of some sample fields on a fixed range. """
+    label: str
+    fields: tuple[str, ...]
+    low: float
+    high: float
+    circular: bool = False  # the range is one turn, the traces wrap around instead of jumping
+
+
+STRIP_LANES = (
+    ChartLane("Azimuth", ("azimuth",), 0.0, 360.0, True),
+    ChartLane("Elevation", ("elevation",), -90.0, 90.0),
+    ChartLane("Bank", ("bank",), -180.0, 180.0, True),
+    ChartLane("Acceleration x y z", ("x", "y", "z"), -20.0, 20.0),
+)
+TRACE_COLORS = (QColor(0, 0, 139), QColor(139, 0, 0), QColor(0, 100, 0))  # the fields of a lane in order
+BACKGROUND = QColor(250, 250, 250)
+GRID = QColor(210, 210, 210)
+
+
+class StripChart(QWidget):
+    """
+    The history of the channels over the last seconds, the newest samples on the right.
+
+    Every device pixel column shows the min/max envelope of its samples joined to the previous
+    column. The plot is kept in a pixmap: at each frame it is scrolled by the elapsed columns and
+    only the samples appended since the last frame are drawn, so the cost follows the input rate
+    and not the length of the history. It is drawn in full again only when the size changes or
+    time goes back.
+
+    Args:
+        history (SampleHistory): The samples to show.
+        seconds (float): The time span of the chart width.
+        lanes (Sequence[ChartLane]): The lanes from top to bottom.
+
+    Raises:
+        ValueError: If seconds is not positive.
+    """
+    def __init__(
+        self, history: SampleHistory, seconds: float = 120.0, lanes: Sequence[ChartLane] = STRIP_LANES
+    ) -> None:
+        super().__init__()
+        if seconds <= 0:
+            raise ValueError("The strip chart span must be positive")
+        self.history = history
+        self.seconds = seconds
+        self.lanes = tuple(lanes)
+        self.setMinimumSize(200, 40 * len(self.lanes))
+
+        self.pixmap: Optional[QPixmap] = None
+        self.dpr = 1.0
+        self.column_seconds = 1.0
+        self.right_column = 0  # the time column shown by the last pixel column
+        self.columns_drawn = 0  # the pixel columns cleared since the last full redraw
+        self.drawn = 0  # the samples appended to the history when the chart was last drawn
+        self.labels = [QStaticText(f"{lane.label}  {lane.low:g} .. {lane.high:g}") for lane in self.lanes]
+        self.label_font = QFont("Arial", 8)
+
+    def sizeHint(self) -> QSize:  # pylint: disable=invalid-name
+        return QSize(960, 60 * len(self.lanes))
+
+    def advance(self, *_: object) -> None:
+        """ Draw the samples appended to the history since the last frame and repaint. """
+        pixmap = self.pixmap
+        if pixmap is not None and pixmap.size() == self.__pixmap_size(self.dpr) and len(self.history):
+            newest = float(self.history.last(1)["timestamp"][0])
+            self.__scroll_to(pixmap, math.floor(newest / self.column_seconds))
+        self.update()
+
+    def redraw(self) -> None:
+        """ Draw the whole chart again, at the next paint. """
+        self.pixmap = None
+        self.update()
+
+    def paintEvent(self, _: QEvent) -> None:  # pylint: disable=invalid-name
+        painter = QPainter(self)
+        dpr = device_pixel_ratio(painter)
+        pixmap = self.pixmap
+        if pixmap is None or dpr != self.dpr or pixmap.size() != self.__pixmap_size(dpr):
+            pixmap = self.__draw_all(dpr)
+        painter.drawPixmap(QRectF(self.rect()), pixmap, QRectF(pixmap.rect()))
+
+        painter.setPen(Qt.GlobalColor.black)
+        painter.setFont(self.label_font)
+        lane_height = self.height() / len(self.lanes)
+        for number, label in enumerate(self.labels):
+            painter.drawStaticText(QPointF(4, number * lane_height + 2), label)
+        painter.end()
+
+    def __pixmap_size(self, dpr: float) -> QSize:
+        """ The plot is drawn in device pixels, one time column per pixel column. """
+        return QSize(max(1, round(self.width() * dpr)), max(1, round(self.height() * dpr)))
+
+    def __draw_all(self, dpr: float) -> QPixmap:
+        """ Draw the whole chart in a new pixmap and return it. """
+        self.dpr = dpr
+        pixmap = self.pixmap = QPixmap(self.__pixmap_size(dpr))
+        width = pixmap.width()
+        self.column_seconds = self.seconds / width
+        newest = float(self.history.last(1)["timestamp"][0]) if len(self.history) else 0.0
+        self.right_column = math.floor(newest / self.column_seconds)
+        self.columns_drawn = 0
+
+        first = self.right_column - width + 1
+        samples = self.history.last()
+        start = int(np.searchsorted(samples["timestamp"], first * self.column_seconds))
+        # the one before joins the first column
+        self.__draw_columns(pixmap, first, first, samples[max(0, start - 1) :])
+        return pixmap
+
+    def __scroll_to(self, pixmap: QPixmap, right_column: int) -> None:
+        """ Move the right edge of the chart pixmap to a time column and draw the new samples. """
+        shift = right_column - self.right_column
+        if shift < 0 or shift >= pixmap.width():
+            self.__draw_all(self.dpr)
+            return
+        if shift:
+            pixmap.scroll(-shift, 0, pixmap.rect())
+        drawn_column = self.right_column  # the column of the newest sample drawn
+        self.right_column = right_column
+        # the samples appended since the last frame, joined to the newest one drawn
+        samples = self.history.last(self.history.appended - self.drawn + 1)
+        self.__draw_columns(pixmap, drawn_column + 1, drawn_column, samples)
+
+    def __draw_columns(self, pixmap: QPixmap, clear: int, first: int, samples: np.ndarray) -> None:
+        """
+        Clear the time columns from ``clear`` to the right one of the pixmap, then draw the samples
+        over the columns from ``first``; the lines of a column drawn again add up to its envelope.
+        """
+        width, height = pixmap.width(), pixmap.height()
+        x_clear = max(0, width - 1 - (self.right_column - clear))
+        x_first = max(0, width - 1 - (self.right_column - first))
+        self.columns_drawn += width - x_clear
+        self.drawn = self.history.appended
+
+        painter = QPainter(pixmap)
+        lane_height = height / len(self.lanes)
+        if x_clear < width:
+            painter.fillRect(QRectF(x_clear, 0, width - x_clear, height), BACKGROUND)
+            painter.setPen(QPen(GRID, self.dpr))
+            for number in range(len(self.lanes)):
+                middle = (number + 0.5) * lane_height
+                painter.drawLine(QLineF(x_clear, middle, width, middle))
+                if number:
+                    painter.drawLine(QLineF(x_clear, number * lane_height, width, number * lane_height))
+
+        if len(samples):
+            columns = np.floor(samples["timestamp"] / self.column_seconds).astype(np.int64)
+            x = (width - 1 - (self.right_column - columns)) + 0.5
+            for number, lane in enumerate(self.lanes):
+                top = number * lane_height
+                painter.setClipRect(QRectF(x_first, top, width - x_first, lane_height))
+                for field, color in zip(lane.fields, TRACE_COLORS):
+                    painter.setPen(QPen(color, self.dpr))
+                    painter.drawLines(self.__trace(lane, samples[field], columns, x, top, lane_height))
+        painter.end()
+
+    @staticmethod
+    def __trace(
+        lane: ChartLane, values: np.ndarray, columns: np.ndarray, x: np.ndarray, top: float, height: float
+    ) -> list[QLineF]:
+        """
+        The lines of one field: per column a vertical line over its values and a line from the
+        last value of the previous column to its first value.
+        """
+        values = np.asarray(values, dtype=np.float64)
+        span = lane.high - lane.low
+        if lane.circular:  # continuous across the turns, placed back in the range line by line
+            values = values[0] + np.concatenate(([0.0], np.cumsum((np.diff(values) + span / 2) % span - span / 2)))
+
+        starts = np.flatnonzero(np.diff(columns, prepend=columns[0] - 1))
+        ends = np.append(starts[1:], len(values)) - 1
+        column_x = x[starts]
+        low = np.minimum.reduceat(values, starts)
+        high = np.maximum.reduceat(values, starts)
+
+        x0 = np.concatenate((column_x, x[ends[:-1]]))
+        x1 = np.concatenate((column_x, column_x[1:]))
+        v0 = np.concatenate((low, values[ends[:-1]]))
+        v1 = np.concatenate((high, values[starts[1:]]))
+
+        if lane.circular:
+            shift = np.floor((np.minimum(v0, v1) - lane.low) / span) * span
+            v0, v1 = v0 - shift, v1 - shift
+            wraps = np.maximum(v0, v1) > lane.high  # drawn once more a turn lower, entering at the bottom
+            x0, x1 = np.concatenate((x0, x0[wraps])), np.concatenate((x1, x1[wraps]))
+            v0, v1 = np.concatenate((v0, v0[wraps] - span)), np.concatenate((v1, v1[wraps] - span))
+
+        scale = height / span
+        y0 = top + (lane.high - v0) * scale
+        y1 = top + (lane.high - v1) * scale
+        return [QLineF(*line) for line in np.column_stack((x0, y0, x1, y1)).tolist()]
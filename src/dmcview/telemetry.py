@@ -0,0 +1,155 @@
+"""Telemetry bus that carries the typed device values between the data sources and the widgets"""
+
+import math
+import threading
+import time
+from enum import Enum
+from typing import Any, Callable, NamedTuple, Optional
+
+from PySide6.QtCore import QObject, Qt, QTimer, Signal
+
+
+class Orientation(NamedTuple):
+    azimuth: float
+    elevation: float
+    bank: float
+
+
+class Acceleration(NamedTuple):
+    x: float
+    y: float
+    z: float
+
+
+class Declination(NamedTuple):
+    declination: float
+
+
+class Channel(Enum):
+    ORIENTATION = "orientation"
+    ACCELERATION = "acceleration"
+    DECLINATION = "declination"
+
+
+CHANNEL_TYPES: dict[Channel, type] = {
+    Channel.ORIENTATION: Orientation,
+    Channel.ACCELERATION: Acceleration,
+    Channel.DECLINATION: Declination,
+}
+
+
+class Subscription:
+    """
+    A callback subscribed to one channel of the bus.
+
+    Only the latest published value is kept until it is delivered, so a slow subscriber skips
+    the values it had no time for instead of queueing them.
+    """
+    def __init__(
+        self, channel: Channel, callback: Callable[[Any], None], max_rate: Optional[float] = None
+    ) -> None:
+        self.channel = channel
+        self.callback = callback
+        self.min_interval = 1.0 / max_rate if max_rate else 0.0
+        self.active = True
+        self.pending: Optional[Any] = None
+        self.scheduled = False
+        self.last_delivery = -math.inf
+
+
+class TelemetryBus(QObject):
+    """
+    Publish and subscribe bus with one typed channel per kind of telemetry.
+
+    Values can be published from any thread; they are delivered on the thread of the bus (the GUI
+    thread) through the event loop. Each subscriber has an optional rate limit and a latest value
+    wins drop policy.
+
+    """
+    _deliver = Signal(object)  # the Subscription with a pending value
+
+    def __init__(self, parent: Optional[QObject] = None) -> None:
+        super().__init__(parent)
+        self.lock = threading.Lock()
+        self.subscriptions: dict[Channel, list[Subscription]] = {channel: [] for channel in Channel}
+        self._deliver.connect(self.__deliver, Qt.ConnectionType.QueuedConnection)
+
+    def subscribe(
+        self,
+        channel: Channel,
+        callback: Callable[[Any], None],
+        max_rate: Optional[float] = None,
+        owner: Optional[QObject] = None,
+    ) -> Subscription:
+        """
+        Subscribe a callback to a channel; it is called with the channel value type.
+
+        Args:
+            channel (Channel): the channel to receive.
+            callback: called with an Orientation, Acceleration or Declination value.
+            max_rate (float): the most deliveries per second, unlimited if not supplied.
+            owner (QObject): the subscription is removed when the owner is destroyed.
+        """
+        subscription = Subscription(channel, callback, max_rate)
+        with self.lock:
+            self.subscriptions[channel].append(subscription)
+        if owner is not None:
+            owner.destroyed.connect(lambda: self.unsubscribe(subscription))
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        with self.lock:
+            subscription.active = False
+            if subscription in self.subscriptions[subscription.channel]:
+                self.subscriptions[subscription.channel].remove(subscription)
+
+    def subscriber_count(self, channel: Channel) -> int:
+        return len(self.subscriptions[channel])
+
+    def publish(self, channel: Channel, value: Any) -> None:
+        """
+        Publish a value to every subscriber of the channel.
+
+        Raises:
+            TypeError: If the value is not of the channel type.
+        """
+        expected = CHANNEL_TYPES[channel]
+        if not isinstance(value, expected):
+            raise TypeError(f"{channel.value} expects {expected.__name__}, got {type(value).__name__}")
+
+        to_schedule = []
+        with self.lock:
+            for subscription in self.subscriptions[channel]:
+                subscription.pending = value
+                if not subscription.scheduled:
+                    subscription.scheduled = True
+                    to_schedule.append(subscription)
+
+        for subscription in to_schedule:
+            self._deliver.emit(subscription)
+
+    def __deliver(self, subscription: Subscription) -> None:
+        wait = subscription.last_delivery + subscription.min_interval - time.monotonic()
+        if wait > 0:
+            QTimer.singleShot(math.ceil(wait * 1000), self, lambda: self.__deliver(subscription))
+            return
+
+        with self.lock:
+            value = subscription.pending
+            subscription.pending = None
+            subscription.scheduled = False
+
+        if subscription.active and value is not None:
+            subscription.last_delivery = time.monotonic()
+            subscription.callback(value)
+
+
+_default_bus: Optional[TelemetryBus] = None
+
+
+def default_bus() -> TelemetryBus:
+    """ The bus shared by the widgets that are not given their own. """
+    global _default_bus  # pylint: disable=global-statement
+    if _default_bus is None:
+        _default_bus = TelemetryBus()
+    return _default_bus
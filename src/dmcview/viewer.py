@@ -0,0 +1,102 @@
+import numpy as np
+from PySide6.QtCore import Qt, SignalInstance
+from PySide6.QtGui import QKeyEvent
+from PySide6.QtWidgets import QHBoxLayout, QVBoxLayout, QWidget
+
+from dmcview.acceleration_view import create_acceleration_view
+from dmcview.compass import Compass
+from dmcview.decimation import FrameDecimator, FrameSummary
+from dmcview.history import SampleHistory
+from dmcview.strip_chart import StripChart
+from dmcview.telemetry import Channel, Declination, Orientation, TelemetryBus
+
+
+class SampleViewer(QWidget):
+    """
+    Compass and 3D acceleration view fed with batches of decoded samples.
+
+    The data sources (serial device, recorded session, ...) deliver structured arrays of
+    ``SAMPLE_DTYPE``. Their samples are decimated to one summary per frame of the compass clock and
+    only the newest sample is shown. The values reach the widgets through the telemetry bus of the
+    viewer and every sample is kept in its history, shown by the strip chart under them.
+
+    Args:
+        renderer (str): the acceleration view renderer, "matplotlib" or "qpainter".
+        perf_overlay (bool): show the performance counters at start; F3 toggles them.
+
+    """
+    def __init__(self, renderer: str = "matplotlib", perf_overlay: bool = False) -> None:
+        super().__init__()
+        self.bus = TelemetryBus(self)
+
+        layout = QVBoxLayout(self)
+        views = QHBoxLayout()
+        layout.addLayout(views)
+        self.compass = Compass(bus=self.bus)
+        views.addWidget(self.compass)
+
+        self.canvas = create_acceleration_view(renderer, bus=self.bus)
+        self.canvas.setFixedSize(350, 350)
+        self.canvas.perf = self.compass.perf
+        views.addWidget(self.canvas)
+
+        self.compass.set_perf_overlay(perf_overlay)
+
+        self.history = SampleHistory()
+        self.chart = StripChart(self.history)
+        layout.addWidget(self.chart)
+        self.decimator = FrameDecimator(self.compass.clock, self, self.history)
+        self.decimator.frame.connect(self.show_frame)
+        self.decimator.frame.connect(self.chart.advance)
+
+    def connect_source(self, samples: SignalInstance) -> None:
+        """
+        Show the batches of a source running on another thread, one summary per frame.
+
+        The batches are counted and queued under the lock of the decimator on the thread of the
+        source; the clock tick on the GUI thread takes the queue and summarizes it, so the GUI thread
+        handles one frame whatever the input rate and the performance overlay shows how many samples
+        wait for the next frame.
+
+        Args:
+            samples (SignalInstance): the signal of the source emitting ``SAMPLE_DTYPE`` batches.
+        """
+        samples.connect(self.__count_received, Qt.ConnectionType.DirectConnection)
+        samples.connect(self.decimator.add, Qt.ConnectionType.DirectConnection)
+
+    def __count_received(self, samples: np.ndarray) -> None:
+        self.compass.perf.samples_received(len(samples))
+
+    def keyPressEvent(self, event: QKeyEvent) -> None:  # pylint: disable=invalid-name
+        if event.key() == Qt.Key.Key_F3:
+            self.compass.set_perf_overlay(not self.compass.perf_overlay)
+        else:
+            super().keyPressEvent(event)
+
+    def show_samples(self, samples: np.ndarray) -> None:
+        """
+        Show the newest sample of the batch.
+
+        Args:
+            samples (np.ndarray): decoded samples of ``SAMPLE_DTYPE`` in arrival order.
+        """
+        if len(samples) == 0:
+            return
+        self.compass.perf.samples_shown(len(samples))
+        self.show_sample(samples[-1])
+
+    def show_frame(self, summary: FrameSummary) -> None:
+        """ Show the newest sample of the samples received during a frame. """
+        self.compass.perf.samples_shown(summary.samples)
+        self.show_sample(summary.last)
+
+    def show_sample(self, sample: np.void) -> None:
+        """ Publish one ``SAMPLE_DTYPE`` record to the compass and the acceleration view. """
+        self.bus.publish(
+            Channel.ORIENTATION,
+            Orientation(float(sample["azimuth"]), float(sample["elevation"]), float(sample["bank"])),
+        )
+        self.bus.publish(Channel.DECLINATION, Declination(float(sample["declination"])))
+        self.canvas.update_acceleration(
+            round(float(sample["x"]), 1), round(float(sample["y"]), 1), round(float(sample["z"]), 1)
+        )
@@ -1,14 +1,169 @@
+"""
+Test configuration and the ``bench`` fixture timing the calls of the benchmarks in tests/test_benchmark.
+
+Each benchmark is saved under its test id; ``--bench-json`` writes them all and a previous file
+given with ``--bench-baseline`` fails the benchmarks whose mean got slower than the tolerance.
+"""
+
+import json
 import os
+import platform
+import time
+import tracemalloc
+from typing import Callable, Optional
 
+import numpy as np
 import pytest
+from PySide6 import __version__ as pyside_version
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--run-benchmarks", action="store_true", default=False, help="run the performance benchmarks"
+    )
+    parser.addoption(
+        "--bench-json", default=None, metavar="path", help="save the benchmark results as JSON"
+    )
+    parser.addoption(
+        "--bench-baseline", default=None, metavar="path",
+        help="fail the benchmarks slower than in this saved JSON result",
+    )
+    parser.addoption(
+        "--bench-tolerance", default=0.25, type=float, metavar="ratio",
+        help="allowed slow down against the baseline, 0.25 by default",
+    )
 
 
 def pytest_collection_modifyitems(config, items):  # noqa: ARG001
-    """Skip ALL GUI tests in CI"""
+    """Skip ALL GUI tests in CI and the benchmarks unless --run-benchmarks is given"""
+    if not config.getoption("--run-benchmarks"):
+        skip_benchmark = pytest.mark.skip(reason="benchmarks run with --run-benchmarks")
+        for item in items:
+            if "bench" in item.keywords:
+                item.add_marker(skip_benchmark)
+
     if os.getenv('CI'):
         skip_gui = pytest.mark.skip(reason="GUI tests skipped in CI")
-        gui_files = ['test_acceleration', 'test_compass', 'test_simulator']
+        gui_files = ['test_acceleration', 'test_compass', 'test_simulator', 'test_viewer',
+                     'test_animation', 'test_telemetry', 'test_acceleration_painter', 'test_render', 'test_replay',
+                     'test_dashboard', 'test_decimation', 'test_strip_chart']
 
         for item in items:
             if any(gui_file in item.nodeid for gui_file in gui_files):
                 item.add_marker(skip_gui)
+
+
+ALLOCATION_RUNS = 5  # tracemalloc slows the calls down, so allocations are measured apart
+
+
+def measure(
+    function: Callable[[], object],
+    setup: Optional[Callable[[], object]] = None,
+    repeat: int = 100,
+    warmup: int = 5,
+) -> dict[str, float]:
+    """
+    Time the function and measure the Python memory it allocates.
+
+    Args:
+        function: the measured call.
+        setup: called before each call, not measured.
+        repeat (int): the measured calls.
+        warmup (int): the calls before measuring, to fill the caches.
+
+    Return:
+        dict: mean, min, p50, p95 and p99 in milliseconds; the peak and the retained bytes
+        allocated by a call through the Python allocators (the Qt allocations are not seen).
+    """
+    for _ in range(warmup):
+        if setup is not None:
+            setup()
+        function()
+
+    durations = np.empty(repeat)
+    for run in range(repeat):
+        if setup is not None:
+            setup()
+        start = time.perf_counter()
+        function()
+        durations[run] = time.perf_counter() - start
+    durations *= 1000.0
+
+    peaks, retained = [], []
+    tracemalloc.start()
+    try:
+        for _ in range(ALLOCATION_RUNS):
+            if setup is not None:
+                setup()
+            tracemalloc.reset_peak()
+            before = tracemalloc.get_traced_memory()[0]
+            function()
+            current, peak = tracemalloc.get_traced_memory()
+            peaks.append(peak - before)
+            retained.append(current - before)
+    finally:
+        tracemalloc.stop()
+
+    return {
+        "runs": repeat,
+        "mean_ms": float(durations.mean()),
+        "min_ms": float(durations.min()),
+        "p50_ms": float(np.percentile(durations, 50)),
+        "p95_ms": float(np.percentile(durations, 95)),
+        "p99_ms": float(np.percentile(durations, 99)),
+        "alloc_peak_bytes": int(np.median(peaks)),
+        "alloc_retained_bytes": int(np.median(retained)),
+    }
+
+
+@pytest.fixture(scope="session")
+def bench_results(request):
+    results: dict[str, dict[str, float]] = {}
+    yield results
+
+    path = request.config.getoption("--bench-json")
+    if path and results:
+        report = {
+            "created": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+            "machine": platform.machine(),
+            "system": platform.platform(),
+            "python": platform.python_version(),
+            "pyside": pyside_version,
+            "results": results,
+        }
+        with open(path, "w", encoding="utf-8") as file:
+            json.dump(report, file, indent=2, sort_keys=True)
+
+
+@pytest.fixture(scope="session")
+def bench_baseline(request) -> dict[str, dict[str, float]]:
+    path = request.config.getoption("--bench-baseline")
+    if not path:
+        return {}
+    with open(path, encoding="utf-8") as file:
+        return json.load(file)["results"]
+
+
+@pytest.fixture
+def bench(request, bench_results, bench_baseline):
+    """ Measure a call with :func:`measure`, save it under the test id and compare it to the baseline. """
+    tolerance = request.config.getoption("--bench-tolerance")
+
+    def run(function, setup=None, repeat=100, warmup=5):
+        name = request.node.nodeid.split("::", 1)[1]
+        stats = measure(function, setup, repeat, warmup)
+        bench_results[name] = stats
+        print(
+            f"\n{name}: mean {stats['mean_ms']:.3f} ms, p95 {stats['p95_ms']:.3f} ms, "
+            f"p99 {stats['p99_ms']:.3f} ms, peak {stats['alloc_peak_bytes']} B"
+        )
+
+        baseline = bench_baseline.get(name)
+        if baseline is not None:
+            limit = baseline["mean_ms"] * (1.0 + tolerance)
+            assert stats["mean_ms"] <= limit, (
+                f"{name} regressed: {stats['mean_ms']:.3f} ms against {baseline['mean_ms']:.3f} ms"
+            )
+        return stats
+
+    return run
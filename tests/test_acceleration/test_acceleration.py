@@ -1,17 +1,12 @@
 from unittest.mock import MagicMock
 
+import numpy as np
 import pytest
 
-from dmcview.acceleration import Accelaration3D
+from dmcview.acceleration import Accelaration3D, arrow_segments
+from dmcview.telemetry import Acceleration, Channel
 
 
-@pytest.fixture
-def mock_signal_manager(monkeypatch):
-    """Mock the signal manager to track emitted values."""
-    mock_signal = MagicMock()
-    monkeypatch.setattr("dmcview.acceleration.signal_manager.data_signal", mock_signal)
-    return mock_signal
-
 @pytest.fixture
 def accel(monkeypatch):
     monkeypatch.setattr("dmcview.acceleration.QTimer", MagicMock())
@@ -23,6 +18,13 @@ def accel(monkeypatch):
     instance.quiver = MagicMock()
     return instance
 
+
+@pytest.fixture
+def mock_bus(accel):
+    """Mock the telemetry bus to track published values."""
+    accel.bus = MagicMock()
+    return accel.bus
+
 def test_update_acceleration_rounding(accel):
     accel.update_acceleration(1.1, 2.3, 4.5)
 
@@ -31,7 +33,7 @@ def test_update_acceleration_rounding(accel):
     assert accel.z == 4.4
 
 
-def test_update_acceleration_vector_positive(accel, mock_signal_manager):
+def test_update_acceleration_vector_positive(accel, mock_bus):
     """Verify update_acceleration_vector emits correct values and updates quiver."""
     accel.x, accel.y, accel.z = 2.0, 3.0, 4.0
     accel.target_x, accel.target_y, accel.target_z = 0.0, 0.0, 0.0
@@ -47,17 +49,18 @@ def test_update_acceleration_vector_positive(accel, mock_signal_manager):
     assert accel.target_y > 0
     assert accel.target_z > 0
 
-    # The signal was emitted with rounded floats
-    mock_signal_manager.emit.assert_called()
-    args = mock_signal_manager.emit.call_args[0]
-    assert len(args) == 3
-    assert all(isinstance(v, float) for v in args)
+    # The acceleration was published with rounded floats
+    mock_bus.publish.assert_called()
+    channel, value = mock_bus.publish.call_args[0]
+    assert channel == Channel.ACCELERATION
+    assert isinstance(value, Acceleration)
+    assert all(isinstance(v, float) for v in value)
 
     accel.draw.assert_called_once()
 
 
 
-def test_update_acceleration_vector_negative(accel, mock_signal_manager):
+def test_update_acceleration_vector_negative(accel, mock_bus):
     """Verify update_acceleration_vector emits correct values and updates quiver."""
     accel.x, accel.y, accel.z = 0.0, 0.0, 0.0
     accel.target_x, accel.target_y, accel.target_z = 2.0, 4.0, 5.5
@@ -73,10 +76,56 @@ def test_update_acceleration_vector_negative(accel, mock_signal_manager):
     assert accel.target_y != 4.0
     assert accel.target_z != 5.5
 
-    # The signal was emitted with rounded floats
-    mock_signal_manager.emit.assert_called()
-    args = mock_signal_manager.emit.call_args[0]
-    assert len(args) == 3
-    assert all(isinstance(v, float) for v in args)
+    # The acceleration was published with rounded floats
+    mock_bus.publish.assert_called()
+    channel, value = mock_bus.publish.call_args[0]
+    assert channel == Channel.ACCELERATION
+    assert isinstance(value, Acceleration)
+    assert all(isinstance(v, float) for v in value)
+
+    accel.draw.assert_called_once()
+
+
+def test_arrow_segments_geometry():
+    segments = arrow_segments(np.array([3.0, -4.0, 5.0]))
+
+    assert segments.shape == (3, 2, 3)
+    np.testing.assert_allclose(segments[0], [[3.0, -4.0, 5.0], [0.0, 0.0, 0.0]])
+    head_lengths = np.linalg.norm(segments[1:, 1] - segments[1:, 0], axis=1)
+    np.testing.assert_allclose(head_lengths, 0.3 * np.linalg.norm([3.0, -4.0, 5.0]))
+
+
+def test_arrow_segments_vertical_vector():
+    segments = arrow_segments(np.array([0.0, 0.0, 2.0]))
+    assert np.all(np.isfinite(segments))
 
+
+@pytest.mark.usefixtures("mock_bus")
+def test_blit_redraws_only_the_arrow(accel):
+    accel.background = object()
+    accel.restore_region = MagicMock()
+    accel.blit = MagicMock()
+    accel.x, accel.y, accel.z = 2.0, 0.0, 0.0
+
+    accel.update_acceleration_vector()
+
+    accel.restore_region.assert_called_once_with(accel.background)
+    accel.ax.draw_artist.assert_called_once_with(accel.quiver)
+    accel.blit.assert_called_once()
+    accel.draw.assert_not_called()
+
+
+@pytest.mark.usefixtures("mock_bus")
+def test_unchanged_arrow_not_redrawn(accel):
+    accel.update_acceleration_vector()
+    accel.update_acceleration_vector()
+    accel.draw.assert_called_once()
+
+
+@pytest.mark.usefixtures("mock_bus")
+def test_full_draw_mode(accel):
+    accel.blit_enabled = False
+    accel.background = object()
+    accel.x = 2.0
+    accel.update_acceleration_vector()
     accel.draw.assert_called_once()
@@ -0,0 +1,79 @@
+from unittest.mock import MagicMock
+
+import numpy as np
+import pytest
+
+from dmcview.acceleration_painter import PainterAcceleration3D, view_axes
+from dmcview.acceleration_view import create_acceleration_view
+from dmcview.telemetry import Acceleration, Channel
+
+
+@pytest.fixture
+def view():
+    widget = PainterAcceleration3D(bus=MagicMock())
+    widget.acceleration_timer.stop()
+    widget.resize(350, 350)
+    return widget
+
+
+def test_view_axes_orthonormal():
+    axes = view_axes(-115, 20, 3)
+    np.testing.assert_allclose(axes @ axes.T, np.eye(3), atol=1e-12)
+
+
+def test_projection_fits_widget(view):
+    view._PainterAcceleration3D__layout()
+    corners = np.array([[x, y, z] for x in (-15, 15) for y in (-15, 15) for z in (-15, 15)])
+    projected = view.project(corners)
+
+    assert projected[:, 0].min() >= 0 and projected[:, 0].max() <= 350
+    assert projected[:, 1].min() >= 30 and projected[:, 1].max() <= 350
+
+
+def test_perspective_projection(view):
+    view.perspective = True
+    view._PainterAcceleration3D__layout()
+    assert np.all(np.isfinite(view.project(np.array([[15.0, 15.0, 15.0]]))))
+
+
+def test_update_publishes_and_repaints(view):
+    view.update = MagicMock()
+    view.update_acceleration(2.0, 0.0, 0.0)
+
+    view.update_acceleration_vector()
+
+    view.bus.publish.assert_called_with(Channel.ACCELERATION, Acceleration(0.2, 0.0, 0.0))
+    view.update.assert_called_once()
+
+    view.x = view.target_x  # reached, nothing moves anymore
+    view.update_acceleration_vector()
+    view.update.assert_called_once()
+
+
+def test_reached_vector_stops_the_timer_and_the_publishing(view):
+    view.update_acceleration(0.4, 0.0, 0.0)
+    assert view.acceleration_timer.isActive()
+
+    view.update_acceleration_vector()
+    view.update_acceleration_vector()
+    assert view.bus.publish.call_count == 2
+    assert not view.acceleration_timer.isActive()  # reached
+
+    view.update_acceleration_vector()
+    assert view.bus.publish.call_count == 2  # the same vector is not published again
+
+    view.update_acceleration(0.0, 0.0, 0.0)
+    assert view.acceleration_timer.isActive()
+
+
+def test_paint_no_crash(view):
+    view.target_x, view.target_y, view.target_z = 5.0, 5.0, 5.0
+    image = view.grab()
+    assert not image.isNull()
+    assert view.background is not None
+
+
+def test_factory():
+    assert isinstance(create_acceleration_view("qpainter", bus=MagicMock()), PainterAcceleration3D)
+    with pytest.raises(ValueError, match="Unknown renderer"):
+        create_acceleration_view("opengl")
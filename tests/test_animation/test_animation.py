@@ -0,0 +1,69 @@
+import pytest
+
+from dmcview.animation import AnimationClock, angle_distance, approach_angle
+
+
+@pytest.mark.parametrize(
+    "current, target, step, expected",
+    [
+        (0.0, 10.0, 2.0, 2.0),
+        (10.0, 0.0, 2.0, 8.0),
+        (359.0, 1.0, 1.0, 0.0),
+        (1.0, 359.0, 1.0, 0.0),
+        (0.0, 10.0, 20.0, 10.0),
+        (0.0, 370.0, 20.0, 10.0),
+    ],
+)
+def test_approach_angle(current, target, step, expected):
+    assert approach_angle(current, target, step) == pytest.approx(expected)
+
+
+def test_angle_distance():
+    assert angle_distance(350, 10) == pytest.approx(20)
+    assert angle_distance(10, 350) == pytest.approx(20)
+
+
+def test_clock_stops_when_idle():
+    clock = AnimationClock(frame_rate=100)
+    frames = []
+
+    def animate(seconds):
+        frames.append(seconds)
+        return len(frames) < 2
+
+    clock.subscribe(animate)
+    clock.start()
+    assert clock.is_active()
+
+    clock._AnimationClock__tick()
+    assert clock.is_active()
+    clock._AnimationClock__tick()
+    assert not clock.is_active()
+    assert all(seconds >= 0 for seconds in frames)
+
+
+def test_clock_calls_every_subscriber():
+    clock = AnimationClock(frame_rate=100)
+    calls = []
+    clock.subscribe(lambda seconds: calls.append("a") or True)
+    clock.subscribe(lambda seconds: calls.append("b") or False)
+    clock.start()
+    clock._AnimationClock__tick()
+    assert calls == ["a", "b"]
+    assert clock.is_active()
+
+    clock.subscribe(lambda seconds: calls.append("input") or False, first=True)
+    clock._AnimationClock__tick()
+    assert calls[2:] == ["input", "a", "b"]
+
+
+def test_unsubscribe():
+    clock = AnimationClock(frame_rate=100)
+
+    def animate(_):
+        return True
+
+    clock.subscribe(animate)
+    clock.unsubscribe(animate)
+    clock.unsubscribe(animate)
+    assert clock.callbacks == []
@@ -0,0 +1,140 @@
+"""
+Paint path benchmarks of the compass and of the acceleration views on the offscreen platform.
+
+Run with: pytest --run-benchmarks tests/test_benchmark -s --bench-json results.json
+Compare with: pytest --run-benchmarks tests/test_benchmark --bench-baseline results.json
+"""
+
+import pytest
+from PySide6.QtCore import QSize, Qt
+from PySide6.QtGui import QImage, QPainter
+
+from dmcview.compass import Compass
+from dmcview.telemetry import TelemetryBus
+
+pytestmark = [pytest.mark.bench, pytest.mark.usefixtures("qapp")]
+
+SIZES = [QSize(600, 420), QSize(1200, 840), QSize(1920, 1080)]
+SIZE_IDS = [f"{size.width()}x{size.height()}" for size in SIZES]
+PIXEL_RATIOS = [1.0, 2.0]
+RATIO_IDS = ["dpr1", "dpr2"]
+
+DRAW_METHODS = [
+    "draw_cardinal_points",
+    "draw_lines",
+    "draw_arrow",
+    "draw_rotating_magnetic_north",
+    "draw_azimuth",
+    "draw_red_line",
+]
+
+
+def new_image(size: QSize, dpr: float) -> QImage:
+    image = QImage(size * dpr, QImage.Format.Format_ARGB32_Premultiplied)
+    image.setDevicePixelRatio(dpr)
+    image.fill(Qt.GlobalColor.white)
+    return image
+
+
+@pytest.fixture
+def compass():
+    compass = Compass(bus=TelemetryBus())
+    compass.show_state(azimuth=45.5, declination=10.5, bank=5.0, elevation=20.0, x=1.0, y=2.0, z=3.0)
+    compass.clock.stop()
+    return compass
+
+
+@pytest.mark.parametrize("dpr", PIXEL_RATIOS, ids=RATIO_IDS)
+@pytest.mark.parametrize("size", SIZES, ids=SIZE_IDS)
+def test_create_static_pixmap(bench, compass, size, dpr):
+    """ Drawing the dial, what a dial cache miss costs. """
+    compass.resize(size)
+    bench(lambda: compass.render_static_pixmap(size, dpr))
+
+
+@pytest.mark.parametrize("dpr", PIXEL_RATIOS, ids=RATIO_IDS)
+@pytest.mark.parametrize("size", SIZES, ids=SIZE_IDS)
+def test_paint_event(bench, compass, size, dpr):
+    """ The whole paintEvent, rendered into an image of the pixel ratio. """
+    compass.resize(size)
+    compass.create_static_pixmap()
+    image = new_image(size, dpr)
+    bench(lambda: compass.render(image))
+
+
+@pytest.mark.parametrize("dpr", PIXEL_RATIOS, ids=RATIO_IDS)
+@pytest.mark.parametrize("size", SIZES, ids=SIZE_IDS)
+def test_paint_event_azimuth_moving(bench, compass, size, dpr):
+    """ A frame of an azimuth animation: only the azimuth and text layers are drawn again. """
+    compass.resize(size)
+    compass.create_static_pixmap()
+    image = new_image(size, dpr)
+
+    def frame():
+        compass.current_angle = (compass.current_angle + 0.7) % 360
+        compass.render(image)
+
+    bench(frame)
+
+
+@pytest.mark.parametrize("dpr", PIXEL_RATIOS, ids=RATIO_IDS)
+@pytest.mark.parametrize("method", DRAW_METHODS)
+def test_draw_method(bench, compass, method, dpr):
+    size = SIZES[0]
+    compass.resize(size)
+    center, radius = compass.dial_geometry()
+    image = new_image(size, dpr)
+    painter = QPainter(image)
+    painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+    draw = getattr(compass, method)
+    if method == "draw_rotating_magnetic_north":
+        call = lambda: draw(painter, center, radius, compass.current_declination)  # noqa: E731
+    elif method == "draw_azimuth":
+        call = lambda: draw(painter, center, radius, compass.current_angle)  # noqa: E731
+    else:
+        call = lambda: draw(painter, center, radius)  # noqa: E731
+    try:
+        bench(call)
+    finally:
+        painter.end()
+
+
+def moving_arrow(view):
+    """ A setup that keeps the arrow moving so every measured step redraws it. """
+    def setup():
+        view.update_acceleration(14.0 if view.target_x <= 0 else -14.0, 6.0, 2.0)
+        view.target_x = 0.0
+    return setup
+
+
+@pytest.mark.parametrize("dpr", PIXEL_RATIOS, ids=RATIO_IDS)
+@pytest.mark.parametrize("size", SIZES[:2], ids=SIZE_IDS[:2])
+def test_acceleration_update_vector(bench, qapp, size, dpr):
+    from dmcview.acceleration import Accelaration3D  # pylint: disable=import-outside-toplevel
+
+    view = Accelaration3D(bus=TelemetryBus())
+    view.acceleration_timer.stop()
+    view.resize(size)
+    view.show()
+    qapp.processEvents()
+    view._set_device_pixel_ratio(dpr)  # pylint: disable=protected-access
+    assert view.device_pixel_ratio == dpr
+    view.draw()  # caches the background the arrow is blitted on
+    try:
+        bench(view.update_acceleration_vector, setup=moving_arrow(view), repeat=50)
+    finally:
+        view.close()
+
+
+@pytest.mark.parametrize("dpr", PIXEL_RATIOS, ids=RATIO_IDS)
+@pytest.mark.parametrize("size", SIZES[:2], ids=SIZE_IDS[:2])
+def test_painter_acceleration_frame(bench, size, dpr):
+    from dmcview.acceleration_painter import PainterAcceleration3D  # pylint: disable=import-outside-toplevel
+
+    view = PainterAcceleration3D(bus=TelemetryBus())
+    view.acceleration_timer.stop()
+    view.resize(size)
+    view.update_acceleration(14.0, 6.0, 2.0)
+    view.update_acceleration_vector()
+    image = new_image(size, dpr)
+    bench(lambda: view.render(image))
@@ -0,0 +1,100 @@
+"""
+Startup benchmarks: import time budget per module and cold start to the first painted frame.
+
+Run with: pytest --run-benchmarks tests/test_benchmark -s
+"""
+
+import os
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+import dmcview
+
+pytestmark = pytest.mark.bench
+
+SRC = str(Path(dmcview.__file__).parents[1])
+
+# cumulative import time budget in microseconds, as reported by python -X importtime
+IMPORT_BUDGETS = {
+    "dmcview.cli": 100_000,
+    "dmcview.compass": 600_000,
+    "dmcview.gui": 800_000,
+    "dmcview.acceleration_painter": 800_000,
+    "dmcview.simulator": 800_000,
+    "dmcview.acceleration": 2_500_000,
+}
+
+# seconds from starting the interpreter to the first paint of the compass
+FIRST_FRAME_BUDGETS = {"qpainter": 3.0, "matplotlib": 5.0}
+
+FIRST_FRAME_SCRIPT = """
+import sys
+from PySide6.QtCore import QEvent, QObject
+from PySide6.QtWidgets import QApplication
+from dmcview.gui import create_input_window
+
+class FirstPaint(QObject):
+    def eventFilter(self, watched, event):
+        if event.type() == QEvent.Type.Paint:
+            QApplication.instance().exit(0)
+        return False
+
+app = QApplication([])
+window = create_input_window(45.5, 10.5, 5.0, 20.0, (1.0, 2.0, 3.0), sys.argv[1])
+first_paint = FirstPaint()
+window.compass.installEventFilter(first_paint)
+window.show()
+app.exec()
+"""
+
+
+def run_python(*args: str) -> subprocess.CompletedProcess:
+    env = dict(os.environ, PYTHONPATH=SRC, QT_QPA_PLATFORM="offscreen")
+    return subprocess.run(
+        [sys.executable, *args], capture_output=True, text=True, check=True, env=env, timeout=60
+    )
+
+
+def cumulative_import_time(module: str) -> int:
+    """ The cumulative microseconds of the module import in a fresh interpreter. """
+    stderr = run_python("-X", "importtime", "-c", f"import {module}").stderr
+    for line in stderr.splitlines():
+        _, _, cumulative, name = (part.strip() for part in line.replace(":", "|", 1).split("|"))
+        if name == module:
+            return int(cumulative)
+    raise AssertionError(f"{module} not found in the import time report")
+
+
+@pytest.mark.parametrize("module", list(IMPORT_BUDGETS))
+def test_import_time_budget(module):
+    run_python("-c", f"import {module}")  # warm the file system cache and the bytecode
+    microseconds = min(cumulative_import_time(module) for _ in range(3))
+    print(f"\n{module}: {microseconds / 1000:.1f} ms (budget {IMPORT_BUDGETS[module] / 1000:.0f} ms)")
+    assert microseconds <= IMPORT_BUDGETS[module]
+
+
+@pytest.mark.parametrize("renderer", list(FIRST_FRAME_BUDGETS))
+def test_cold_start_to_first_frame(renderer):
+    run_python("-c", FIRST_FRAME_SCRIPT, renderer)  # warm up
+    durations = []
+    for _ in range(3):
+        start = time.perf_counter()
+        run_python("-c", FIRST_FRAME_SCRIPT, renderer)
+        durations.append(time.perf_counter() - start)
+
+    seconds = min(durations)
+    print(f"\nfirst frame with {renderer}: {seconds:.3f} s (budget {FIRST_FRAME_BUDGETS[renderer]} s)")
+    assert seconds <= FIRST_FRAME_BUDGETS[renderer]
+
+
+def test_version_is_fast():
+    start = time.perf_counter()
+    result = run_python("-m", "dmcview", "--version")
+    seconds = time.perf_counter() - start
+    print(f"\ndmcview --version: {seconds:.3f} s")
+    assert result.stdout.strip() == f"dmcview {dmcview.__version__}"
+    assert seconds <= 1.0
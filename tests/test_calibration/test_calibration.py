@@ -0,0 +1,95 @@
+import numpy as np
+import pytest
+
+from dmcview.calibration import EllipsoidFitter, calibrate
+from dmcview.fusion import RAW_DTYPE, RawVectorParser, fuse
+
+SOFT_IRON = np.array([[1.2, 0.1, -0.05], [0.1, 0.9, 0.08], [-0.05, 0.08, 1.05]])
+HARD_IRON = np.array([12.0, -30.0, 7.5])
+
+
+def sphere(count, radius=50.0, seed=3):
+    directions = np.random.default_rng(seed).normal(size=(count, 3))
+    return radius * directions / np.linalg.norm(directions, axis=1, keepdims=True)
+
+
+def distort(field, scale=1.0):
+    return (field @ SOFT_IRON + HARD_IRON) * scale
+
+
+def test_fit_maps_the_ellipsoid_on_a_sphere():
+    calibration = calibrate(distort(sphere(2000)))
+
+    np.testing.assert_allclose(calibration.offset, HARD_IRON, atol=1e-9)
+    corrected = calibration.apply(distort(sphere(500, seed=4)))
+    radii = np.linalg.norm(corrected, axis=1)
+    assert radii.std() / radii.mean() < 1e-9
+    assert radii.mean() == pytest.approx(50.0 * np.cbrt(np.linalg.det(SOFT_IRON)))  # same volume
+    assert calibration.residual < 1e-9
+    # the soft iron is undone up to a rotation
+    rotation = SOFT_IRON @ calibration.matrix * (50.0 / radii.mean())
+    np.testing.assert_allclose(rotation @ rotation.T, np.eye(3), atol=1e-9)
+
+
+def test_incremental_fit_matches_one_fit_of_all_samples():
+    rng = np.random.default_rng(5)
+    field = distort(sphere(3000)) + rng.normal(scale=0.5, size=(3000, 3))
+    batches = np.array_split(field, 37)
+    fitter = EllipsoidFitter()
+    for batch in batches:
+        fitter.add(batch)
+    incremental = fitter.fit()
+    once = EllipsoidFitter()
+    once.add(batches[0])  # the first batch sets the scaling
+    once.add(np.concatenate(batches[1:]))
+    whole = once.fit()
+
+    assert fitter.count == 3000
+    np.testing.assert_allclose(incremental.offset, whole.offset, atol=1e-9)
+    np.testing.assert_allclose(incremental.matrix, whole.matrix, atol=1e-9)
+    np.testing.assert_allclose(incremental.offset, HARD_IRON, atol=0.2)
+    assert 0 < incremental.residual < 0.1
+
+
+def test_raw_sensor_counts_stay_well_conditioned():
+    calibration = calibrate(distort(sphere(1000), scale=1000.0))
+    np.testing.assert_allclose(calibration.offset, HARD_IRON * 1000.0, rtol=1e-9)
+
+
+def test_no_fit_until_the_samples_span_an_ellipsoid():
+    fitter = EllipsoidFitter()
+    assert fitter.fit() is None
+    field = sphere(200)
+    field[:, 2] = 0.0  # turned in the horizontal plane only
+    fitter.add(distort(field))
+    assert fitter.fit() is None
+
+    fitter.reset()
+    fitter.add(distort(sphere(200)))
+    assert fitter.count == 200 and fitter.fit() is not None
+
+
+def level_samples(magnetometer):
+    raw = np.zeros(len(magnetometer), dtype=RAW_DTYPE)
+    raw["az"] = 9.81
+    raw["mx"], raw["my"], raw["mz"] = magnetometer.T
+    return raw
+
+
+def test_calibrated_heading_of_raw_samples():
+    heading = np.linspace(0, 350, 36)
+    yaw = np.radians(heading)
+    field = np.column_stack((20.0 * np.cos(yaw), -20.0 * np.sin(yaw), np.full(36, 45.0)))  # level unit
+    raw = level_samples(distort(field))
+
+    parser = RawVectorParser()
+    parser.fitter = EllipsoidFitter()
+    parser.convert(level_samples(distort(sphere(2000))))  # the manoeuvre
+    parser.calibration = parser.fitter.fit()
+
+    uncalibrated = fuse(raw)["azimuth"]
+    calibrated = parser.convert(raw)["azimuth"]
+    assert np.abs((uncalibrated - heading + 180) % 360 - 180).max() > 10
+    # the soft iron correction is symmetric, its rotation of the field is the only error left
+    error = (calibrated - heading + 180) % 360 - 180
+    assert np.abs(error - error.mean()).max() < 5
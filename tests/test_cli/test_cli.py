@@ -1,11 +1,18 @@
+import os
+import subprocess
+import sys
+from pathlib import Path
 from unittest.mock import patch
 
+import pytest
+
 from dmcview import cli
+from dmcview.recording import MAGIC, SessionWriter
 
 
 def test_main_starts_simulator(monkeypatch):
     # Patch simulator to prevent real GUI
-    monkeypatch.setattr(cli, "start_simulator", lambda: print("simulator started"))
+    monkeypatch.setattr(cli, "start_simulator", lambda *_: print("simulator started"))
 
     test_args = ["dmcview", "-s", "Y"]
     with patch("sys.argv", test_args):
@@ -53,3 +60,174 @@ def test_get_acceleration_input_invalid(monkeypatch, capsys):
 
     assert result == (1, 2, 3)
 
+
+
+def test_main_starts_serial_with_device(monkeypatch):
+    calls = []
+    monkeypatch.setattr(cli, "start_serial", lambda *args: calls.append(args))
+
+    with patch("sys.argv", ["dmcview", "--port", "loop://", "--device", "dmc-binary"]):
+        cli.main()
+
+    assert calls == [("loop://", "dmc-binary", None, "matplotlib", None, False)]
+
+
+def test_main_records_serial_session(monkeypatch):
+    calls = []
+    monkeypatch.setattr(cli, "start_serial", lambda *args: calls.append(args))
+
+    with patch("sys.argv", ["dmcview", "--port", "loop://", "--record", "session.dmc"]):
+        cli.main()
+
+    assert calls == [("loop://", "generic", None, "matplotlib", "session.dmc", False)]
+
+
+def test_main_rejects_record_without_port():
+    with patch("sys.argv", ["dmcview", "-s", "Y", "--record", "session.dmc"]):
+        with pytest.raises(SystemExit):
+            cli.main()
+
+
+def test_main_rejects_unknown_device(monkeypatch):
+    monkeypatch.setattr(cli, "start_serial", lambda *args: None)
+
+    with patch("sys.argv", ["dmcview", "--port", "loop://", "--device", "nobody"]):
+        with pytest.raises(SystemExit):
+            cli.main()
+
+
+def test_cli_import_does_not_load_gui():
+    """Argument parsing, --version and argument errors must not pay for the GUI imports."""
+    code = (
+        "import sys, dmcview.cli; "
+        "print(sorted({m.split('.')[0] for m in sys.modules} & {'PySide6', 'matplotlib', 'numpy'}))"
+    )
+    env = dict(os.environ, PYTHONPATH=str(Path(cli.__file__).parents[1]))
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True, env=env
+    )
+    assert result.stdout.strip() == "[]"
+
+
+def test_main_starts_replay(monkeypatch, tmp_path):
+    calls = []
+    monkeypatch.setattr(cli, "start_replay", lambda *args: calls.append(args))
+    path = str(tmp_path / "session.dmc")
+    SessionWriter(path, {"manufacturer": "generic"}).close()
+
+    with patch("sys.argv", ["dmcview", "replay", path, "--speed", "10", "--renderer", "qpainter"]):
+        cli.main()
+    with patch("sys.argv", ["dmcview", "--renderer", "qpainter", "replay", path, "--fast"]):
+        cli.main()
+
+    assert calls == [(path, 10.0, False, "qpainter", False), (path, 1.0, True, "qpainter", False)]
+
+
+@pytest.mark.parametrize("content", [None, b"not a session", MAGIC + b"\x05"])
+def test_main_rejects_replay_session(monkeypatch, tmp_path, capsys, content):
+    monkeypatch.setattr(cli, "start_replay", lambda *_: pytest.fail("the replay started"))
+    path = tmp_path / "session.dmc"
+    if content is not None:
+        path.write_bytes(content)
+
+    with patch("sys.argv", ["dmcview", "replay", str(path)]):
+        with pytest.raises(SystemExit):
+            cli.main()
+    assert "invalid session" in capsys.readouterr().err
+
+
+def test_main_rejects_replay_speed():
+    with patch("sys.argv", ["dmcview", "replay", "session.dmc", "--speed", "1000"]):
+        with pytest.raises(SystemExit):
+            cli.main()
+
+
+def test_main_starts_dashboard(monkeypatch):
+    calls = []
+    monkeypatch.setattr(cli, "start_dashboard", lambda *args: calls.append(args))
+
+    with patch("sys.argv", ["dmcview", "dashboard", "loop://", "loop://", "--device", "generic", "--columns", "1"]):
+        cli.main()
+    with patch("sys.argv", ["dmcview", "--rate", "50", "dashboard", "--simulate", "48"]):
+        cli.main()
+
+    assert calls == [
+        (["loop://", "loop://"], "generic", None, 0, 1.0, 1),
+        ([], "generic", None, 48, 50.0, None),
+    ]
+
+
+@pytest.mark.parametrize(
+    "arguments",
+    [[], ["--simulate", "-1"], ["--simulate", "2", "--columns", "0"], ["loop://", "--device", "nobody"]],
+)
+def test_main_rejects_dashboard(monkeypatch, arguments):
+    monkeypatch.setattr(cli, "start_dashboard", lambda *args: None)
+
+    with patch("sys.argv", ["dmcview", "dashboard", *arguments]):
+        with pytest.raises(SystemExit):
+            cli.main()
+
+
+def test_main_starts_simulator_at_rate(monkeypatch):
+    calls = []
+    monkeypatch.setattr(cli, "start_simulator", lambda *args: calls.append(args))
+
+    with patch("sys.argv", ["dmcview", "-s", "Y", "--rate", "10000"]):
+        cli.main()
+    assert calls == [("matplotlib", 10000.0, None, False, 10.5)]
+
+    with patch("sys.argv", ["dmcview", "-s", "Y", "--rate", "0.1"]):
+        with pytest.raises(SystemExit):
+            cli.main()
+
+
+def test_main_starts_simulator_scenario(monkeypatch, tmp_path):
+    calls = []
+    monkeypatch.setattr(cli, "start_simulator", lambda *args: calls.append(args))
+    scenario = tmp_path / "scenario.json"
+    scenario.write_text('{"duration": 10, "channels": {"azimuth": {"values": [1, 2], "interval": 0.1}}}')
+
+    with patch("sys.argv", ["dmcview", "-s", "Y", "--scenario", str(scenario)]):
+        cli.main()
+    assert calls == [("matplotlib", 1.0, str(scenario), False, 10.5)]
+
+    scenario.write_text('{"duration": 10, "channels": {"heading": {"constant": 1}}}')
+    with patch("sys.argv", ["dmcview", "-s", "Y", "--scenario", str(scenario)]):
+        with pytest.raises(SystemExit):
+            cli.main()
+
+    scenario.write_text('{"duration": 10, "channels": {"azimuth": {"constant": {"value": 1}}}}')
+    with patch("sys.argv", ["dmcview", "-s", "Y", "--scenario", str(scenario)]):
+        with pytest.raises(SystemExit):
+            cli.main()
+
+
+def test_main_perf_overlay(monkeypatch):
+    calls = []
+    monkeypatch.setattr(cli, "start_simulator", lambda *args: calls.append(args))
+
+    with patch("sys.argv", ["dmcview", "-s", "Y", "--perf-overlay"]):
+        cli.main()
+
+    assert calls == [("matplotlib", 1.0, None, True, 10.5)]
+
+
+def test_main_declination_at_position(monkeypatch):
+    calls = []
+    monkeypatch.setattr(cli, "start_simulator", lambda *args: calls.append(args))
+    monkeypatch.setattr(cli, "position_declination", lambda latitude, longitude: latitude + longitude)
+
+    with patch("sys.argv", ["dmcview", "-s", "Y", "--position", "48.1", "11.5"]):
+        cli.main()
+    assert calls == [("matplotlib", 1.0, None, False, 59.6)]
+
+    for position in (["91", "0"], ["nan", "0"], ["45", "nan"], ["45", "180.5"], ["45", "-inf"]):
+        with patch("sys.argv", ["dmcview", "-s", "Y", "--position", *position]):
+            with pytest.raises(SystemExit):
+                cli.main()
+    assert len(calls) == 1
+
+
+def test_position_declination():
+    assert cli.position_declination(0.0, 0.0) == pytest.approx(-3.7, abs=0.5)  # WMM-2025 over the validity
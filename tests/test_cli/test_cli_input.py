@@ -9,14 +9,16 @@ from dmcview.cli import start_input
 @pytest.fixture
 def fake_args():
     """Return args namespace with all fields None (forcing input mode)."""
-    return SimpleNamespace(a=None, d=None, b=None, e=None, ac=None)
+    return SimpleNamespace(
+        a=None, d=None, b=None, e=None, ac=None, renderer="matplotlib", perf_overlay=False, position=None
+    )
 
 
-@patch("dmcview.cli.QApplication")  # prevent real app window
-@patch("dmcview.cli.QWidget")
-@patch("dmcview.cli.QHBoxLayout")
-@patch("dmcview.cli.Accelaration3D")
-@patch("dmcview.cli.Compass")
+@patch("dmcview.gui.QApplication")  # prevent real app window
+@patch("dmcview.gui.QWidget")
+@patch("dmcview.gui.QHBoxLayout")
+@patch("dmcview.gui.create_acceleration_view")
+@patch("dmcview.gui.Compass")
 @patch("dmcview.cli.get_float_input")
 @patch("dmcview.cli.get_acceleration_input")
 def test_start_input_with_mocked_ui(
@@ -57,3 +59,17 @@ def test_start_input_with_mocked_ui(
     accel_instance.update_acceleration.assert_called_with(1.0, 2.0, 3.0)
 
     mock_app_instance.exec.assert_called_once()  # app started
+
+
+@patch("dmcview.gui.start_input_window")
+@patch("dmcview.cli.position_declination", return_value=-3.7)
+@patch("dmcview.cli.get_float_input", side_effect=[45.5, 5.0, 20.0])
+@patch("dmcview.cli.get_acceleration_input", return_value=(0.0, 0.0, 0.0))
+def test_start_input_declination_at_position(_acc_input, float_input, declination, start_window, fake_args):
+    fake_args.position = [0.0, 0.0]
+
+    start_input(fake_args)
+
+    declination.assert_called_once_with(0.0, 0.0)
+    assert float_input.call_count == 3  # the declination is not asked
+    assert start_window.call_args.args[:2] == (45.5, -3.7)
@@ -4,7 +4,7 @@ import pytest
 from PySide6.QtCore import QPointF
 from PySide6.QtGui import QPaintEvent
 
-from dmcview.compass import Compass
+from dmcview.compass import Compass, PixmapCache
 
 
 @pytest.fixture
@@ -21,7 +21,7 @@ def test_initial_state(compass):
     assert compass.target_declination == 0.0
     assert compass.elevation == 0.0
     assert compass.rotation == 0.0
-    assert not compass.signal_connected
+    assert len(compass.subscriptions) == 3
 
 
 def test_update_angle_and_declination(compass):
@@ -46,26 +46,78 @@ def test_rotation_and_elevation(compass):
     assert compass.elevation == 15
 
 def test_angle_animation(compass):
-    """Simulate a timer tick — rotation animation should change current_angle."""
+    """Simulate a frame — rotation animation should change current_angle by elapsed time."""
     compass.target_angle = 10.0
     compass.current_angle = 0.0
-    compass._Compass__rotate_angle()
-    assert compass.current_angle != 0.0
+    compass._Compass__rotate_angle(0.05)
+    assert compass.current_angle == pytest.approx(0.05 * compass.degrees_per_second)
 
 
 def test_declination_animation(compass):
     """Simulate declination animation."""
     compass.target_declination = 10.0
     compass.current_declination = 0.0
-    compass._Compass__animate_declination()
+    compass._Compass__animate_declination(0.01)
     assert compass.current_declination != 0.0
 
+
+def test_animation_takes_shortest_arc(compass):
+    compass.current_angle = 350.0
+    compass.target_angle = 10.0
+    compass._Compass__rotate_angle(0.05)
+    assert compass.current_angle == pytest.approx(355.0)
+
+
+def test_update_angle_starts_clock_and_idle_stops(compass):
+    assert not compass.clock.is_active()
+    compass.update_angle(90)
+    assert compass.clock.is_active()
+
+    assert compass._Compass__animate(10.0) is False  # reaches the target in one long frame
+    assert compass.current_angle == 90
+
+
+def test_animation_duration(compass):
+    compass.set_animation_duration(0.5)
+    compass.update_angle(180)
+    compass._Compass__animate(0.25)
+    assert compass.current_angle == pytest.approx(90)
+
+    compass.set_animation_duration(None)
+    assert compass.azimuth_speed == compass.degrees_per_second
+
 def test_create_static_pixmap_no_crash(compass):
     compass.resize(600, 420)
     compass.create_static_pixmap()
     assert compass.static_pixmap is not None
 
 
+def test_static_pixmap_at_physical_resolution(compass):
+    compass.resize(600, 420)
+    compass.create_static_pixmap(2.0)
+    assert compass.static_pixmap.size() == compass.size() * 2
+    assert compass.static_pixmap.devicePixelRatio() == 2.0
+
+
+def test_static_pixmaps_are_shared_and_least_recently_used_dropped():
+    cache = PixmapCache(capacity=2)
+    first, second = Compass(dial_cache=cache), Compass(dial_cache=cache)
+    first.resize(600, 420)
+    second.resize(600, 420)
+    first.create_static_pixmap(1.0)
+    second.create_static_pixmap(1.0)
+    assert second.static_pixmap is first.static_pixmap
+    assert (cache.hits, cache.misses) == (1, 1)
+
+    first.create_static_pixmap(2.0)
+    first.resize(800, 600)
+    first.create_static_pixmap(1.0)  # drops 600x420 at ratio 1, the least recently used
+    assert list(cache.pixmaps) == [(600, 420, 2.0), (800, 600, 1.0)]
+
+    with pytest.raises(ValueError):
+        PixmapCache(capacity=0)
+
+
 def test_draw_methods_run(compass):
     """
     Test all main draw methods using minimal mocks to avoid real GUI painting.
@@ -99,7 +151,135 @@ def test_draw_arrow_called(compass):
     compass.draw_arrow(painter, center, radius)
 
 
-    # assert that drawText and drawLine were called
-    assert painter.drawText.call_count == 3
+    # assert that the labels and drawLine were drawn
+    assert painter.drawStaticText.call_count == 3
     assert painter.drawLine.call_count == 1
     assert painter.drawPolygon.call_count == 3
+
+
+def test_apply_state_coalesces_repaints(compass):
+    with patch.object(compass, "update") as update:
+        compass.apply_state({"azimuth": 90, "elevation": 10}, bank=5, x=1.0, y=2.0, z=3.0)
+        compass.set_elevation(12)
+        update.assert_not_called()
+        assert compass.dirty == {"azimuth", "elevation", "bank", "x", "y", "z"}
+        assert compass.clock.is_active()
+
+        compass._Compass__animate(0.01)
+        update.assert_called_once()
+        assert not compass.dirty
+
+    assert compass.target_angle == 90
+    assert (compass.elevation, compass.rotation) == (12, 5)
+    assert (compass.x, compass.y, compass.z) == (1.0, 2.0, 3.0)
+
+
+def test_apply_identical_state_does_not_repaint(compass):
+    state = {"azimuth": 90.0, "declination": 10.0, "elevation": 10.0, "bank": 5.0, "x": 1.0, "y": 2.0, "z": 3.0}
+    compass.show_state(state)
+    compass._Compass__animate(0.01)
+    compass.clock.stop()
+
+    with patch.object(compass, "update") as update:
+        compass.apply_state(state)
+        compass.apply_state(azimuth=450.0, bank=5.0)  # the same target a turn later
+        compass.show_state(state)
+        assert not compass.dirty
+        assert not compass.clock.is_active()
+        compass._Compass__animate(0.01)
+        update.assert_not_called()
+
+        compass.apply_state(state, z=4.0)
+        assert compass.dirty == {"z"}
+        assert compass.clock.is_active()
+
+
+def test_apply_state_unknown_field(compass):
+    with pytest.raises(ValueError, match="speed"):
+        compass.apply_state(speed=3)
+
+
+def test_idle_frame_does_not_repaint(compass):
+    with patch.object(compass, "update") as update:
+        assert compass._Compass__animate(0.01) is False
+        update.assert_not_called()
+
+
+def test_show_state_jumps_to_the_target(compass):
+    compass.show_state(azimuth=370.0, declination=15.0, bank=4.0)
+    assert compass.current_angle == compass.target_angle == 10.0
+    assert compass.current_declination == 15.0
+    assert compass.rotation == 4.0
+
+
+def test_perf_overlay_toggle(compass):
+    compass.clock = MagicMock()
+    compass.set_perf_overlay(True)
+    assert compass.perf_overlay and compass.perf_timer.isActive()
+    compass.clock.subscribe.assert_called_once_with(compass.perf.record_tick)
+
+    compass.set_perf_overlay(False)
+    assert not compass.perf_overlay and not compass.perf_timer.isActive()
+    compass.clock.unsubscribe.assert_called_once_with(compass.perf.record_tick)
+
+
+def test_paint_records_perf(compass):
+    compass.resize(600, 420)
+    compass.create_static_pixmap()
+    compass.set_perf_overlay(True)
+    compass.grab()
+    assert len(compass.perf.frames) == 1
+    assert compass.perf.paint_last > 0
+
+
+def test_paint_resources_reuse_unchanged_text(compass):
+    compass.resize(600, 420)
+    resources = compass.paint_resources()
+    azimuth = resources.value_text("azimuth", "Azimuth: {} °", (45.501,), 2)
+    assert azimuth.text() == "Azimuth: 45.5 °"
+
+    with patch.object(azimuth, "setText") as set_text:
+        assert resources.value_text("azimuth", "Azimuth: {} °", (45.502,), 2) is azimuth
+        set_text.assert_not_called()  # the same string is not laid out again
+    assert resources.value_text("azimuth", "Azimuth: {} °", (46.0,), 2).text() == "Azimuth: 46.0 °"
+    assert compass.paint_resources() is resources
+
+
+def test_paint_resources_follow_the_size(compass):
+    compass.resize(600, 420)
+    resources = compass.paint_resources()
+    compass.resize(1200, 800)
+    resized = compass.paint_resources()
+    assert resized is not resources
+    assert resized.info_font.pointSize() == 15
+    assert (resized.center, resized.radius) == compass.dial_geometry()
+
+
+def test_layers_redrawn_only_when_their_inputs_change(compass):
+    compass.resize(600, 420)
+    compass.show_state(azimuth=45.0, declination=10.0, elevation=20.0, bank=5.0)
+    compass.grab()  # every layer changed, they are drawn directly
+    compass.grab()
+    assert compass.layers.renders == 5  # stable since the last frame, they are cached
+    compass.grab()
+    assert compass.layers.renders == 5  # nothing changed, every layer is blitted
+
+    compass.current_angle = 46.0
+    compass.grab()
+    assert compass.layers.renders == 5  # the azimuth and the text are drawn directly
+    compass.grab()
+    assert compass.layers.renders == 7
+
+    compass.resize(700, 500)
+    compass.grab()
+    compass.grab()
+    assert compass.layers.renders == 12
+
+
+def test_layer_pixmaps_cover_their_drawing_only(compass):
+    compass.resize(1200, 800)
+    compass.grab()
+    compass.grab()
+    _, _, marker, position = compass.layers.layers["declination"]
+    assert marker.width() < 200 and marker.height() < 200
+    assert compass.rect().contains(position)
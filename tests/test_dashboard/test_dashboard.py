@@ -0,0 +1,111 @@
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+
+from dmcview.dashboard import TILE_LAYOUT_SIZE, Dashboard, FleetViewer
+from dmcview.device_parser import SAMPLE_DTYPE
+from dmcview.simulator import FleetSimulatorRunner
+
+
+@pytest.fixture
+def dashboard():
+    return Dashboard([f"unit {number}" for number in range(5)])
+
+
+def test_tiles_share_the_clock_and_dial_cache(dashboard):
+    compasses = [tile.compass for tile in dashboard.tiles]
+    assert all(compass.clock is dashboard.clock for compass in compasses)
+    assert all(compass.dial_cache is dashboard.dial_cache for compass in compasses)
+    assert len({id(compass.bus) for compass in compasses}) == len(compasses)
+
+    layout = dashboard.layout()
+    assert (layout.rowCount(), layout.columnCount()) == (2, 3)  # about as wide as high
+
+
+def test_dashboard_needs_units_and_columns():
+    with pytest.raises(ValueError):
+        Dashboard([])
+    with pytest.raises(ValueError):
+        Dashboard(["unit"], columns=0)
+
+
+def test_show_samples_applies_the_newest_sample(dashboard):
+    tile = dashboard.tiles[1]
+    samples = np.array(
+        [(30, 25, 40, 10.5, 10, 10, 0, 0.0), (31, 26, 41, 11.5, 12.34, 5.67, 1.01, 0.1)], dtype=SAMPLE_DTYPE
+    )
+    tile.show_samples(samples)
+    tile.show_samples(samples[:0])
+
+    compass = tile.compass
+    assert compass.target_angle == 31.0
+    assert compass.target_declination == 11.5
+    assert (compass.elevation, compass.rotation) == (26.0, 41.0)
+    assert (compass.x, compass.y, compass.z) == (12.3, 5.7, 1.0)
+    assert dashboard.tiles[0].compass.target_angle == 0.0
+
+    tile.show_error("disconnected")
+    assert tile.title.text() == "unit 1: disconnected"
+
+
+def test_unchanged_tile_is_not_repainted(dashboard):
+    tile = dashboard.tiles[2]
+    sample = np.array([(30, 25, 40, 10.5, 10, 10, 0, 0.0)], dtype=SAMPLE_DTYPE)
+    tile.show_samples(sample)
+    tile.compass._Compass__animate(10.0)
+    dashboard.clock.stop()
+
+    with patch.object(tile.compass, "update") as update:
+        sample["timestamp"] = 0.1  # a newer sample of the same state
+        tile.show_samples(sample)
+        assert not tile.compass.dirty
+        assert not dashboard.clock.is_active()
+        tile.compass._Compass__animate(0.01)
+        update.assert_not_called()
+
+
+def test_tiles_draw_the_layout_scaled(dashboard, qtbot):
+    qtbot.addWidget(dashboard)
+    dashboard.resize(1000, 700)
+    dashboard.show()
+    qtbot.waitExposed(dashboard)
+
+    compasses = [tile.compass for tile in dashboard.tiles]
+    assert all(not compass.grab().isNull() for compass in compasses)
+    assert all(compass.paint_resources().size == TILE_LAYOUT_SIZE for compass in compasses)
+    # the tiles are laid out at the same size and drawn at the same scale, they blit one dial pixmap
+    assert len({compass.layout_scale() for compass in compasses}) == 1
+    assert dashboard.dial_cache.misses == 1
+
+
+def test_grid_cells_of_several_sizes_share_one_dial_pixmap(qtbot):
+    dashboard = Dashboard([f"unit {number}" for number in range(48)])
+    qtbot.addWidget(dashboard)
+    dashboard.resize(1234, 987)
+    dashboard.show()
+    qtbot.waitExposed(dashboard)
+
+    compasses = [tile.compass for tile in dashboard.tiles]
+    sizes = {(compass.width(), compass.height()) for compass in compasses}
+    assert len(sizes) > 1  # the cells differ by a pixel
+    for compass in compasses:
+        compass.grab()
+    assert dashboard.dial_cache.misses == 1
+    assert compasses[0].layout_scale() == min(
+        min(width / TILE_LAYOUT_SIZE.width(), height / TILE_LAYOUT_SIZE.height()) for width, height in sizes
+    )
+
+
+def test_fleet_viewer_simulates_the_units_in_one_thread(qtbot):
+    with patch.object(FleetSimulatorRunner, "run", lambda self: None):
+        viewer = FleetViewer(simulate=4, rate=50)
+    qtbot.addWidget(viewer)
+
+    assert [tile.name for tile in viewer.tiles] == [f"Simulator {number}" for number in range(1, 5)]
+    (simulator,) = viewer.runners
+    simulator.units[2].signal.batch.emit(simulator.units[2].generate(0, 1))
+    qtbot.waitUntil(lambda: viewer.tiles[2].compass.target_angle != 0.0)
+
+    viewer.close()
+    assert simulator.running is False
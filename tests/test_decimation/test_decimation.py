@@ -0,0 +1,70 @@
+import numpy as np
+import pytest
+
+from dmcview.animation import AnimationClock
+from dmcview.decimation import FrameDecimator, summarize
+from dmcview.device_parser import SAMPLE_DTYPE
+from dmcview.history import SampleHistory
+from dmcview.recording import RECORD_DTYPE
+
+
+def make_samples(**fields):
+    count = len(next(iter(fields.values())))
+    samples = np.zeros(count, dtype=SAMPLE_DTYPE)
+    for field, values in fields.items():
+        samples[field] = values
+    return samples
+
+
+def test_summarize_linear_fields():
+    summary = summarize(make_samples(elevation=[10, 30, 20], x=[1, -2, 4], timestamp=[0.0, 0.1, 0.2]))
+
+    assert summary.samples == 3
+    assert summary.last["elevation"] == 20
+    assert summary.mean["elevation"] == pytest.approx(20)
+    assert (summary.low["x"], summary.high["x"]) == (-2, 4)
+    assert (summary.low["timestamp"], summary.high["timestamp"]) == (0.0, 0.2)
+
+
+def test_summarize_angles_on_the_circle():
+    summary = summarize(make_samples(azimuth=[350, 10, 0], bank=[-179, 179, 180], declination=[1, 3, 2]))
+
+    # around north the arithmetic mean would point south
+    assert summary.mean["azimuth"] == pytest.approx(0, abs=1e-9)
+    assert (summary.low["azimuth"], summary.high["azimuth"]) == pytest.approx((-10, 10))
+    # on the turn of the newest sample, the envelope continuous across +-180
+    assert summary.mean["bank"] == pytest.approx(180)
+    assert (summary.low["bank"], summary.high["bank"]) == pytest.approx((179, 181))
+    assert summary.mean["declination"] == pytest.approx(2)
+
+
+def test_summarize_single_and_foreign_samples():
+    samples = make_samples(azimuth=[359.5], elevation=[12.0])
+    summary = summarize(samples)
+    assert summary.last == summary.mean == summary.low == summary.high == samples[0]
+
+    # records of a session file are converted, strided views included
+    records = make_samples(azimuth=[1, 2, 3, 4], z=[0, 1, 2, 3]).astype(RECORD_DTYPE)[::2]
+    assert summarize(records).mean["z"] == pytest.approx(1)
+
+    with pytest.raises(ValueError):
+        summarize(np.empty(0, dtype=SAMPLE_DTYPE))
+
+
+def test_decimator_passes_one_summary_per_frame(qtbot):
+    clock = AnimationClock(frame_rate=100)
+    history = SampleHistory()
+    decimator = FrameDecimator(clock, history=history)
+    frames = []
+    decimator.frame.connect(frames.append)
+
+    for number in range(10):
+        decimator.add(make_samples(azimuth=[number]))
+    decimator.add(np.empty(0, dtype=SAMPLE_DTYPE))
+    qtbot.waitUntil(lambda: len(frames) == 1)  # the samples woke the clock up
+
+    assert frames[0].samples == 10
+    assert frames[0].last["azimuth"] == 9
+    assert history.last()["azimuth"].tolist() == list(range(10))  # every sample is kept
+    qtbot.waitUntil(lambda: not clock.is_active())  # stopped by the first frame without samples
+    assert decimator.flush() is None
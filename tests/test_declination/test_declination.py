@@ -0,0 +1,95 @@
+import datetime
+
+import numpy as np
+import pytest
+
+from dmcview.declination import (
+    CAUTION_FIELD,
+    DeclinationGrid,
+    bundled_model,
+    decimal_year,
+    read_model,
+)
+
+# latitude, longitude, altitude km, decimal year and the declination of an independent WMM-2025 implementation
+REFERENCE = [
+    (89.0, -121.0, 28.0, 2025.0, -99.77460250),
+    (80.0, -96.0, 48.0, 2025.0, -29.91220276),
+    (0.0, 0.0, 0.0, 2027.5, -3.70751183),
+    (-80.0, 240.0, 100.0, 2027.5, 67.93164323),
+    (90.0, 0.0, 0.0, 2025.0, 14.00637267),
+]
+
+
+@pytest.fixture(scope="module")
+def grid():
+    return DeclinationGrid(resolution=2.0)
+
+
+def test_bundled_model():
+    model = bundled_model()
+    assert (model.name, model.epoch, model.degree, model.valid_until) == ("WMM-2025", 2025.0, 12, 2030.0)
+    assert model.g[1, 0] == -29351.8 and model.h_rate[1, 1] == -21.5
+    assert bundled_model() is model
+
+
+@pytest.mark.parametrize("latitude, longitude, altitude, year, expected", REFERENCE)
+def test_exact_declination(latitude, longitude, altitude, year, expected):
+    assert float(bundled_model().declination(latitude, longitude, year, altitude)) == pytest.approx(expected, abs=1e-6)
+
+
+def test_exact_evaluation_of_arrays():
+    latitude, longitude, altitude, year, expected = (np.array(column) for column in zip(*REFERENCE))
+    declination = bundled_model().declination(latitude, longitude, year, altitude)
+    np.testing.assert_allclose(declination, expected, atol=1e-6)
+
+    north, east, down = bundled_model().field(45.0, [0.0, 90.0], 2026.0)
+    assert north.shape == east.shape == down.shape == (2,)
+    assert (down > 0).all()  # the field points down in the northern hemisphere
+
+
+def test_grid_interpolates_the_exact_model(grid):
+    rng = np.random.default_rng(11)
+    latitude = rng.uniform(-90, 90, 5000)
+    longitude = rng.uniform(-180, 180, 5000)
+    year = rng.uniform(2025, 2030, 5000)
+
+    error = grid.declination(latitude, longitude, year) - bundled_model().declination(latitude, longitude, year)
+    assert np.abs((error + 180) % 360 - 180).max() < 0.1
+
+
+def test_grid_falls_back_to_the_exact_model_near_the_magnetic_poles(grid):
+    latitude, longitude = 85.0, -140.0  # close to the north magnetic pole
+    north, east, _ = bundled_model().field(latitude, longitude, 2026.0)
+    assert np.hypot(north, east) < CAUTION_FIELD
+    assert grid.exact[round((latitude + 90) / 2), round((longitude + 180) / 2)]
+    assert grid.declination(latitude, longitude, 2026.0) == bundled_model().declination(latitude, longitude, 2026.0)
+    assert 0.0 < grid.exact.mean() < 0.2
+
+
+def test_grid_lookup_shapes_and_longitude_turns(grid):
+    single = grid.declination(52.0, -170.0, 2026.3)
+    assert single.shape == ()
+    assert grid.declination(52.0, 190.0, 2026.3) == pytest.approx(single)
+    assert grid.declination([[52.0], [-33.0]], [0.0, 10.0, 20.0], 2026.3).shape == (2, 3)
+    assert np.isfinite(grid.declination([90.0, -90.0], [180.0, -180.0], 2030.0)).all()
+
+
+def test_grid_resolution_divides_half_a_turn():
+    with pytest.raises(ValueError):
+        DeclinationGrid(resolution=0.7)
+    with pytest.raises(ValueError):
+        DeclinationGrid(resolution=0.0)
+
+
+def test_read_model_rejects_other_files(tmp_path):
+    path = tmp_path / "model.cof"
+    path.write_text("not a model\n1 2 3\n")
+    with pytest.raises(ValueError):
+        read_model(path)
+
+
+def test_decimal_year():
+    assert decimal_year(datetime.date(2025, 1, 1)) == 2025.0
+    assert decimal_year(datetime.date(2024, 7, 2)) == pytest.approx(2024.5)  # leap year
+    assert decimal_year(datetime.datetime(2025, 1, 1, 12)) == pytest.approx(2025 + 0.5 / 365)
@@ -0,0 +1,77 @@
+import pytest
+
+from dmcview.device_parser import (
+    SAMPLE_DTYPE,
+    AsciiLineParser,
+    DeviceParser,
+    available_parsers,
+    get_parser,
+    register_parser,
+)
+
+
+def test_generic_parser_registered():
+    assert "generic" in available_parsers()
+    assert isinstance(get_parser("Generic"), AsciiLineParser)
+
+
+def test_unknown_parser():
+    with pytest.raises(ValueError, match="Unknown device manufacturer"):
+        get_parser("nobody")
+
+
+def test_register_without_name():
+    class Nameless(DeviceParser):
+        pass
+
+    with pytest.raises(ValueError):
+        register_parser(Nameless)
+
+
+def test_register_duplicate():
+    class Duplicate(DeviceParser):
+        manufacturer = "generic"
+
+    with pytest.raises(ValueError, match="already registered"):
+        register_parser(Duplicate)
+
+
+def test_parser_without_parse_can_not_be_created():
+    class Incomplete(DeviceParser):
+        manufacturer = "incomplete"
+
+    with pytest.raises(TypeError):
+        Incomplete()  # pylint: disable=abstract-class-instantiated
+
+
+def test_ascii_parser_keeps_partial_line():
+    parser = AsciiLineParser()
+    buffer = bytearray(b"45.5,20,30,10.5,1,2,3,0.5\n46.0,21,31,10.5,1,2,3\n47.0,2")
+
+    samples = parser.parse(buffer)
+
+    assert samples.dtype == SAMPLE_DTYPE
+    assert len(samples) == 2
+    assert samples["azimuth"].tolist() == [45.5, 46.0]
+    assert samples["timestamp"][0] == 0.5
+    assert samples["timestamp"][1] > 0  # stamped on arrival
+    assert buffer == bytearray(b"47.0,2")
+
+
+def test_ascii_parser_drops_malformed_lines():
+    parser = AsciiLineParser()
+    buffer = bytearray(b"garbage\n1,2,3\n1,2,3,4,5,6,a\n1,2,3,4,5,6,7\n")
+
+    samples = parser.parse(buffer)
+
+    assert len(samples) == 1
+    assert samples[0]["z"] == 7.0
+    assert buffer == bytearray()
+
+
+def test_ascii_parser_discards_endless_garbage():
+    parser = AsciiLineParser()
+    buffer = bytearray(b"x" * (parser.max_line_length + 1))
+
+    assert len(parser.parse(buffer)) == 0
+    assert buffer == bytearray()
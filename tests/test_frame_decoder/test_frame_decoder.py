@@ -0,0 +1,83 @@
+import numpy as np
+import pytest
+
+from dmcview.device_parser import SAMPLE_DTYPE, available_parsers, get_parser
+from dmcview.frame_decoder import (
+    FRAME_SIZE,
+    BinaryFrameParser,
+    decode_frames,
+    encode_frames,
+)
+
+
+def make_samples(count):
+    samples = np.zeros(count, dtype=SAMPLE_DTYPE)
+    samples["azimuth"] = np.linspace(0, 359, count)
+    samples["elevation"] = 20.5
+    samples["bank"] = -7.25
+    samples["declination"] = 10.5
+    samples["x"], samples["y"], samples["z"] = 1.5, 2.5, 9.75
+    samples["timestamp"] = np.arange(count) / 1000.0
+    return samples
+
+
+def test_round_trip():
+    samples = make_samples(500)
+    decoded, consumed = decode_frames(bytearray(encode_frames(samples)))
+
+    assert consumed == 500 * FRAME_SIZE
+    assert decoded.dtype == SAMPLE_DTYPE
+    np.testing.assert_allclose(decoded["azimuth"], samples["azimuth"], rtol=1e-6)
+    np.testing.assert_array_equal(decoded["timestamp"], samples["timestamp"])
+    assert decoded["bank"][0] == -7.25
+
+
+def test_partial_tail_left_in_place():
+    frames = encode_frames(make_samples(3))
+    buffer = bytearray(frames[: 2 * FRAME_SIZE + 10])
+
+    samples = BinaryFrameParser().parse(buffer)
+
+    assert len(samples) == 2
+    assert buffer == frames[2 * FRAME_SIZE : 2 * FRAME_SIZE + 10]
+
+    buffer.extend(frames[2 * FRAME_SIZE + 10 :])
+    assert len(BinaryFrameParser().parse(buffer)) == 1
+    assert buffer == bytearray()
+
+
+def test_bad_checksum_and_garbage_skipped():
+    frames = bytearray(encode_frames(make_samples(3)))
+    frames[FRAME_SIZE + 5] ^= 0xFF  # corrupt the second frame payload
+    buffer = bytearray(b"\x00\x13garbage") + frames
+
+    samples = BinaryFrameParser().parse(buffer)
+
+    assert samples["timestamp"].tolist() == [0.0, 0.002]
+    assert buffer == bytearray()
+
+
+def test_memoryview_and_split_sync():
+    frames = encode_frames(make_samples(1))
+    decoded, consumed = decode_frames(memoryview(frames + b"\xaa"))
+
+    assert len(decoded) == 1
+    assert consumed == FRAME_SIZE  # the trailing sync byte is kept
+
+
+def test_garbage_only():
+    decoded, consumed = decode_frames(bytearray(b"no frames here"))
+    assert len(decoded) == 0
+    assert consumed == len(b"no frames here")
+
+
+def test_registered():
+    assert "dmc-binary" in available_parsers()
+    assert isinstance(get_parser("dmc-binary"), BinaryFrameParser)
+
+
+@pytest.mark.parametrize("offset", [0, 1, 17])
+def test_resynchronizes_at_any_offset(offset):
+    frames = encode_frames(make_samples(4))
+    decoded, _ = decode_frames(bytearray(b"\x01" * offset + frames))
+    assert len(decoded) == 4
@@ -0,0 +1,93 @@
+import numpy as np
+import pytest
+
+from dmcview.device_parser import SAMPLE_DTYPE, get_parser
+from dmcview.fusion import (
+    FUSION_BLOCK,
+    RAW_DTYPE,
+    RawVectorParser,
+    fuse,
+    tilt_compensated,
+)
+
+GRAVITY = 9.81
+FIELD = np.array([20.0, 0.0, 45.0])  # µT north and down
+
+
+def body_vectors(heading, elevation, bank):
+    """ Gravity and the magnetic field seen by a unit turned by the yaw, pitch, roll angles in degrees. """
+    yaw, pitch, roll = np.radians(np.broadcast_arrays(heading, elevation, bank)).astype(np.float64)
+    zero, one = np.zeros_like(yaw), np.ones_like(yaw)
+    rz = np.stack([[np.cos(yaw), np.sin(yaw), zero], [-np.sin(yaw), np.cos(yaw), zero], [zero, zero, one]])
+    ry = np.stack([[np.cos(pitch), zero, -np.sin(pitch)], [zero, one, zero], [np.sin(pitch), zero, np.cos(pitch)]])
+    rx = np.stack([[one, zero, zero], [zero, np.cos(roll), np.sin(roll)], [zero, -np.sin(roll), np.cos(roll)]])
+    # the earth to body rotation of every sample, roll after pitch after yaw
+    rotation = np.einsum("ijn,jkn,kln->nil", rx, ry, rz)
+    return rotation @ np.array([0.0, 0.0, GRAVITY]), rotation @ FIELD
+
+
+def test_level_unit_points_to_magnetic_north():
+    heading, elevation, bank = tilt_compensated(np.array([[0.0, 0.0, GRAVITY]]), FIELD[np.newaxis])
+    assert (heading[0], elevation[0], bank[0]) == (0.0, 0.0, 0.0)
+
+
+def test_heading_is_independent_of_the_tilt():
+    rng = np.random.default_rng(7)
+    heading = rng.uniform(0, 360, 1000)
+    elevation = rng.uniform(-80, 80, 1000)
+    bank = rng.uniform(-179, 179, 1000)
+    accelerometer, magnetometer = body_vectors(heading, elevation, bank)
+
+    result = tilt_compensated(accelerometer, magnetometer)
+
+    heading_error = (result[0] - heading + 180) % 360 - 180
+    assert np.abs(heading_error).max() < 1e-9
+    np.testing.assert_allclose(result[1], elevation, atol=1e-9)
+    np.testing.assert_allclose(result[2], bank, atol=1e-9)
+
+
+def test_vertical_unit_has_no_heading_nor_bank():
+    with np.errstate(all="raise"):
+        heading, elevation, bank = tilt_compensated(
+            np.array([[-GRAVITY, 0.0, 0.0], [0.0, 0.0, 0.0]]), np.tile(FIELD, (2, 1))
+        )
+    assert heading.tolist() == [0.0, 0.0]
+    assert elevation.tolist() == [90.0, 0.0]
+    assert bank.tolist() == [0.0, 0.0]
+
+
+def test_fuse_adds_the_declination_over_blocks():
+    count = FUSION_BLOCK + 10
+    heading = np.linspace(0, 359, count)
+    accelerometer, magnetometer = body_vectors(heading, 10.0, -20.0)
+    raw = np.empty(count, dtype=RAW_DTYPE)
+    raw["ax"], raw["ay"], raw["az"] = accelerometer.T
+    raw["mx"], raw["my"], raw["mz"] = magnetometer.T
+    raw["timestamp"] = np.arange(count) * 0.001
+
+    samples = fuse(raw[::-1][::-1], declination=5.0)  # not contiguous
+
+    assert samples.dtype == SAMPLE_DTYPE
+    azimuth_error = (samples["azimuth"] - (heading + 5.0) + 180) % 360 - 180
+    assert np.abs(azimuth_error).max() < 1e-9
+    assert (samples["declination"] == 5.0).all()
+    np.testing.assert_allclose(samples["elevation"], 10.0)
+    np.testing.assert_allclose(samples["bank"], -20.0)
+    assert (samples["x"] == raw["ax"]).all() and (samples["z"] == raw["az"]).all()
+    assert (samples["timestamp"] == raw["timestamp"]).all()
+    assert fuse(raw[:0]).dtype == SAMPLE_DTYPE
+
+
+def test_raw_parser_fuses_each_line():
+    parser = get_parser("generic-raw")
+    assert isinstance(parser, RawVectorParser)
+    buffer = bytearray(b"0,0,9.81,0,-20,45,1.5\n0,0,9.81,20,0,45\nbad,line\n0,0,9.8")
+
+    samples = parser.parse(buffer)
+
+    assert samples["azimuth"].tolist() == pytest.approx([90.0, 0.0])
+    assert samples["z"].tolist() == [9.81, 9.81]
+    assert samples["timestamp"][0] == 1.5
+    assert samples["timestamp"][1] > 0  # stamped on arrival
+    assert buffer == bytearray(b"0,0,9.8")
+    assert parser.parse(bytearray(b"0,0")).dtype == SAMPLE_DTYPE
@@ -0,0 +1,59 @@
+import numpy as np
+import pytest
+
+from dmcview.device_parser import SAMPLE_DTYPE
+from dmcview.history import SampleHistory
+from dmcview.recording import RECORD_DTYPE
+
+
+def make_samples(timestamps):
+    samples = np.zeros(len(timestamps), dtype=SAMPLE_DTYPE)
+    samples["timestamp"] = timestamps
+    samples["azimuth"] = np.asarray(timestamps) * 10
+    return samples
+
+
+@pytest.fixture
+def history():
+    return SampleHistory(budget=8 * 2 * SAMPLE_DTYPE.itemsize)  # 8 samples
+
+
+def test_budget_sets_the_capacity(history):
+    assert history.capacity == 8
+    assert history.buffer.nbytes == 8 * 2 * SAMPLE_DTYPE.itemsize
+    with pytest.raises(ValueError):
+        SampleHistory(budget=SAMPLE_DTYPE.itemsize)
+
+
+def test_windows_are_views_of_the_newest_samples(history):
+    rng = np.random.default_rng(3)
+    expected = []
+    for number in range(200):
+        batch = make_samples(number * 10 + np.arange(rng.integers(0, 6)))
+        history.append(batch)
+        expected = (expected + batch["timestamp"].tolist())[-8:]
+        assert history.last()["timestamp"].tolist() == expected
+        assert history.last(3)["timestamp"].tolist() == expected[-3:]
+    assert np.shares_memory(history.last(), history.buffer)
+    assert len(history) == 8
+
+
+def test_window_and_between(history):
+    history.append(make_samples([0.0, 0.5, 1.0, 1.5]))
+    history.append(make_samples([2.0, 2.5, 3.0, 3.5, 4.0, 4.5]).astype(RECORD_DTYPE))  # the first two dropped
+
+    assert history.window(1.0)["timestamp"].tolist() == [3.5, 4.0, 4.5]
+    assert history.window(1.0)["azimuth"].tolist() == [35, 40, 45]
+    assert history.between(1.0, 2.5)["timestamp"].tolist() == [1.0, 1.5, 2.0]
+    assert len(history.last(0)) == 0
+    assert len(SampleHistory().window(5.0)) == 0
+
+
+def test_large_batch_and_going_back_in_time(history):
+    history.append(make_samples(np.arange(20.0)))
+    assert history.last()["timestamp"].tolist() == list(np.arange(12.0, 20.0))
+
+    history.append(make_samples([5.0, 6.0]))  # a replay seek, a new history
+    assert history.last()["timestamp"].tolist() == [5.0, 6.0]
+    history.append(make_samples([7.0, 1.0, 2.0]))
+    assert history.last()["timestamp"].tolist() == [1.0, 2.0]
@@ -0,0 +1,57 @@
+import threading
+from unittest.mock import patch
+
+import pytest
+
+from dmcview.perf import PerfStats
+
+
+def test_rates_count_the_last_window():
+    perf = PerfStats(window=1.0)
+    with patch("dmcview.perf.time.monotonic", side_effect=[10.0, 10.5, 10.9, 11.2, 11.2]):
+        perf.record_paint(0.001)
+        perf.record_paint(0.001)
+        perf.record_paint(0.001)
+        perf.record_tick(0.016)
+        assert perf.frames_per_second() == 2.0  # the frame at 10.0 left the window
+
+
+def test_counters_stay_bounded_without_the_overlay():
+    perf = PerfStats(window=1.0)
+    with patch("dmcview.perf.time.monotonic", side_effect=[tenth / 10 for tenth in range(2000)]):
+        for _ in range(1000):
+            perf.record_paint(0.001)
+            perf.record_tick(0.016)
+    assert len(perf.frames) <= 11 and len(perf.ticks) <= 11  # the events of the last second only
+
+
+def test_tick_does_not_keep_the_clock_running():
+    assert PerfStats().record_tick(0.016) is False
+
+
+def test_paint_durations():
+    perf = PerfStats(smoothing=0.5)
+    perf.record_paint(0.002)
+    perf.record_paint(0.004)
+    assert perf.paint_last == 0.004
+    assert perf.paint_average == pytest.approx(0.003)
+
+
+def test_backlog_across_threads():
+    perf = PerfStats()
+    workers = [threading.Thread(target=lambda: [perf.samples_received(10) for _ in range(1000)]) for _ in range(4)]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    perf.samples_shown(39990)
+    assert perf.backlog == 10
+
+
+def test_lines():
+    perf = PerfStats()
+    perf.record_acceleration_draw(0.0016)
+    perf.samples_received(5)
+    lines = perf.lines()
+    assert lines[3] == "3D ms: 1.60/1.60"
+    assert lines[4] == "Input backlog: 5"
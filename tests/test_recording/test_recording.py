@@ -0,0 +1,106 @@
+import numpy as np
+import pytest
+
+from dmcview.device_parser import SAMPLE_DTYPE
+from dmcview.recording import (
+    HEADER_ALIGNMENT,
+    RecorderRunner,
+    SessionReader,
+    SessionWriter,
+    index_path,
+)
+
+
+def make_samples(start: int, count: int) -> np.ndarray:
+    samples = np.zeros(count, dtype=SAMPLE_DTYPE)
+    samples["azimuth"] = np.arange(start, start + count) % 360
+    samples["timestamp"] = np.arange(start, start + count) / 100.0
+    return samples
+
+
+def test_write_and_map(tmp_path):
+    path = str(tmp_path / "session.dmc")
+    with SessionWriter(path, {"manufacturer": "generic", "port": "loop://"}, buffer_records=100, index_stride=64) as writer:
+        for start in range(0, 1000, 37):
+            writer.append(make_samples(start, min(37, 1000 - start)))
+
+    with SessionReader(path) as reader:
+        assert reader.device == {"manufacturer": "generic", "port": "loop://"}
+        assert reader.data_offset % HEADER_ALIGNMENT == 0
+        assert isinstance(reader.samples, np.memmap)
+        assert len(reader) == 1000
+        assert np.array_equal(reader.samples["timestamp"], make_samples(0, 1000)["timestamp"])
+        assert reader.index["record"].tolist() == list(range(0, 1000, 64))
+
+
+def test_index_of_and_between(tmp_path):
+    path = str(tmp_path / "session.dmc")
+    samples = make_samples(0, 5000)
+    samples["timestamp"][100:110] = samples["timestamp"][100]  # equal timestamps are allowed
+    with SessionWriter(path, index_stride=100) as writer:
+        writer.append(samples)
+
+    with SessionReader(path) as reader:
+        for timestamp in (-1.0, 0.0, 1.0, 1.005, 1.1, 12.345, 49.99, 60.0):
+            for side in ("left", "right"):
+                expected = int(np.searchsorted(samples["timestamp"], timestamp, side=side))
+                assert reader.index_of(timestamp, side) == expected
+        assert reader.between(10.0, 10.05)["timestamp"].tolist() == pytest.approx([10.0, 10.01, 10.02, 10.03, 10.04])
+
+
+def test_timestamps_must_not_decrease(tmp_path):
+    with SessionWriter(str(tmp_path / "session.dmc")) as writer:
+        writer.append(make_samples(10, 5))
+        with pytest.raises(ValueError):
+            writer.append(make_samples(0, 5))
+        with pytest.raises(ValueError):
+            writer.append(make_samples(20, 5)[::-1])
+        writer.append(make_samples(20, 5))
+
+
+def test_interrupted_recording(tmp_path):
+    """A partial last record is ignored and a missing index is rebuilt."""
+    path = str(tmp_path / "session.dmc")
+    with SessionWriter(path, index_stride=10) as writer:
+        writer.append(make_samples(0, 55))
+    with open(path, "ab") as file:
+        file.write(b"\x00" * 20)
+    (tmp_path / "session.dmc.idx").unlink()
+
+    with SessionReader(path) as reader:
+        assert len(reader) == 55
+        assert reader.index["record"].tolist() == list(range(0, 55, 10))
+        assert reader.index_of(0.3) == 30
+
+
+def test_empty_session(tmp_path):
+    path = str(tmp_path / "session.dmc")
+    SessionWriter(path).close()
+    with SessionReader(path) as reader:
+        assert len(reader) == 0
+        assert reader.index_of(1.0) == 0
+
+
+def test_not_a_session(tmp_path):
+    path = tmp_path / "session.csv"
+    path.write_text("45.5,20,30,10.5,1,2,3\n")
+    with pytest.raises(ValueError):
+        SessionReader(str(path))
+
+
+def test_recorder_runner_drops_samples_back_in_time(tmp_path):
+    path = str(tmp_path / "session.dmc")
+    recorder = RecorderRunner(path, {"manufacturer": "generic"})
+    errors = []
+    recorder.signal.error.connect(errors.append)
+
+    recorder.record(make_samples(0, 10))
+    recorder.record(make_samples(5, 10))
+    recorder.stop()
+    recorder.run()
+
+    with SessionReader(path) as reader:
+        assert len(reader) == 16  # the equal timestamp is kept
+        assert reader.samples["timestamp"][-1] == pytest.approx(0.14)
+    assert errors == ["Dropped 4 samples going back in time"]
+    assert index_path(path).endswith(".idx")
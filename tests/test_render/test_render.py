@@ -0,0 +1,57 @@
+import pytest
+from PySide6.QtCore import QSize, Qt
+from PySide6.QtGui import QColor
+
+from dmcview.render import CompassRenderer, CompassState, render_compass
+
+pytestmark = pytest.mark.usefixtures("qapp")
+
+
+@pytest.fixture
+def renderer():
+    return CompassRenderer()
+
+
+def test_render_size_and_pixel_ratio(renderer):
+    image = renderer.render(CompassState(), QSize(300, 200), dpr=2.0)
+    assert image.size() == QSize(600, 400)
+    assert image.devicePixelRatio() == 2.0
+    assert image.deviceIndependentSize().toSize() == QSize(300, 200)
+
+
+def test_render_is_deterministic(renderer):
+    state = CompassState(azimuth=45.5, declination=10.5, bank=5.0, elevation=20.0, x=1.0, y=2.0, z=3.0)
+    first = renderer.render(state)
+    renderer.render(CompassState(azimuth=200.0))
+    assert renderer.render(state) == first
+    assert CompassRenderer().render(state) == first
+
+
+def test_render_shows_the_state_without_animation(renderer):
+    renderer.render(CompassState(azimuth=270.0, declination=30.0))
+    assert renderer.compass.current_angle == 270.0
+    assert renderer.compass.current_declination == 30.0
+    assert not renderer.compass.clock.is_active()
+    assert renderer.render(CompassState(azimuth=90.0)) != renderer.render(CompassState(azimuth=91.0))
+
+
+def test_render_draws_the_dial_once_per_size(renderer):
+    renderer.render(CompassState())
+    dial = renderer.dial
+    renderer.render(CompassState(azimuth=10.0))
+    assert renderer.dial is dial
+
+    renderer.render(CompassState(), QSize(800, 500))
+    assert renderer.dial is not dial
+
+
+def test_render_background():
+    blue = QColor(0, 0, 255)
+    renderer = CompassRenderer(blue)
+    blue.setRed(255)  # the renderer keeps its own copy
+    assert renderer.render(CompassState(), QSize(100, 100)).pixelColor(0, 0) == QColor(0, 0, 255)
+    assert CompassRenderer().background == QColor(Qt.GlobalColor.white)
+
+
+def test_render_compass_shared_renderer():
+    assert render_compass(CompassState(azimuth=45.0)) == render_compass(CompassState(azimuth=45.0))
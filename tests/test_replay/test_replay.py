@@ -0,0 +1,101 @@
+from unittest.mock import MagicMock
+
+import numpy as np
+import pytest
+
+from dmcview.device_parser import SAMPLE_DTYPE
+from dmcview.recording import SessionReader, SessionWriter
+from dmcview.replay import ReplayEngine
+
+pytestmark = pytest.mark.usefixtures("qapp")
+
+
+@pytest.fixture
+def session(tmp_path):
+    samples = np.zeros(1000, dtype=SAMPLE_DTYPE)
+    samples["azimuth"] = np.arange(1000) % 360
+    samples["timestamp"] = 100.0 + np.arange(1000) / 100.0  # 10 seconds at 100 Hz
+    path = str(tmp_path / "session.dmc")
+    with SessionWriter(path, index_stride=64) as writer:
+        writer.append(samples)
+    with SessionReader(path) as reader:
+        yield reader
+
+
+@pytest.fixture
+def engine(session):
+    engine = ReplayEngine(session, frame_rate=60)
+    engine.batches = []
+    engine.samples.connect(engine.batches.append)
+    return engine
+
+
+def test_speed_range(session):
+    with pytest.raises(ValueError):
+        ReplayEngine(session, speed=0.05)
+    engine = ReplayEngine(session, speed=100.0)
+    with pytest.raises(ValueError):
+        engine.set_speed(101.0)
+    assert engine.speed == 100.0
+
+
+def test_tick_emits_every_record_up_to_the_position(engine):
+    engine.elapsed = MagicMock()
+    engine.elapsed.restart.return_value = 100  # ms
+    engine.set_speed(2.0)
+
+    engine._ReplayEngine__tick()
+    engine._ReplayEngine__tick()
+
+    assert engine.position == pytest.approx(100.4)
+    records = np.concatenate(engine.batches)
+    assert records["timestamp"].tolist() == pytest.approx(100.0 + np.arange(41) / 100.0)
+
+
+def test_seek_and_step(engine):
+    engine.seek(105.555)
+    assert engine.next_record == 556
+    assert engine.batches[-1]["timestamp"].tolist() == pytest.approx([105.55])
+
+    engine.step()
+    engine.step(3)
+    assert [len(batch) for batch in engine.batches[1:]] == [1, 3]
+    assert engine.position == pytest.approx(105.59)
+    assert not engine.is_playing()
+
+    engine.seek(-1.0)
+    assert engine.position == engine.start_time
+    assert engine.next_record == 1
+
+
+def test_play_pause_and_finish(engine):
+    finished = MagicMock()
+    engine.finished.connect(finished)
+
+    engine.play()
+    assert engine.is_playing()
+    engine.pause()
+    assert not engine.is_playing()
+
+    engine.set_fast(True, batch=300)
+    for _ in range(4):
+        engine._ReplayEngine__tick()
+
+    assert [len(batch) for batch in engine.batches] == [300, 300, 300, 100]
+    assert engine.at_end()
+    finished.assert_called_once()
+    engine.play()
+    assert not engine.is_playing()
+
+
+def test_viewer_replays_as_fast_as_possible(session, qtbot, capsys):
+    from dmcview.replay import ReplayViewer  # pylint: disable=import-outside-toplevel
+
+    viewer = ReplayViewer(session.path, fast=True, renderer="qpainter")
+    qtbot.addWidget(viewer)
+    with qtbot.waitSignal(viewer.engine.finished, timeout=10000):
+        pass
+
+    assert viewer.engine.at_end()
+    assert "Replayed 1000 samples" in capsys.readouterr().out
+    qtbot.waitUntil(lambda: viewer.compass.target_angle == 999 % 360)  # the bus delivers the latest
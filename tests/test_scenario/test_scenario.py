@@ -0,0 +1,130 @@
+import json
+from unittest.mock import MagicMock
+
+import numpy as np
+import pytest
+
+from dmcview.scenario import ChannelSchedule, Scenario, load_scenario
+
+TODO_SCENARIO = {
+    "name": "sequences",
+    "seed": 7,
+    "duration": 1.2,
+    "channels": {
+        "azimuth": {"values": [45.5, 46.5, 47.0, 47.5, 48.0, 48.5], "interval": 0.1},
+        "elevation": {"values": [60, 60.5, 61.0, 61.5, 62.0], "interval": 0.2},
+        "bank": {"values": [30.0, 30.5, 31.0, 31.5, 32.0, 32.5], "interval": 0.15},
+        "declination": {"constant": 10.5},
+        "x": {"waveform": "random", "low": 5, "high": 15, "rate": 1000},
+    },
+}
+
+
+def test_merged_timeline_holds_the_last_values():
+    scenario = Scenario.from_dict(dict(TODO_SCENARIO, channels={
+        key: value for key, value in TODO_SCENARIO["channels"].items() if key != "x"
+    }))
+    samples = scenario.samples(0.0, 1.2, start_time=100.0)
+
+    expected_times = sorted({round(k * 0.1, 2) for k in range(12)} | {round(k * 0.2, 2) for k in range(6)}
+                            | {round(k * 0.15, 2) for k in range(8)})
+    assert (samples["timestamp"] - 100.0).tolist() == pytest.approx(expected_times)
+
+    at_045 = samples[np.isclose(samples["timestamp"], 100.45)][0]
+    assert at_045["azimuth"] == 48.0  # updated at 0.4
+    assert at_045["elevation"] == 61.0  # updated at 0.4
+    assert at_045["bank"] == 31.5  # updated at 0.45
+    assert at_045["declination"] == 10.5
+    assert at_045["z"] == 0.0
+    assert samples[np.isclose(samples["timestamp"], 100.6)][0]["azimuth"] == 45.5  # the values cycle
+
+
+def test_blocks_give_the_same_stream():
+    scenario = Scenario.from_dict(TODO_SCENARIO)
+    whole = scenario.samples(0.0, 1.2)
+    blocks = np.concatenate([scenario.samples(start / 60, (start + 1) / 60) for start in range(72)])
+    assert np.array_equal(whole, blocks)
+    assert len(whole) == 1200  # the fastest channel updates every millisecond
+
+
+def test_seed_makes_random_repeatable():
+    first = Scenario.from_dict(TODO_SCENARIO).samples(0.0, 1.2)["x"]
+    assert np.array_equal(first, Scenario.from_dict(TODO_SCENARIO).samples(0.0, 1.2)["x"])
+    assert first.min() >= 5 and first.max() <= 15
+    other = Scenario.from_dict(dict(TODO_SCENARIO, seed=8)).samples(0.0, 1.2)["x"]
+    assert not np.array_equal(first, other)
+
+
+@pytest.mark.parametrize("waveform, expected", [
+    ("sine", [10.0, 15.0, 10.0, 5.0]),
+    ("triangle", [5.0, 10.0, 15.0, 10.0]),
+    ("square", [15.0, 15.0, 5.0, 5.0]),
+    ("sawtooth", [5.0, 7.5, 10.0, 12.5]),
+])
+def test_waveforms(waveform, expected):
+    schedule = ChannelSchedule("x", {"waveform": waveform, "amplitude": 5, "offset": 10, "period": 4, "interval": 1})
+    times = schedule.update_times(0, 4_000_000_000)
+    assert schedule.values_at(times).tolist() == pytest.approx(expected)
+
+
+@pytest.mark.parametrize("description", [
+    {"duration": 1, "channels": {"heading": {"constant": 1}}},
+    {"duration": 0, "channels": {}},
+    {"channels": {}},
+    {"duration": 1, "channels": {"azimuth": {"values": [1, 2]}}},
+    {"duration": 1, "channels": {"azimuth": {"values": [], "interval": 1}}},
+    {"duration": 1, "channels": {"azimuth": {"values": [1], "constant": 1, "interval": 1}}},
+    {"duration": 1, "channels": {"azimuth": {"waveform": "noise", "interval": 1}}},
+    {"duration": 1, "channels": {"azimuth": {"waveform": "sine", "interval": -1}}},
+    {"duration": 1, "channels": [{"constant": 1}]},
+    {"duration": 1, "channels": {"azimuth": 5}},
+    {"duration": 1, "channels": {"azimuth": [1, 2]}},
+    {"duration": 1e400, "channels": {}},
+    {"duration": 1e300, "channels": {}},
+    {"duration": float("nan"), "channels": {}},
+    {"duration": "x", "channels": {}},
+    {"duration": {"seconds": 10}, "channels": {}},
+    {"duration": 1, "seed": -1, "channels": {}},
+    {"duration": 1, "seed": "x", "channels": {}},
+    {"duration": 1, "channels": {"azimuth": {"constant": {"value": 1}}}},
+    {"duration": 1, "channels": {"azimuth": {"values": {"a": 1}, "interval": 1}}},
+    {"duration": 1, "channels": {"azimuth": {"values": ["a"], "interval": 1}}},
+    {"duration": 1, "channels": {"azimuth": {"waveform": "sine", "rate": 1e-300}}},
+    {"duration": 1, "channels": {"azimuth": {"waveform": "sine", "interval": 1, "period": 0}}},
+    {"duration": 1, "channels": {"azimuth": {"waveform": "sine", "interval": 1, "amplitude": "x"}}},
+    {"duration": 1, "channels": {"azimuth": {"waveform": ["sine"], "interval": 1}}},
+    [1, 2],
+])
+def test_invalid_scenarios(description):
+    with pytest.raises(ValueError):
+        Scenario.from_dict(description)
+
+
+def test_load_scenario(tmp_path):
+    path = tmp_path / "scenario.json"
+    path.write_text(json.dumps(TODO_SCENARIO))
+    assert load_scenario(str(path)).name == "sequences"
+
+    path.write_text("not json")
+    with pytest.raises(ValueError):
+        load_scenario(str(path))
+
+    path.write_text('{"duration": {"seconds": 10}, "channels": {}}')
+    with pytest.raises(ValueError, match="duration must be a number"):
+        load_scenario(str(path))
+
+
+@pytest.mark.usefixtures("qapp")
+def test_scenario_runner_plays_to_the_end():
+    from dmcview.simulator import ScenarioRunner  # pylint: disable=import-outside-toplevel
+
+    scenario = Scenario({"azimuth": {"values": [1, 2, 3], "rate": 600}}, duration=0.05)
+    runner = ScenarioRunner(scenario)
+    batch = MagicMock()
+    runner.signal.batch.connect(batch)
+
+    runner.run()
+
+    samples = np.concatenate([call.args[0] for call in batch.call_args_list])
+    assert np.array_equal(samples[["azimuth", "x"]], scenario.samples(0.0, 0.05)[["azimuth", "x"]])
+    assert len(samples) == 30
@@ -0,0 +1,45 @@
+from unittest.mock import MagicMock
+
+import pytest
+
+from dmcview.device_parser import AsciiLineParser
+from dmcview.serial_reader import SerialReaderRunner
+
+serial = pytest.importorskip("serial")
+
+
+def test_runner_decodes_batches(monkeypatch):
+    loop = serial.serial_for_url("loop://", timeout=0.01)
+    loop.write(b"45.5,20,30,10.5,1,2,3,0.5\n46.0,21,31,10.5,1,2,3,0.6\n")
+    monkeypatch.setattr(serial, "serial_for_url", lambda *args, **kwargs: loop)
+
+    runner = SerialReaderRunner("loop://", AsciiLineParser())
+    batches = []
+
+    def collect(samples):
+        batches.append(samples)
+        runner.stop()
+
+    runner.signal.samples.connect(collect)
+    runner.run()
+
+    assert len(batches) == 1
+    assert batches[0]["azimuth"].tolist() == [45.5, 46.0]
+
+
+def test_runner_reports_open_error():
+    runner = SerialReaderRunner("/dev/does-not-exist", AsciiLineParser())
+    error = MagicMock()
+    runner.signal.error.connect(error)
+
+    runner.run()
+
+    error.assert_called_once()
+    assert "/dev/does-not-exist" in error.call_args[0][0]
+
+
+def test_runner_uses_parser_baudrate():
+    runner = SerialReaderRunner("loop://", AsciiLineParser())
+    assert runner.baudrate == AsciiLineParser.baudrate
+    runner = SerialReaderRunner("loop://", AsciiLineParser(), baudrate=115200)
+    assert runner.baudrate == 115200
@@ -1,8 +1,11 @@
 from unittest.mock import MagicMock, patch
 
+import numpy as np
 import pytest
 
-from dmcview.simulator import Simulator, SimulatorRunner
+from dmcview.device_parser import SAMPLE_DTYPE
+from dmcview.simulator import FleetSimulatorRunner, Simulator, SimulatorRunner
+from dmcview.telemetry import Channel, Orientation
 
 
 @pytest.fixture
@@ -15,7 +18,7 @@ def simulator():
         # Patch GUI-heavy methods to avoid drawing
         sim.compass.paintEvent = MagicMock()
         sim.compass.create_static_pixmap = MagicMock()
-        sim.compass.start_animation_timer = MagicMock()
+        sim.compass.clock = MagicMock()
         sim.canvas.update_acceleration = MagicMock()
 
         yield sim
@@ -25,41 +28,70 @@ def test_runner_stop():
     assert runner.running is True
     runner.stop()
     assert runner.running is False
+    assert runner.wakeup.is_set()
+
+def test_runner_rate_range():
+    with pytest.raises(ValueError):
+        SimulatorRunner(rate=0.5)
+    with pytest.raises(ValueError):
+        SimulatorRunner(rate=20000)
+    assert SimulatorRunner(rate=1).block_size == 1
+    assert SimulatorRunner(rate=10000).block_size == 167  # one block per frame at 60 batches/s
+
+def test_generate_block():
+    runner = SimulatorRunner(rate=100, seed=1)
+    samples = runner.generate(50, 1000, start_time=3.0)
+
+    assert samples.dtype == SAMPLE_DTYPE
+    assert len(samples) == 1000
+    assert samples["azimuth"].min() >= 20.0 and samples["azimuth"].max() <= 40.0
+    assert samples["elevation"].min() >= 20.0 and samples["elevation"].max() <= 35.0
+    assert samples["bank"].min() >= 30.0 and samples["bank"].max() <= 45.0
+    assert np.array_equal(samples["x"], samples["y"])
+    assert not samples["z"].any()
+    assert (samples["declination"] == 10.5).all()
+    assert SimulatorRunner(declination=-3.7).generate(0, 1)["declination"][0] == -3.7
+    assert samples["timestamp"][:2].tolist() == pytest.approx([3.5, 3.51])
+    assert np.array_equal(SimulatorRunner(rate=100, seed=1).generate(50, 1000, 3.0), samples)
 
 def test_update_method(simulator):
-    # Patch compass and canvas methods to track calls
-    simulator.compass.update_angle = MagicMock()
-    simulator.compass.set_elevation = MagicMock()
-    simulator.compass.set_rotation = MagicMock()
-    simulator.canvas.update_acceleration = MagicMock()
-
-    # Call the private update method directly
-    simulator._Simulator__update("30", "25", "40", "10", "10", "0")
-
-    simulator.compass.update_angle.assert_called_with(30.0)
-    simulator.compass.set_elevation.assert_called_with(25.0)
-    simulator.compass.set_rotation.assert_called_with(40.0)
-    simulator.canvas.update_acceleration.assert_called_with(10.0, 10.0, 0.0)
+    simulator.bus = MagicMock()
+    samples = np.array([(30, 25, 40, 10.5, 10, 10, 0, 0.0)], dtype=SAMPLE_DTYPE)
 
-def test_runner_run_once(monkeypatch):
-    runner = SimulatorRunner()
+    simulator.show_samples(samples)
 
-    # Patch QThread.sleep to skip delay
-    monkeypatch.setattr("PySide6.QtCore.QThread.sleep", lambda x: None)
+    simulator.bus.publish.assert_any_call(Channel.ORIENTATION, Orientation(30.0, 25.0, 40.0))
+    simulator.canvas.update_acceleration.assert_called_with(10.0, 10.0, 0.0)
+
+def test_runner_run_once():
+    runner = SimulatorRunner(rate=10000)
 
     # Attach mock to signal
     mock_slot = MagicMock()
-    runner.signal.result.connect(mock_slot)
+    runner.signal.batch.connect(mock_slot)
 
     # Make it run exactly one iteration
-    def stop_after_one_emit():
-        runner.running = False
-    runner.signal.result.connect(stop_after_one_emit)
-
-    # Start with running=True
-    runner.running = True
+    runner.signal.batch.connect(lambda _: runner.stop())
 
     runner.run()
 
-    # The mock should have been called once
+    # The mock should have been called once with a whole block
     mock_slot.assert_called_once()
+    assert len(mock_slot.call_args[0][0]) == runner.block_size
+
+def test_fleet_runner_run_once():
+    fleet = FleetSimulatorRunner(3, rate=50, seed=7)
+    slots = [MagicMock() for _ in fleet.units]
+    for unit, slot in zip(fleet.units, slots):
+        unit.signal.batch.connect(slot)
+    fleet.units[0].signal.batch.connect(lambda _: fleet.stop())
+
+    fleet.run()
+
+    # every unit emits its block of the same tick, each from its own seed
+    batches = [slot.call_args[0][0] for slot in slots]
+    assert all(slot.call_count == 1 for slot in slots)
+    assert all(len(batch) == fleet.block_size for batch in batches)
+    assert batches[1]["azimuth"][0] == SimulatorRunner(rate=50, seed=8).generate(0, 1)["azimuth"][0]
+    with pytest.raises(ValueError):
+        FleetSimulatorRunner(2, rate=0.5)
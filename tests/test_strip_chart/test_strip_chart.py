@@ -0,0 +1,71 @@
+import numpy as np
+import pytest
+from PySide6.QtGui import QColor
+
+from dmcview.device_parser import SAMPLE_DTYPE
+from dmcview.history import SampleHistory
+from dmcview.strip_chart import BACKGROUND, GRID, STRIP_LANES, StripChart
+
+
+def make_samples(start, count, rate=1000.0):
+    samples = np.zeros(count, dtype=SAMPLE_DTYPE)
+    timestamps = start + np.arange(count) / rate
+    samples["timestamp"] = timestamps
+    samples["azimuth"] = (timestamps * 20) % 360
+    samples["elevation"] = 60 * np.sin(timestamps / 5)
+    samples["bank"] = (180 - timestamps * 30) % 360 - 180
+    samples["x"] = 10 * np.sin(timestamps)  # the traces of a lane do not cross, a pixel of both
+    samples["y"] = -15.0  # would take the color of the last one drawn
+    samples["z"] = np.random.default_rng(int(start * 1000)).normal(16, 1, count)
+    return samples
+
+
+@pytest.fixture
+def chart():
+    history = SampleHistory()
+    history.append(make_samples(1000.0, 20000))
+    widget = StripChart(history, seconds=20.0)
+    widget.resize(400, 200)
+    widget.grab()
+    return widget
+
+
+def test_frames_draw_only_the_new_columns(chart):
+    assert chart.columns_drawn == 400
+
+    start = 1020.0
+    for _ in range(40):  # 1 kHz at 60 frames per second
+        chart.history.append(make_samples(start, 17))
+        start += 0.017
+        chart.advance()
+    incremental = chart.grab().toImage()
+    assert 400 + 13 <= chart.columns_drawn <= 400 + 15  # 0.68 s scrolled at 0.05 s per column
+
+    chart.redraw()
+    assert chart.grab().toImage() == incremental
+    assert chart.columns_drawn == 400
+
+
+def test_circular_lanes_wrap_without_streaks():
+    history = SampleHistory()
+    samples = np.zeros(400, dtype=SAMPLE_DTYPE)
+    samples["timestamp"] = np.arange(400) / 20
+    samples["azimuth"] = (350 + np.arange(400) * 0.5) % 360  # through north at 1 s
+    history.append(samples)
+    chart = StripChart(history, seconds=20.0, lanes=STRIP_LANES[:1])
+    chart.resize(400, 90)
+    image = chart.grab().toImage()
+
+    background = (QColor(BACKGROUND), QColor(GRID))
+    traced = [y for y in range(90) if QColor(image.pixel(20, y)) not in background]  # x = 1 s
+    assert traced and all(y < 3 or y > 86 for y in traced)  # leaving at the top, entering at the bottom
+
+
+def test_going_back_in_time_draws_everything_again(chart):
+    chart.history.append(make_samples(1005.0, 100))  # a replay seek
+    chart.advance()
+    assert chart.columns_drawn == 400
+    assert len(chart.history) == 100
+
+    with pytest.raises(ValueError):
+        StripChart(chart.history, seconds=0)
@@ -0,0 +1,89 @@
+import time
+
+import pytest
+from PySide6.QtCore import QEvent, QObject
+
+from dmcview.telemetry import (
+    Acceleration,
+    Channel,
+    Declination,
+    Orientation,
+    TelemetryBus,
+    default_bus,
+)
+
+pytestmark = pytest.mark.usefixtures("qapp")
+
+
+@pytest.fixture
+def bus():
+    return TelemetryBus()
+
+
+def test_delivered_on_event_loop(bus, qapp):
+    received = []
+    bus.subscribe(Channel.ORIENTATION, received.append)
+
+    bus.publish(Channel.ORIENTATION, Orientation(1.0, 2.0, 3.0))
+    assert received == []  # queued, not called from the publisher
+
+    qapp.processEvents()
+    assert received == [Orientation(1.0, 2.0, 3.0)]
+
+
+def test_latest_value_wins(bus, qapp):
+    received = []
+    bus.subscribe(Channel.ACCELERATION, received.append)
+
+    for x in range(10):
+        bus.publish(Channel.ACCELERATION, Acceleration(float(x), 0.0, 0.0))
+    qapp.processEvents()
+
+    assert received == [Acceleration(9.0, 0.0, 0.0)]
+
+
+def test_channel_type_checked(bus):
+    with pytest.raises(TypeError):
+        bus.publish(Channel.DECLINATION, Acceleration(1.0, 2.0, 3.0))
+
+
+def test_unsubscribe(bus, qapp):
+    received = []
+    subscription = bus.subscribe(Channel.DECLINATION, received.append)
+    bus.publish(Channel.DECLINATION, Declination(10.5))
+    bus.unsubscribe(subscription)
+    qapp.processEvents()
+
+    assert received == []
+    assert bus.subscriber_count(Channel.DECLINATION) == 0
+
+
+def test_rate_limit(bus, qapp):
+    received = []
+    bus.subscribe(Channel.DECLINATION, received.append, max_rate=20)
+
+    bus.publish(Channel.DECLINATION, Declination(1.0))
+    qapp.processEvents()
+    bus.publish(Channel.DECLINATION, Declination(2.0))
+    bus.publish(Channel.DECLINATION, Declination(3.0))
+    qapp.processEvents()
+    assert received == [Declination(1.0)]  # the second delivery waits for the interval
+
+    deadline = time.monotonic() + 1.0
+    while len(received) < 2 and time.monotonic() < deadline:
+        qapp.processEvents()
+    assert received == [Declination(1.0), Declination(3.0)]
+
+
+def test_owner_destroyed_unsubscribes(bus, qapp):
+    owner = QObject()
+    bus.subscribe(Channel.ORIENTATION, lambda value: None, owner=owner)
+    assert bus.subscriber_count(Channel.ORIENTATION) == 1
+
+    owner.deleteLater()
+    qapp.sendPostedEvents(None, QEvent.Type.DeferredDelete)
+    assert bus.subscriber_count(Channel.ORIENTATION) == 0
+
+
+def test_default_bus_is_shared():
+    assert default_bus() is default_bus()
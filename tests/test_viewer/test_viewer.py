@@ -0,0 +1,56 @@
+from unittest.mock import MagicMock
+
+import numpy as np
+import pytest
+
+from dmcview.device_parser import SAMPLE_DTYPE
+from dmcview.telemetry import Channel, Declination, Orientation
+from dmcview.viewer import SampleViewer
+
+
+@pytest.fixture
+def viewer():
+    v = SampleViewer()
+    v.bus = MagicMock()
+    v.compass = MagicMock()
+    v.canvas = MagicMock()
+    return v
+
+
+def test_show_samples_uses_newest(viewer):
+    samples = np.array(
+        [(10, 1, 2, 3, 0, 0, 0, 0.0), (30, 25, 40, 10.5, 10.04, 9.96, 0, 0.1)], dtype=SAMPLE_DTYPE
+    )
+
+    viewer.show_samples(samples)
+
+    viewer.bus.publish.assert_any_call(Channel.ORIENTATION, Orientation(30.0, 25.0, 40.0))
+    viewer.bus.publish.assert_any_call(Channel.DECLINATION, Declination(10.5))
+    viewer.canvas.update_acceleration.assert_called_once_with(10.0, 10.0, 0.0)
+
+
+def test_show_empty_batch(viewer):
+    viewer.show_samples(np.empty(0, dtype=SAMPLE_DTYPE))
+    viewer.bus.publish.assert_not_called()
+
+
+def test_connected_source_counts_the_backlog(qtbot):
+    from PySide6.QtCore import QObject, Signal  # pylint: disable=import-outside-toplevel
+
+    class Source(QObject):
+        samples = Signal(object)
+
+    viewer = SampleViewer(renderer="qpainter")
+    qtbot.addWidget(viewer)
+    frames = []
+    viewer.decimator.frame.connect(frames.append)
+    source = Source()
+    viewer.connect_source(source.samples)
+    source.samples.emit(np.zeros(3, dtype=SAMPLE_DTYPE))
+    source.samples.emit(np.ones(2, dtype=SAMPLE_DTYPE))
+
+    assert viewer.compass.perf.backlog == 5  # waiting for the next frame
+    qtbot.waitUntil(lambda: viewer.compass.perf.backlog == 0)
+    assert [summary.samples for summary in frames] == [5]  # one summary for both batches
+    assert len(viewer.history) == 5
+    assert viewer.canvas.perf is viewer.compass.perf